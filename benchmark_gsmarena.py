@@ -0,0 +1,470 @@
+"""GSMArena monitör/scraper için çevrimdışı benchmark.
+
+Kayıtlı HTML fixture'ları (benchmarks/fixtures) yerel bir HTTP sunucusundan sunulur; Gemini, PHP ve SMTP
+uçları yerel stub'larla değiştirilir. Böylece canlı siteye gitmeden her performans değişikliği bir öncekiyle
+karşılaştırılabilir:
+
+    python benchmark_gsmarena.py --iterations 20 --output bench_results.json
+    python benchmark_gsmarena.py --compare bench_results.json
+    python benchmark_gsmarena.py --browser   # Chrome kuruluysa: kaynak engelleme açık/kapalı sayfa yükü ve RSS
+
+Oturum rotasyonu, istemci kimliği başına hız sınırı uygulayıp 429 dönen bir sunucu ve önüne konan yerel bir
+ileri proxy ile ölçülür (tek oturum vs. doğrudan + proxy'li iki oturum).
+"""
+import argparse
+import contextlib
+import functools
+import http.client
+import http.server
+import io
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'fixtures')
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gsmarena_monitor_and_scrape.py')
+# Değişiklik olmayan çalıştırmada yüklenmemesi gereken modüller
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'smtplib', 'email.mime')
+HOMEPAGE_FIXTURE = 'homepage.html'
+REVIEW_FIXTURE = 'oneplus_13s-review-2845.php'
+
+# === Yerel Sunucular ===
+class FixtureRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """GET: fixture dosyaları. POST: Gemini generateContent ve kaydet.php stub'ları."""
+    gemini_latency = 0.0
+    php_latency = 0.0
+
+    def do_POST(self):
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked': # PHP yükleri akıtılarak gönderilir
+            body = b""
+            while True:
+                chunk_size = int(self.rfile.readline().split(b";")[0], 16)
+                body += self.rfile.read(chunk_size)
+                self.rfile.readline()
+                if chunk_size == 0: break
+        else:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if ':generateContent' in self.path:
+            time.sleep(self.gemini_latency)
+            prompt = json.loads(body)["contents"][0]["parts"][0]["text"]
+            response = {"candidates": [{"content": {"parts": [{"text": f"Benchmark özeti ({len(prompt)} karakter)."}]}}]}
+        else:
+            time.sleep(self.php_latency)
+            response = {"status": "success", "id": 1}
+        payload = json.dumps(response).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+class SmtpSinkHandler(socketserver.StreamRequestHandler):
+    """smtplib'in kullandığı komutlara yetecek kadar SMTP; gelen mesajlar sadece sayılır."""
+    received_messages = 0
+
+    def reply(self, line):
+        self.wfile.write((line + "\r\n").encode('ascii'))
+
+    def handle(self):
+        self.reply("220 localhost benchmark SMTP sink")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.wfile.write(b"250-localhost\r\n250 AUTH PLAIN\r\n")
+            elif command.startswith("AUTH"):
+                self.reply("235 Authentication successful")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline().rstrip(b"\r\n") != b".":
+                    pass
+                SmtpSinkHandler.received_messages += 1
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+class ThrottlingRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Canlı sitenin hız sınırının yerine geçer: aynı istemciden (doğrudan ya da proxy'nin Via başlığı) `min_interval`
+    saniyeden sık gelen istekler 429 + Retry-After alır."""
+    min_interval = 0.2
+    last_seen = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        client = self.headers.get('Via', 'direct')
+        now = time.monotonic()
+        with self.lock:
+            allowed = now - self.last_seen.get(client, float('-inf')) >= self.min_interval
+            if allowed: ThrottlingRequestHandler.last_seen[client] = now
+        payload = b"<html><body>ok</body></html>" if allowed else b"Too Many Requests"
+        self.send_response(200 if allowed else 429)
+        if not allowed: self.send_header('Retry-After', '1')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+class ForwardProxyHandler(http.server.BaseHTTPRequestHandler):
+    """Sadece düz HTTP GET için ileri proxy; istekleri kendi kimliğiyle (Via) hedefe iletir."""
+    def do_GET(self):
+        target = urlsplit(self.path)
+        connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=10)
+        try:
+            headers = {name: value for name, value in self.headers.items() if name.lower() not in ('proxy-connection', 'connection')}
+            connection.request('GET', target.path or '/', headers={**headers, 'Via': f'1.1 benchmark-proxy-{self.server.server_port}'})
+            upstream = connection.getresponse()
+            payload = upstream.read()
+            self.send_response(upstream.status)
+            for name, value in upstream.getheaders():
+                if name.lower() not in ('content-length', 'connection', 'transfer-encoding'): self.send_header(name, value)
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            connection.close()
+
+    def log_message(self, format, *args):
+        pass
+
+def start_servers(gemini_latency, php_latency):
+    FixtureRequestHandler.gemini_latency = gemini_latency
+    FixtureRequestHandler.php_latency = php_latency
+    http_server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(FixtureRequestHandler, directory=FIXTURES_DIR))
+    smtp_server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), SmtpSinkHandler)
+    smtp_server.daemon_threads = True
+    for server in (http_server, smtp_server):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return http_server, smtp_server
+
+def import_scraper(base_url, smtp_port, work_dir):
+    """Script'in konfigürasyonu modül yüklenirken okunduğu için ortam değişkenleri import'tan önce ayarlanır."""
+    os.environ.update({
+        'GEMINI_API_KEY_ENV': 'benchmark-key',
+        'GEMINI_API_BASE_URL_ENV': f'{base_url}/v1beta',
+        'PHP_SAVE_URL_ENV': f'{base_url}/kaydet.php',
+        'PAGE_CACHE_DB_ENV': '', # Önbellek kapalı: her turda gerçek iş ölçülsün
+        'PROFILE_FILE_ENV': '',
+        'OUTBOX_FILE_ENV': os.path.join(work_dir, 'php_outbox.jsonl'),
+        'PHONE_DB_ENV': os.path.join(work_dir, 'gsmarena_phones.sqlite3'),
+        'REVIEW_SPOOL_DIR_ENV': os.path.join(work_dir, 'review_spool'),
+        'GIT_COMMIT_STATE_ENV': '0',
+        'HTTP_MAX_RETRIES_ENV': '0',
+        'SMTP_SERVER_ENV': '127.0.0.1',
+        'SMTP_PORT_ENV': str(smtp_port),
+        'SMTP_USERNAME_ENV': 'benchmark',
+        'SMTP_PASSWORD_ENV': 'benchmark',
+        'SENDER_EMAIL_ENV': 'benchmark@localhost',
+        'RECEIVER_EMAIL_ENV': 'benchmark@localhost',
+    })
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import gsmarena_monitor_and_scrape
+    return gsmarena_monitor_and_scrape
+
+# === Ölçüm Yardımcıları ===
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def summarize_timings(durations):
+    values = sorted(durations)
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(values, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+    }
+
+def time_calls(function, iterations):
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+@contextlib.contextmanager
+def quiet():
+    """Script'in konsol çıktısı ölçümleri kirletmesin."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+# === Benchmark ===
+def measure_no_change_run(homepage_phones, base_url, work_dir, runs):
+    """Değişiklik olmayan tek seferlik çalıştırmayı ayrı süreçte ölçer (yorumlayıcı açılışı dahil).
+
+    Ayrıca -X importtime ile bir kez çalıştırıp HEAVY_MODULES'tan yüklenenleri döner; boş olmalıdır.
+    """
+    data_file = os.path.join(work_dir, 'last_phones_data.json')
+    with open(data_file, 'w', encoding='utf-8') as f:
+        json.dump(homepage_phones, f, ensure_ascii=False)
+    env = dict(os.environ, TARGET_URL_ENV=f"{base_url}/{HOMEPAGE_FIXTURE}", DATA_FILE_ENV=data_file)
+
+    def run_script(*python_flags):
+        completed = subprocess.run([sys.executable, *python_flags, SCRIPT_PATH], cwd=work_dir, env=env, capture_output=True, text=True)
+        if completed.returncode != 0 or "değişiklik yok" not in completed.stdout:
+            raise RuntimeError(f"Değişiklik olmayan çalıştırma beklenmedik şekilde bitti:\n{completed.stdout}{completed.stderr}")
+        return completed
+
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run_script()
+        durations.append(time.perf_counter() - started)
+    import_log = run_script('-X', 'importtime').stderr
+    loaded_modules = {line.rsplit('|', 1)[1].strip() for line in import_log.splitlines() if line.startswith('import time:') and '|' in line}
+    heavy_loaded = sorted(name for name in loaded_modules if any(name == heavy or name.startswith(heavy + '.') for heavy in HEAVY_MODULES))
+    return durations, heavy_loaded
+
+def measure_browser_policy(scraper, base_url, iterations):
+    """Fixture sayfalarını gerçek Chrome ile yükler; kaynak engelleme kapalı/açık için sayfa yükü süreleri ve
+    sonrasında ölçülen Chrome RSS'i (MB) döner. Chrome başlatılamazsa None."""
+    page_urls = [f"{base_url}/{name}" for name in sorted(os.listdir(FIXTURES_DIR)) if name.endswith('.php')]
+    measurements = {}
+    original_policy = scraper.BROWSER_BLOCK_RESOURCES
+    try:
+        for policy_name, block in (("all", False), ("blocked", True)):
+            scraper.BROWSER_BLOCK_RESOURCES = block
+            durations, rss_samples = [], []
+            with scraper.WebDriverPool(size=1, max_pages=10 ** 6) as pool:
+                try:
+                    driver = pool.acquire()
+                except Exception as e:
+                    print(f"Uyarı: Chrome başlatılamadı, tarayıcı ölçümü atlanıyor. {e}")
+                    return None
+                try:
+                    for _ in range(iterations):
+                        for page_url in page_urls:
+                            started = time.perf_counter()
+                            driver.get(page_url)
+                            scraper.WebDriverWait(driver, 30).until(lambda d: d.execute_script("return document.readyState") == "complete")
+                            durations.append(time.perf_counter() - started)
+                        rss = scraper.chrome_rss_mb(driver)
+                        if rss is not None: rss_samples.append(rss)
+                finally:
+                    pool.release(driver)
+            measurements[policy_name] = {"page_load": durations, "rss_mb": round(max(rss_samples), 1) if rss_samples else None}
+    finally:
+        scraper.BROWSER_BLOCK_RESOURCES = original_policy
+    return measurements
+
+def measure_session_rotation(scraper, requests_count):
+    """Hız sınırlı stand-in sunucuya art arda istek atar: tek oturumla ve doğrudan + proxy'li iki oturumla.
+    Her biri için istek süreleri ile oturum başına başarı/kısıtlanma sayıları döner."""
+    servers = [http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler) for handler in (ThrottlingRequestHandler, ForwardProxyHandler)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    throttling_server, proxy_server = servers
+    target_host = f"127.0.0.1:{throttling_server.server_port}"
+    measurements = {}
+    try:
+        for scenario, proxies in (("single", ["direct"]), ("rotating", ["direct", f"http://127.0.0.1:{proxy_server.server_port}"])):
+            ThrottlingRequestHandler.last_seen = {}
+            session_pool = scraper.SessionPool(size=1, proxies=proxies, hosts={target_host}, cooldown_base=0.5, cooldown_max=2.0)
+            client = scraper.HttpClient(host_settings={}, max_retries=5, session_pool=session_pool)
+            durations, failures = [], 0
+            for _ in range(requests_count):
+                started = time.perf_counter()
+                response = client.get(f"http://{target_host}/")
+                durations.append(time.perf_counter() - started)
+                failures += 0 if response.status_code == 200 else 1
+            measurements[scenario] = {
+                "durations": durations, "failures": failures,
+                "sessions": {session.label: {"ok": session.successes, "throttled": session.throttled} for session in session_pool.sessions},
+            }
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+    return measurements
+
+def run_benchmark(scraper, base_url, iterations, workers, work_dir, browser=False):
+    results = {"iterations": iterations, "workers": workers, "components": {}}
+    with open(os.path.join(FIXTURES_DIR, HOMEPAGE_FIXTURE), encoding='utf-8') as f:
+        homepage_html = f.read()
+
+    with quiet():
+        homepage_phones = scraper.parse_latest_phones_from_main_page(homepage_html, scraper.LIMIT_PHONES)
+    startup_durations, heavy_loaded = measure_no_change_run(homepage_phones, base_url, work_dir, min(iterations, 5))
+    results["components"]["no_change_run"] = summarize_timings(startup_durations)
+    results["heavy_modules_on_no_change"] = heavy_loaded
+
+    with quiet():
+        results["components"]["homepage_parse"] = summarize_timings(
+            time_calls(lambda: scraper.parse_latest_phones_from_main_page(homepage_html, scraper.LIMIT_PHONES), iterations))
+        # Her kurulu arka uç ayrı ölçülür; sonuç eski bs4 yoluyla aynı olmalı
+        reference_phones = scraper.parse_latest_phones_from_main_page(homepage_html, scraper.LIMIT_PHONES, "bs4")
+        results["homepage_parser"] = scraper.resolve_homepage_parser()
+        results["homepage_parser_mismatches"] = []
+        results["homepage_parsers_skipped"] = []
+        for backend in scraper.HOMEPAGE_PARSER_BACKENDS:
+            if not scraper.homepage_parser_available(backend):
+                results["homepage_parsers_skipped"].append(backend)
+                continue
+            if scraper.parse_latest_phones_from_main_page(homepage_html, scraper.LIMIT_PHONES, backend) != reference_phones:
+                results["homepage_parser_mismatches"].append(backend)
+            results["components"][f"homepage_parse_{backend}"] = summarize_timings(
+                time_calls(lambda: scraper.parse_latest_phones_from_main_page(homepage_html, scraper.LIMIT_PHONES, backend), iterations))
+        phones = scraper.parse_latest_phones_from_main_page(homepage_html, scraper.LIMIT_PHONES)
+        phones = [{"name": phone["name"], "link": phone["link"].replace(scraper.TARGET_URL, base_url + '/')} for phone in phones]
+
+        spec_pages = {}
+        for phone in phones:
+            with open(os.path.join(FIXTURES_DIR, phone["link"].rsplit('/', 1)[1]), encoding='utf-8') as f:
+                spec_pages[phone["link"]] = f.read()
+        extract_durations = []
+        for page_url, page_html in spec_pages.items():
+            extract_durations += time_calls(lambda: scraper.extract_specs_from_html_static(page_html, scraper.phone_specs_definitions, page_url), iterations)
+        results["components"]["spec_extract"] = summarize_timings(extract_durations)
+
+        review_url = f"{base_url}/{REVIEW_FIXTURE}"
+        results["components"]["review_assembly"] = summarize_timings(time_calls(lambda: scraper.discard_review_files(scraper.fetch_review_text_static(review_url)), iterations))
+
+        sample_url = phones[0]["link"]
+        sample_specs, _ = scraper.extract_specs_from_html_static(spec_pages[sample_url], scraper.phone_specs_definitions, sample_url)
+        sample_record = scraper.PhoneRecord(sample_url, phones[0]["name"], sample_specs, "Review Yok", "-", "-")
+        results["components"]["payload_build"] = summarize_timings(time_calls(
+            lambda: json.dumps(scraper.build_php_payload(sample_record, scraper.phone_specs_definitions), ensure_ascii=False), iterations))
+        # Outbox'a yazılan konumsal kayıt ile PHP sınırında üretilen etiketli yükün boyutu
+        results["components"]["record_encode"] = summarize_timings(time_calls(
+            lambda: json.dumps(sample_record.to_compact(), ensure_ascii=False), iterations))
+        stored_specs = scraper.encode_specs(sample_specs)
+        results["record_bytes"] = {
+            "php_payload": len(json.dumps(scraper.build_php_payload(sample_record, scraper.phone_specs_definitions), ensure_ascii=False).encode('utf-8')),
+            "outbox_record": len(json.dumps(sample_record.to_compact(), ensure_ascii=False).encode('utf-8')),
+            "stored_specs": len(stored_specs if isinstance(stored_specs, bytes) else stored_specs.encode('utf-8')),
+        }
+
+        # Uçtan uca: ana sayfadaki telefonların tamamı, gerçek işleme fonksiyonu ve stub uçlarla
+        def process_timed(phone):
+            started = time.perf_counter()
+            success, message = scraper.process_single_phone_with_selenium(
+                phone["link"], phone["name"], scraper.phone_specs_definitions, scraper.GEMINI_API_KEY, scraper.PHP_SAVE_URL)
+            return time.perf_counter() - started, success
+
+        phone_durations, failures = [], 0
+        wall_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for _ in range(iterations):
+                for duration, success in executor.map(process_timed, phones):
+                    phone_durations.append(duration)
+                    failures += 0 if success else 1
+                scraper.send_email_notification(scraper.EMAIL_SUBJECT_PREFIX + "Benchmark", "Benchmark e-postası")
+        wall_seconds = time.perf_counter() - wall_started
+
+    # Özet e-postası: olaylar biriktirilip tek mesajda, açık SMTP oturumu üzerinden gönderilir
+    def send_digest():
+        digest = scraper.NotificationDigest()
+        for phone in phones:
+            digest.add("new_phone", phone["name"], phone["link"], ["İşlem Durumu: Siteye eklendi."])
+        digest.add("list_update", "Ana sayfa listesi", details=[phone["name"] for phone in phones])
+        digest.flush(force=True)
+    with quiet():
+        results["components"]["digest_email"] = summarize_timings(time_calls(send_digest, iterations))
+    results["components"]["smtp"] = summarize_timings([event["duration"] for event in scraper.PROFILER.events("smtp")])
+    results["per_phone"] = summarize_timings(phone_durations)
+    results["phones_per_minute"] = round(len(phone_durations) / wall_seconds * 60, 1) if wall_seconds else 0.0
+    results["failures"] = failures
+    results["emails_received"] = SmtpSinkHandler.received_messages
+
+    with quiet():
+        rotation_results = measure_session_rotation(scraper, min(iterations, 10))
+    for scenario, measured in rotation_results.items():
+        results["components"][f"session_{scenario}"] = summarize_timings(measured["durations"])
+    results["session_rotation"] = {scenario: {"failures": measured["failures"], "sessions": measured["sessions"]} for scenario, measured in rotation_results.items()}
+
+    if browser:
+        browser_results = measure_browser_policy(scraper, base_url, min(iterations, 5))
+        if browser_results:
+            for policy_name, measured in browser_results.items():
+                results["components"][f"browser_load_{policy_name}"] = summarize_timings(measured["page_load"])
+            results["chrome_rss_mb"] = {policy_name: measured["rss_mb"] for policy_name, measured in browser_results.items()}
+    return results
+
+def print_results(results, baseline=None):
+    def delta(path, key):
+        if not baseline: return ""
+        previous = baseline
+        for part in path: previous = previous.get(part, {}) if isinstance(previous, dict) else {}
+        previous_value = previous.get(key) if isinstance(previous, dict) else None
+        current = results
+        for part in path: current = current[part]
+        if not previous_value: return ""
+        return f" ({(current[key] - previous_value) / previous_value * 100:+.1f}%)"
+
+    print(f"\n--- Benchmark ({results['iterations']} tur, {results['workers']} işçi) ---")
+    print(f"{'Bileşen':<26}{'Adet':>7}{'Ort. ms':>12}{'p50 ms':>12}{'p90 ms':>12}{'p99 ms':>12}")
+    for name, stats in results["components"].items():
+        print(f"{name:<26}{stats['count']:>7}{stats['mean_ms']:>12.3f}{stats['p50_ms']:>12.3f}{stats['p90_ms']:>12.3f}{stats['p99_ms']:>12.3f}{delta(('components', name), 'p50_ms')}")
+    per_phone = results["per_phone"]
+    print(f"Telefon başına gecikme: p50 {per_phone['p50_ms']:.1f} ms{delta(('per_phone',), 'p50_ms')}, "
+          f"p90 {per_phone['p90_ms']:.1f} ms, p99 {per_phone['p99_ms']:.1f} ms")
+    print(f"Verim: {results['phones_per_minute']} telefon/dk{delta((), 'phones_per_minute')} | hatalı: {results['failures']} | e-posta: {results['emails_received']}")
+    print(f"Ana sayfa ayrıştırıcısı: {results.get('homepage_parser', '-')}")
+    if results.get("homepage_parsers_skipped"):
+        print(f"Kurulu olmadığı için ölçülmeyen ayrıştırıcılar: {', '.join(results['homepage_parsers_skipped'])}")
+    if results.get("homepage_parser_mismatches"):
+        print(f"UYARI: Şu ayrıştırıcılar bs4 ile farklı sonuç verdi: {', '.join(results['homepage_parser_mismatches'])}")
+    for scenario, measured in results.get("session_rotation", {}).items():
+        sessions = ", ".join(f"{label} {counts['ok']} başarılı/{counts['throttled']} 429" for label, counts in measured["sessions"].items())
+        print(f"Oturum rotasyonu ({scenario}): {sessions} | başarısız istek: {measured['failures']}")
+    if results.get("record_bytes"):
+        record_bytes = results["record_bytes"]
+        print(f"Kayıt boyutu: PHP yükü {record_bytes['php_payload']} B, outbox kaydı {record_bytes['outbox_record']} B, SQLite spec'leri {record_bytes['stored_specs']} B")
+    if results.get("chrome_rss_mb"):
+        print(f"Chrome RSS: engelleme kapalı {results['chrome_rss_mb']['all']} MB, açık {results['chrome_rss_mb']['blocked']} MB")
+    heavy_loaded = results.get("heavy_modules_on_no_change")
+    if heavy_loaded:
+        print(f"UYARI: Değişiklik olmayan çalıştırmada ağır modüller yüklendi: {', '.join(heavy_loaded)}")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="GSMArena scraper çevrimdışı benchmark")
+    arg_parser.add_argument('--iterations', type=int, default=20)
+    arg_parser.add_argument('--workers', type=int, default=1, help="Uçtan uca ölçümde aynı anda işlenecek telefon sayısı")
+    arg_parser.add_argument('--gemini-latency', type=float, default=0.0, help="Gemini stub'ının yapay gecikmesi (sn)")
+    arg_parser.add_argument('--php-latency', type=float, default=0.0, help="PHP stub'ının yapay gecikmesi (sn)")
+    arg_parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    arg_parser.add_argument('--compare', help="Karşılaştırılacak önceki sonuç dosyası")
+    arg_parser.add_argument('--browser', action='store_true', help="Chrome ile kaynak engelleme açık/kapalı ölçümü de yap")
+    cli_args = arg_parser.parse_args()
+
+    http_server, smtp_server = start_servers(cli_args.gemini_latency, cli_args.php_latency)
+    base_url = f"http://127.0.0.1:{http_server.server_port}"
+    with tempfile.TemporaryDirectory() as work_dir:
+        scraper = import_scraper(base_url, smtp_server.server_address[1], work_dir)
+        if scraper.lxml_html is None:
+            print("Hata: Benchmark statik çıkarım yolunu ölçer; lxml ve cssselect gerekli.")
+            sys.exit(1)
+        benchmark_results = run_benchmark(scraper, base_url, cli_args.iterations, cli_args.workers, work_dir, cli_args.browser)
+
+    baseline_results = None
+    if cli_args.compare:
+        with open(cli_args.compare, encoding='utf-8') as f:
+            baseline_results = json.load(f)
+    print_results(benchmark_results, baseline_results)
+    if cli_args.output:
+        with open(cli_args.output, 'w', encoding='utf-8') as f:
+            json.dump(benchmark_results, f, indent=2, ensure_ascii=False)
+        print(f"Sonuçlar '{cli_args.output}' dosyasına yazıldı.")
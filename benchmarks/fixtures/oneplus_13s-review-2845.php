@@ -0,0 +1,40 @@
+<!DOCTYPE html><html><head><meta charset="utf-8"><title>OnePlus 13s review - page 1</title></head><body>
+<div class="review-header"><h1 class="article-info-name">OnePlus 13s review</h1></div>
+<div id="review-body" class="article-body">
+<h3>Section 1</h3>
+<p>Page 1 paragraph one. The <b>OnePlus 13s</b> is a compact flagship with a Snapdragon 8 Elite chipset.</p>
+<p>   </p>
+<p>Page 1 paragraph two: battery life of the 5,850mAh cell is excellent,<br>and charging at 80W is quick.</p>
+<p>Paragraph 0: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 1: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 2: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 3: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 4: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 5: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 6: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 7: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 8: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 9: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 10: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 11: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 12: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 13: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 14: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 15: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 16: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 17: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 18: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 19: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 20: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 21: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 22: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 23: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<p>Paragraph 24: the display is bright and the camera keeps up in low light, while the Snapdragon 8 Elite stays cool under sustained load. Battery endurance beats most compact rivals in our tests.</p>
+<div class="article-blurb"><p>Page 1 blurb paragraph about the camera.</p></div>
+</div>
+<div class="article-pages col">
+<a class="pages-prev disabled" href="#">Prev</a>
+<select id="article-pages-select"><option value="oneplus_13s-review-2845.php">Introduction</option><option value="oneplus_13s-review-2845p2.php">Display, battery</option><option value="oneplus_13s-review-2845p3.php">Camera, verdict</option></select>
+<a class="pages-next" href="oneplus_13s-review-2845p2.php">Next</a>
+</div>
+</body></html>
@@ -0,0 +1,212 @@
+<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>OnePlus Pad 3 - Full phone specifications</title>
+<script src="https://ads.example.net/ad.js"></script></head>
+<body>
+<div id="body">
+<div class="article-info">
+<div class="article-info-line page-specs light border-bottom">
+<h1 class="specs-phone-name-title" data-spec="modelname">OnePlus Pad 3</h1>
+</div>
+<div class="center-stage light nobg specs-accent">
+<div class="specs-photo-main"><a href="oneplus_13s_5g-pictures-13818.php"><img alt="OnePlus Pad 3 MORE PICTURES" src="https://fdn2.gsmarena.com/vv/bigpic/oneplus-13s.jpg"></a></div>
+<ul class="specs-spotlight-features">
+<li><span data-spec="released-hl">Released 2025, June 12</span></li>
+</ul>
+</div>
+<div class="article-info-meta">
+<ul class="article-info-meta">
+<li class="article-info-meta-link light"><a href="oneplus_13s_5g-reviews-13818.php">Opinions</a></li>
+</ul>
+</div>
+</div>
+<div id="specs-list">
+<table cellspacing="0">
+<tr class="tr-hover">
+<th rowspan="15" scope="row">Network</th>
+<td class="ttl"><a href="network-bands.php3">Technology</a></td>
+<td class="nfo"><a href="#" class="link-network-detail collapse" data-spec="nettech">GSM / CDMA / HSPA / LTE / 5G</a></td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="2" scope="row">Launch</th>
+<td class="ttl"><a href="glossary.php3?term=phone-life-cycle">Announced</a></td>
+<td class="nfo" data-spec="year">2025, June 05</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=phone-life-cycle">Status</a></td>
+<td class="nfo" data-spec="status">Available. Released 2025, June 12</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="6" scope="row">Body</th>
+<td class="ttl"><a href="#" onclick="helpW('h_dimens.htm');">Dimensions</a></td>
+<td class="nfo" data-spec="dimensions">150.8 x 71.7 x 8.2 mm (5.94 x 2.82 x 0.32 in)</td>
+</tr><tr>
+<td class="ttl"><a href="#" onclick="helpW('h_weight.htm');">Weight</a></td>
+<td class="nfo" data-spec="weight">185 g (6.53 oz)</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=build">Build</a></td>
+<td class="nfo" data-spec="build">Glass front (Gorilla Glass 7i), aluminum frame, glass back</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=sim">SIM</a></td>
+<td class="nfo" data-spec="sim">Nano-SIM + eSIM + eSIM (max 2 at a time)<br>
+Nano-SIM + Nano-SIM</td>
+</tr>
+<tr><td class="ttl">&nbsp;</td><td class="nfo" data-spec="bodyother">IP65 dust resistant and water resistant (high pressure water jets)<br>
+Plus Key &amp; shortcut button</td></tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="5" scope="row">Display</th>
+<td class="ttl"><a href="glossary.php3?term=display-type">Type</a></td>
+<td class="nfo" data-spec="displaytype">LTPO AMOLED, 1B colors, 120Hz, HDR10+, Dolby Vision, 1600 nits (HBM)</td>
+</tr>
+<tr>
+<td class="ttl"><a href="#" onclick="helpW('h_dsize.htm');">Size</a></td>
+<td class="nfo" data-spec="displaysize">6.32 inches, 97.6 cm<sup>2</sup> (~90.3% screen-to-body ratio)</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=resolution">Resolution</a></td>
+<td class="nfo" data-spec="displayresolution">1216 x 2640 pixels (~460 ppi density)</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=screen-protection">Protection</a></td>
+<td class="nfo" data-spec="displayprotection">Corning Gorilla Glass 7i</td>
+</tr>
+<tr><td class="ttl">&nbsp;</td><td class="nfo" data-spec="displayother">Ultra HDR image support<br>
+Always-on display</td></tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="4" scope="row">Platform</th>
+<td class="ttl"><a href="glossary.php3?term=os">OS</a></td>
+<td class="nfo" data-spec="os">Android 15, up to 4 major Android upgrades, OxygenOS 15</td>
+</tr>
+<tr><td class="ttl"><a href="glossary.php3?term=chipset">Chipset</a></td>
+<td class="nfo" data-spec="chipset">Qualcomm SM8750-AB Snapdragon 8 Elite (3 nm)</td>
+</tr>
+<tr><td class="ttl"><a href="glossary.php3?term=cpu">CPU</a></td>
+<td class="nfo" data-spec="cpu">Octa-core (2x4.32 GHz Oryon V2 Phoenix L + 6x3.53 GHz Oryon V2 Phoenix M)</td>
+</tr>
+<tr><td class="ttl"><a href="glossary.php3?term=gpu">GPU</a></td>
+<td class="nfo" data-spec="gpu">Adreno 830</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="2" scope="row">Memory</th>
+<td class="ttl"><a href="glossary.php3?term=memory-card-slot">Card slot</a></td>
+<td class="nfo" data-spec="memoryslot">No</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=dynamic-memory">Internal</a></td>
+<td class="nfo" data-spec="internalmemory">256GB 12GB RAM, 512GB 12GB RAM<br>UFS 4.0</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="3" scope="row">Main Camera</th>
+<td class="ttl"><a href="glossary.php3?term=camera">Dual</a></td>
+<td class="nfo" data-spec="cam1modules">50 MP, f/1.8, 24mm (wide), 1/1.56", 1.0µm, multidirectional PDAF, OIS<br>
+50 MP, f/2.0, 51mm (telephoto), 1/2.75", 0.64µm, PDAF, 2x optical zoom</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=camera">Features</a></td>
+<td class="nfo" data-spec="cam1features">Color spectrum sensor, LED flash, HDR, panorama</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=camera">Video</a></td>
+<td class="nfo" data-spec="cam1video">4K@30/60fps, 1080p@30/60/240fps,<br>gyro-EIS, OIS</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="3" scope="row">Selfie camera</th>
+<td class="ttl"><a href="glossary.php3?term=secondary-camera">Single</a></td>
+<td class="nfo" data-spec="cam2modules">32 MP, f/2.0, 21mm (wide), 1/2.74", 0.8µm, AF</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=secondary-camera">Features</a></td>
+<td class="nfo" data-spec="cam2features">HDR, panorama</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=secondary-camera">Video</a></td>
+<td class="nfo" data-spec="cam2video">4K@30/60fps, 1080p@30/60fps, gyro-EIS</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="2" scope="row">Sound</th>
+<td class="ttl"><a href="glossary.php3?term=loudspeaker">Loudspeaker</a> </td>
+<td class="nfo">Yes, with stereo speakers</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=audio-jack">3.5mm jack</a> </td>
+<td class="nfo">No</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="6" scope="row">Comms</th>
+<td class="ttl"><a href="glossary.php3?term=wi-fi">WLAN</a></td>
+<td class="nfo" data-spec="wlan">Wi-Fi 802.11 a/b/g/n/ac/6e/7, tri-band</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=bluetooth">Bluetooth</a></td>
+<td class="nfo" data-spec="bluetooth">6.0, A2DP, LE, aptX HD, LHDC 5</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=gps">Positioning</a></td>
+<td class="nfo" data-spec="gps">GPS (L1+L5), BDS (B1I+B1c+B2a),<br>GALILEO (E1+E5a), QZSS (L1+L5), NavIC (L5)</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=nfc">NFC</a></td>
+<td class="nfo" data-spec="nfc">Yes</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=infrared">Infrared port</a></td>
+<td class="nfo" data-spec="ir">Yes</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=usb">USB</a></td>
+<td class="nfo" data-spec="usb">USB Type-C 3.2, OTG</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="2" scope="row">Features</th>
+<td class="ttl"><a href="glossary.php3?term=sensors">Sensors</a></td>
+<td class="nfo" data-spec="sensors">Fingerprint (under display, ultrasonic), accelerometer, gyro, proximity, compass<br>Color spectrum sensor</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="2" scope="row">Battery</th>
+<td class="ttl"><a href="glossary.php3?term=rechargeable-battery-types">Type</a></td>
+<td class="nfo" data-spec="batdescription1">Si/C Li-Ion 5850 mAh</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=battery-charging">Charging</a></td>
+<td class="nfo">80W wired, PD, 50% in 15 min<br>
+Reverse wired</td>
+</tr>
+</table>
+<table cellspacing="0">
+<tr>
+<th rowspan="2" scope="row">Misc</th>
+<td class="ttl"><a href="glossary.php3?term=build">Colors</a></td>
+<td class="nfo" data-spec="colors">Black Velvet, Pink Satin, Green Silk</td>
+</tr>
+<tr>
+<td class="ttl"><a href="glossary.php3?term=price">Price</a></td>
+<td class="nfo" data-spec="price"><a href="oneplus_13s_5g-price-13818.php">&#8377;&thinsp;54,999</a></td>
+</tr>
+</table>
+</div>
+</div>
+<aside class="sidebar"><div class="module module-rankings"><h4 class="section-heading">Related devices 0</h4><ul><li><a href="related_0_0-100.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r00.jpg"><strong><span>Related phone 0-0</span></strong></a></li><li><a href="related_0_1-101.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r01.jpg"><strong><span>Related phone 0-1</span></strong></a></li><li><a href="related_0_2-102.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r02.jpg"><strong><span>Related phone 0-2</span></strong></a></li><li><a href="related_0_3-103.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r03.jpg"><strong><span>Related phone 0-3</span></strong></a></li><li><a href="related_0_4-104.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r04.jpg"><strong><span>Related phone 0-4</span></strong></a></li><li><a href="related_0_5-105.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r05.jpg"><strong><span>Related phone 0-5</span></strong></a></li><li><a href="related_0_6-106.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r06.jpg"><strong><span>Related phone 0-6</span></strong></a></li><li><a href="related_0_7-107.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r07.jpg"><strong><span>Related phone 0-7</span></strong></a></li><li><a href="related_0_8-108.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r08.jpg"><strong><span>Related phone 0-8</span></strong></a></li><li><a href="related_0_9-109.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r09.jpg"><strong><span>Related phone 0-9</span></strong></a></li><li><a href="related_0_10-1010.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r010.jpg"><strong><span>Related phone 0-10</span></strong></a></li><li><a href="related_0_11-1011.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r011.jpg"><strong><span>Related phone 0-11</span></strong></a></li></ul></div><div class="module module-rankings"><h4 class="section-heading">Related devices 1</h4><ul><li><a href="related_1_0-110.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r10.jpg"><strong><span>Related phone 1-0</span></strong></a></li><li><a href="related_1_1-111.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r11.jpg"><strong><span>Related phone 1-1</span></strong></a></li><li><a href="related_1_2-112.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r12.jpg"><strong><span>Related phone 1-2</span></strong></a></li><li><a href="related_1_3-113.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r13.jpg"><strong><span>Related phone 1-3</span></strong></a></li><li><a href="related_1_4-114.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r14.jpg"><strong><span>Related phone 1-4</span></strong></a></li><li><a href="related_1_5-115.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r15.jpg"><strong><span>Related phone 1-5</span></strong></a></li><li><a href="related_1_6-116.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r16.jpg"><strong><span>Related phone 1-6</span></strong></a></li><li><a href="related_1_7-117.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r17.jpg"><strong><span>Related phone 1-7</span></strong></a></li><li><a href="related_1_8-118.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r18.jpg"><strong><span>Related phone 1-8</span></strong></a></li><li><a href="related_1_9-119.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r19.jpg"><strong><span>Related phone 1-9</span></strong></a></li><li><a href="related_1_10-1110.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r110.jpg"><strong><span>Related phone 1-10</span></strong></a></li><li><a href="related_1_11-1111.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r111.jpg"><strong><span>Related phone 1-11</span></strong></a></li></ul></div><div class="module module-rankings"><h4 class="section-heading">Related devices 2</h4><ul><li><a href="related_2_0-120.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r20.jpg"><strong><span>Related phone 2-0</span></strong></a></li><li><a href="related_2_1-121.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r21.jpg"><strong><span>Related phone 2-1</span></strong></a></li><li><a href="related_2_2-122.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r22.jpg"><strong><span>Related phone 2-2</span></strong></a></li><li><a href="related_2_3-123.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r23.jpg"><strong><span>Related phone 2-3</span></strong></a></li><li><a href="related_2_4-124.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r24.jpg"><strong><span>Related phone 2-4</span></strong></a></li><li><a href="related_2_5-125.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r25.jpg"><strong><span>Related phone 2-5</span></strong></a></li><li><a href="related_2_6-126.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r26.jpg"><strong><span>Related phone 2-6</span></strong></a></li><li><a href="related_2_7-127.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r27.jpg"><strong><span>Related phone 2-7</span></strong></a></li><li><a href="related_2_8-128.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r28.jpg"><strong><span>Related phone 2-8</span></strong></a></li><li><a href="related_2_9-129.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r29.jpg"><strong><span>Related phone 2-9</span></strong></a></li><li><a href="related_2_10-1210.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r210.jpg"><strong><span>Related phone 2-10</span></strong></a></li><li><a href="related_2_11-1211.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r211.jpg"><strong><span>Related phone 2-11</span></strong></a></li></ul></div><div class="module module-rankings"><h4 class="section-heading">Related devices 3</h4><ul><li><a href="related_3_0-130.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r30.jpg"><strong><span>Related phone 3-0</span></strong></a></li><li><a href="related_3_1-131.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r31.jpg"><strong><span>Related phone 3-1</span></strong></a></li><li><a href="related_3_2-132.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r32.jpg"><strong><span>Related phone 3-2</span></strong></a></li><li><a href="related_3_3-133.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r33.jpg"><strong><span>Related phone 3-3</span></strong></a></li><li><a href="related_3_4-134.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r34.jpg"><strong><span>Related phone 3-4</span></strong></a></li><li><a href="related_3_5-135.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r35.jpg"><strong><span>Related phone 3-5</span></strong></a></li><li><a href="related_3_6-136.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r36.jpg"><strong><span>Related phone 3-6</span></strong></a></li><li><a href="related_3_7-137.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r37.jpg"><strong><span>Related phone 3-7</span></strong></a></li><li><a href="related_3_8-138.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r38.jpg"><strong><span>Related phone 3-8</span></strong></a></li><li><a href="related_3_9-139.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r39.jpg"><strong><span>Related phone 3-9</span></strong></a></li><li><a href="related_3_10-1310.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r310.jpg"><strong><span>Related phone 3-10</span></strong></a></li><li><a href="related_3_11-1311.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r311.jpg"><strong><span>Related phone 3-11</span></strong></a></li></ul></div><div class="module module-rankings"><h4 class="section-heading">Related devices 4</h4><ul><li><a href="related_4_0-140.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r40.jpg"><strong><span>Related phone 4-0</span></strong></a></li><li><a href="related_4_1-141.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r41.jpg"><strong><span>Related phone 4-1</span></strong></a></li><li><a href="related_4_2-142.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r42.jpg"><strong><span>Related phone 4-2</span></strong></a></li><li><a href="related_4_3-143.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r43.jpg"><strong><span>Related phone 4-3</span></strong></a></li><li><a href="related_4_4-144.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r44.jpg"><strong><span>Related phone 4-4</span></strong></a></li><li><a href="related_4_5-145.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r45.jpg"><strong><span>Related phone 4-5</span></strong></a></li><li><a href="related_4_6-146.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r46.jpg"><strong><span>Related phone 4-6</span></strong></a></li><li><a href="related_4_7-147.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r47.jpg"><strong><span>Related phone 4-7</span></strong></a></li><li><a href="related_4_8-148.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r48.jpg"><strong><span>Related phone 4-8</span></strong></a></li><li><a href="related_4_9-149.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r49.jpg"><strong><span>Related phone 4-9</span></strong></a></li><li><a href="related_4_10-1410.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r410.jpg"><strong><span>Related phone 4-10</span></strong></a></li><li><a href="related_4_11-1411.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r411.jpg"><strong><span>Related phone 4-11</span></strong></a></li></ul></div><div class="module module-rankings"><h4 class="section-heading">Related devices 5</h4><ul><li><a href="related_5_0-150.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r50.jpg"><strong><span>Related phone 5-0</span></strong></a></li><li><a href="related_5_1-151.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r51.jpg"><strong><span>Related phone 5-1</span></strong></a></li><li><a href="related_5_2-152.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r52.jpg"><strong><span>Related phone 5-2</span></strong></a></li><li><a href="related_5_3-153.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r53.jpg"><strong><span>Related phone 5-3</span></strong></a></li><li><a href="related_5_4-154.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r54.jpg"><strong><span>Related phone 5-4</span></strong></a></li><li><a href="related_5_5-155.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r55.jpg"><strong><span>Related phone 5-5</span></strong></a></li><li><a href="related_5_6-156.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r56.jpg"><strong><span>Related phone 5-6</span></strong></a></li><li><a href="related_5_7-157.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r57.jpg"><strong><span>Related phone 5-7</span></strong></a></li><li><a href="related_5_8-158.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r58.jpg"><strong><span>Related phone 5-8</span></strong></a></li><li><a href="related_5_9-159.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r59.jpg"><strong><span>Related phone 5-9</span></strong></a></li><li><a href="related_5_10-1510.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r510.jpg"><strong><span>Related phone 5-10</span></strong></a></li><li><a href="related_5_11-1511.php"><img src="https://fdn2.gsmarena.com/vv/bigpic/r511.jpg"><strong><span>Related phone 5-11</span></strong></a></li></ul></div></aside>
+</body></html>
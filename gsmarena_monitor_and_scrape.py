@@ -1,29 +1,61 @@
 import time
+_IMPORT_STARTED = time.perf_counter() # Başlangıç süresi ölçümü (profilde 'startup' aşaması)
 import re
+import argparse
+import atexit
+import csv
+import gzip
 import os
 import json
+import hashlib
+import sqlite3
+import random
+import signal
+import socket
+import tempfile
+import threading
+from collections import deque
 import requests
-import smtplib
-from email.mime.text import MIMEText
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from html import escape as html_escape
+from urllib.parse import urljoin, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+# Selenium/webdriver_manager, bs4, smtplib ve email ağır ya da nadiren gereken modüllerdir; değişiklik olmayan
+# çalıştırmada hiç yüklenmezler. Selenium isimleri _load_selenium() ile ilk tarayıcı açılırken doldurulur.
+webdriver = Service = By = WebDriverWait = EC = Options = ChromeDriverManager = None
+TimeoutException = NoSuchElementException = ElementClickInterceptedException = None
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    from lxml.cssselect import CSSSelector
+except ImportError: # lxml/cssselect yoksa statik çıkarım devre dışı kalır, her şey Selenium ile yapılır
+    lxml_etree = None
+    lxml_html = None
+    CSSSelector = None
 
 # --- GSMArena Kontrol Scripti Konfigürasyonu ---
-TARGET_URL = 'https://www.gsmarena.com/'
-DATA_FILE_NAME = 'last_phones_data.json'
+TARGET_URL = os.environ.get('TARGET_URL_ENV', 'https://www.gsmarena.com/')
+DATA_FILE_NAME = os.environ.get('DATA_FILE_ENV', 'last_phones_data.json')
 LIMIT_PHONES = 5 # Kontrol edilecek son telefon sayısı (önceki script'ten)
+HOMEPAGE_PARSER = os.environ.get('HOMEPAGE_PARSER_ENV', 'auto') # auto | selectolax | lxml | bs4
 
 # --- Selenium Scripti Konfigürasyonu (Secrets'tan alınacak) ---
 PHP_SAVE_URL = os.environ.get('PHP_SAVE_URL_ENV', 'https://egeaytac.com.tr/kaydet.php') # Varsayılan, secret ile override edilebilir
+PHP_BATCH_SAVE_URL = os.environ.get('PHP_BATCH_SAVE_URL_ENV') # Toplu kayıt endpoint'i; yoksa kayıtlar PHP_SAVE_URL'e tek tek gönderilir
+PHP_BATCH_SIZE = int(os.environ.get('PHP_BATCH_SIZE_ENV', '10'))
+PHP_PARTIAL_SAVE_URL = os.environ.get('PHP_PARTIAL_SAVE_URL_ENV') # --recheck kısmi güncelleme endpoint'i; yoksa değişiklikler sadece DB'ye ve e-postaya gider
+OUTBOX_FILE_NAME = os.environ.get('OUTBOX_FILE_ENV', 'php_outbox.jsonl') # Gönderilemeyen kayıtlar bir sonraki çalıştırmaya kalır
+REVIEW_SPOOL_DIR = os.environ.get('REVIEW_SPOOL_DIR_ENV', 'review_spool') # Review metinleri gönderilene kadar burada gzip'li durur
+PHP_STREAM_UPLOADS = os.environ.get('PHP_STREAM_UPLOADS_ENV', '1') != '0' # 0: gövde bellekte birleştirilip Content-Length ile gönderilir
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY_ENV') # GitHub Secret'tan
+GEMINI_API_BASE_URL = os.environ.get('GEMINI_API_BASE_URL_ENV', 'https://generativelanguage.googleapis.com/v1beta') # Testte yerel stub sunucuya yönlendirilebilir
+GEMINI_MODEL_NAME = os.environ.get('GEMINI_MODEL_NAME_ENV', 'gemini-1.5-flash-latest') # Daha hızlı model
+GEMINI_CHUNK_TOKENS = int(os.environ.get('GEMINI_CHUNK_TOKENS_ENV', '6000')) # Bir parçaya düşen yaklaşık token sayısı
+GEMINI_CHARS_PER_TOKEN = 4 # Kaba token tahmini için
 
 # --- E-posta Ayarları (GitHub Actions Secrets'tan) ---
 SMTP_SERVER = os.environ.get('SMTP_SERVER_ENV')
@@ -34,66 +66,555 @@ SENDER_EMAIL = os.environ.get('SENDER_EMAIL_ENV')
 RECEIVER_EMAIL = os.environ.get('RECEIVER_EMAIL_ENV')
 EMAIL_SUBJECT_PREFIX = '[GSMArena Monitor] '
 
+DIGEST_WINDOW_SECONDS = float(os.environ.get('DIGEST_WINDOW_SECONDS_ENV', '600')) # Daemon'da olaylar en fazla bu kadar biriktirilir
+DIGEST_MAX_EVENTS = int(os.environ.get('DIGEST_MAX_EVENTS_ENV', '25')) # Bu kadar olay birikince pencere beklenmeden gönderilir
+DIGEST_RETRY_MIN_SECONDS = 60 # Pencere çok kısa olsa da başarısız özet gönderimi en erken bu kadar sonra tekrar denenir
+
+# --- WebDriver Havuzu Ayarları ---
+DRIVER_POOL_SIZE = int(os.environ.get('DRIVER_POOL_SIZE_ENV', '2')) # Bir çalıştırmada en fazla açık tutulacak Chrome sayısı
+DRIVER_MAX_PAGES = int(os.environ.get('DRIVER_MAX_PAGES_ENV', '40')) # Bu kadar sayfa yükledikten sonra tarayıcı yenilenir
+CHROME_RSS_SAMPLE_EVERY = int(os.environ.get('CHROME_RSS_SAMPLE_EVERY_ENV', '10')) # Chrome belleği her N iadede bir ölçülür (/proc taranır); 0: ölçülmez
+CHROMEDRIVER_PATH_CACHE_FILE = os.environ.get('CHROMEDRIVER_PATH_CACHE_FILE_ENV', '.chromedriver_path') # ChromeDriverManager sonucu burada saklanır
+BROWSER_BLOCK_RESOURCES = os.environ.get('BROWSER_BLOCK_RESOURCES_ENV', '1') != '0' # 0: görseller, fontlar ve reklamlar yüklenir
+BROWSER_BLOCKED_HOSTS = [host.strip() for host in os.environ.get('BROWSER_BLOCKED_HOSTS_ENV', (
+    'doubleclick.net,googlesyndication.com,googleadservices.com,googletagmanager.com,googletagservices.com,'
+    'google-analytics.com,adservice.google.com,amazon-adsystem.com,adnxs.com,criteo.com,criteo.net,taboola.com,'
+    'outbrain.com,pubmatic.com,rubiconproject.com,openx.net,casalemedia.com,scorecardresearch.com,quantserve.com,'
+    'quantcount.com,moatads.com,facebook.net,connect.facebook.net,hotjar.com,chartbeat.com'
+)).split(',') if host.strip()] # Reklam/analitik hostları (alt alan adlarıyla birlikte engellenir)
+
+# --- Eşzamanlılık Ayarları (--workers ile paralel telefon işleme) ---
+DEFAULT_WORKERS = int(os.environ.get('WORKERS_ENV', '1')) # 1 = eski sıralı davranış
+GEMINI_CONCURRENCY = int(os.environ.get('GEMINI_CONCURRENCY_ENV', '2')) # Aynı anda en fazla kaç Gemini isteği
+PHP_CONCURRENCY = int(os.environ.get('PHP_CONCURRENCY_ENV', '2')) # Paylaşımlı hosting'i boğmamak için düşük tutulur
+GEMINI_SLOTS = threading.BoundedSemaphore(GEMINI_CONCURRENCY)
+PHP_SLOTS = threading.BoundedSemaphore(PHP_CONCURRENCY)
+
 # --- Ortak Başlıklar ---
 REQUESTS_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
+# --- Telefon Veritabanı ---
+PHONE_DB = os.environ.get('PHONE_DB_ENV', 'gsmarena_phones.sqlite3') # Görülen tüm telefonlar ve işleme durumları; boşsa bellek içi
+RECORD_CODEC = os.environ.get('RECORD_CODEC_ENV', 'auto') # SQLite'taki spec'ler: auto (msgpack kuruluysa msgpack), msgpack, json
+PHONE_MAX_ATTEMPTS = int(os.environ.get('PHONE_MAX_ATTEMPTS_ENV', '3')) # Başarısız bir telefon en fazla bu kadar işlenmeye çalışılır
+RECHECK_DAYS = int(os.environ.get('RECHECK_DAYS_ENV', '30')) # --recheck: son bu kadar günde ilk kez görülen telefonlar yeniden kontrol edilir
+GIT_COMMIT_STATE = os.environ.get('GIT_COMMIT_STATE_ENV', '1') != '0' # 0: durum sadece veritabanında, git commit/push yapılmaz
+
+# --- Sayfa Önbelleği ---
+PAGE_CACHE_DB = os.environ.get('PAGE_CACHE_DB_ENV', 'gsmarena_cache.sqlite3') # Boş bırakılırsa önbellek kapalı
+
+# --- Katalog Tarama Modu (--crawl) ---
+CRAWL_DB = os.environ.get('CRAWL_DB_ENV', 'gsmarena_crawl.sqlite3') # Frontier ve ziyaret durumu; iş kesilirse buradan devam edilir
+CRAWL_START_URL = os.environ.get('CRAWL_START_URL_ENV', 'https://www.gsmarena.com/makers.php3')
+CRAWL_DELAY = float(os.environ.get('CRAWL_DELAY_ENV', '2.0')) # gsmarena.com'a iki istek arası en az süre (sn); tüm işçiler genelinde
+CRAWL_QUEUE_URL = os.environ.get('CRAWL_QUEUE_URL_ENV', '') # Boş: CRAWL_DB (aynı makinedeki süreçler); redis://host:6379/0: çok makineli tarama
+CRAWL_QUEUE_PREFIX = os.environ.get('CRAWL_QUEUE_PREFIX_ENV', 'gsmarena:crawl') # Redis anahtar öneki
+CRAWL_LEASE_SECONDS = float(os.environ.get('CRAWL_LEASE_SECONDS_ENV', '180')) # Heartbeat gelmezse iş bu süre sonunda başka işçiye verilir
+CRAWL_POLL_INTERVAL = float(os.environ.get('CRAWL_POLL_INTERVAL_ENV', '10')) # Kuyruk boş ama başka işçilerde iş varken bekleme (sn)
+CRAWL_MAX_ATTEMPTS = int(os.environ.get('CRAWL_MAX_ATTEMPTS_ENV', '3'))
+CRAWL_FLUSH_EVERY = 20 # Bu kadar telefonda bir PHP kuyruğu boşaltılır
+CRAWL_REPORT_INTERVAL = 60 # sn
+
+# --- Daemon Modu (--daemon) ---
+DAEMON_MIN_INTERVAL = float(os.environ.get('DAEMON_MIN_INTERVAL_ENV', '120')) # sn; değişiklik görüldükten hemen sonraki sıklık
+DAEMON_MAX_INTERVAL = float(os.environ.get('DAEMON_MAX_INTERVAL_ENV', '1800')) # sn; uzun süre değişiklik yoksa ulaşılan üst sınır
+DAEMON_BACKOFF_FACTOR = 1.5 # Değişiklik olmayan her turda aralık bu oranda uzar
+DAEMON_QUIET_HOURS = os.environ.get('DAEMON_QUIET_HOURS_ENV', '1-7') # Yerel saat aralığı; bu saatlerde (geçmişte hareket yoksa) en seyrek sorgulanır
+DAEMON_OUTBOX_RETRY_INTERVAL = 900 # sn; değişiklik yokken bekleyen PHP kayıtlarının yeniden denenme sıklığı
+
+# --- Çalıştırma Profili ---
+PROFILE_FILE = os.environ.get('PROFILE_FILE_ENV', 'run_profile.json') # .csv uzantılıysa CSV yazılır; boşsa profil kaydedilmez
+PROMETHEUS_FILE = os.environ.get('PROMETHEUS_FILE_ENV') # Verilirse Prometheus metin formatında metrikler de yazılır
+PROFILE_EVENT_LIMIT = int(os.environ.get('PROFILE_EVENT_LIMIT_ENV', '5000')) # Rapora yazılan son ham kayıt sayısı; özetler tüm çalıştırmayı kapsar
+
+# --- HTTP İstemci Ayarları ---
+HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES_ENV', '3')) # İlk denemeye ek olarak yapılacak tekrar sayısı
+HTTP_BACKOFF_BASE = float(os.environ.get('HTTP_BACKOFF_BASE_ENV', '1.0')) # Saniye; her denemede ikiye katlanır, rastgele jitter uygulanır
+HTTP_BACKOFF_MAX = 30.0
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+HTTP_UNPROCESSED_STATUSES = (429,) # Sunucu isteği işlemeden reddetti; POST da (kaydet.php, Gemini) tekrar denenebilir
+# Host bazlı (bağlantı, okuma) timeout'ları, eşzamanlı istek limitleri ve iki istek arası en az bekleme (min_interval, sn).
+# Listede olmayan host'lar varsayılanı kullanır.
+HTTP_DEFAULT_HOST_SETTINGS = {"timeout": (10, 120), "concurrency": 4, "min_interval": 0}
+HTTP_HOST_SETTINGS = {
+    "www.gsmarena.com": {"timeout": (10, 30), "concurrency": 4},
+    "generativelanguage.googleapis.com": {"timeout": (10, 180), "concurrency": 4},
+}
+
+# --- Oturum Havuzu (UA / çerez / proxy rotasyonu) ---
+SESSION_POOL_SIZE = int(os.environ.get('SESSION_POOL_SIZE_ENV', '1')) # Proxy listesi daha uzunsa o kadar oturum açılır
+SESSION_PROXIES = [proxy.strip() for proxy in os.environ.get('SESSION_PROXIES_ENV', '').split(',') if proxy.strip()] # "direct": proxysiz oturum
+SESSION_USER_AGENTS = [agent.strip() for agent in os.environ.get('SESSION_USER_AGENTS_ENV', (
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36|'
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36|'
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36|'
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0'
+)).split('|') if agent.strip()] # Tarayıcı da aynı UA ile açıldığından Chrome tabanlı UA'lar seçildi
+SESSION_HOSTS = {host.strip() for host in os.environ.get('SESSION_HOSTS_ENV', f"www.gsmarena.com,{urlparse(TARGET_URL).netloc}").split(',') if host.strip()} # Sadece bu host'lar oturum havuzundan geçer
+SESSION_COOLDOWN_BASE = float(os.environ.get('SESSION_COOLDOWN_BASE_ENV', '60')) # sn; art arda her kısıtlamada ikiye katlanır
+SESSION_COOLDOWN_MAX = float(os.environ.get('SESSION_COOLDOWN_MAX_ENV', '900'))
+
+# === Zamanlama / Profil ===
+class RunProfiler:
+    """Aşama bazlı süre ve sonuç kayıtları. İş parçacıkları arasında paylaşılır.
+
+    Daemon ve tarama modlarında süreç günlerce açık kalabildiğinden her kayıt saklanmaz: aşama/detay başına
+    adet/toplam/en yüksek ve sonuç sayıları güncellenir, ham kayıtlardan yalnızca son PROFILE_EVENT_LIMIT tanesi tutulur.
+    """
+
+    def __init__(self, event_limit=PROFILE_EVENT_LIMIT):
+        self.started_at = datetime.now()
+        self._started_monotonic = time.perf_counter()
+        self._events = deque(maxlen=max(event_limit, 0))
+        self._stats = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, duration, outcome="ok", detail=None):
+        duration = round(duration, 4)
+        with self._lock:
+            self._events.append({"stage": stage, "detail": detail, "duration": duration, "outcome": outcome})
+            item = self._stats.setdefault((stage, detail), {"count": 0, "total": 0.0, "max": 0.0, "outcomes": {}})
+            item["count"] += 1
+            item["total"] += duration
+            item["max"] = max(item["max"], duration)
+            item["outcomes"][outcome] = item["outcomes"].get(outcome, 0) + 1
+
+    def observe(self, name, value):
+        """Süre olmayan ölçümler (ör. Chrome bellek kullanımı) için adet/son/en yüksek/ortalama tutar."""
+        with self._lock:
+            gauge = self._gauges.setdefault(name, {"count": 0, "last": 0.0, "max": 0.0, "total": 0.0})
+            gauge["count"] += 1
+            gauge["last"] = value
+            gauge["max"] = max(gauge["max"], value)
+            gauge["total"] += value
+
+    def gauges(self):
+        with self._lock:
+            return {name: dict(gauge, mean=round(gauge["total"] / gauge["count"], 2)) for name, gauge in self._gauges.items()}
+
+    def events(self, stage=None):
+        """Son PROFILE_EVENT_LIMIT ham kayıt (eskileri özetlere katılmış olarak düşer)."""
+        with self._lock:
+            return [event for event in self._events if stage is None or event["stage"] == stage]
+
+    def aggregate(self, by_detail=False):
+        summary = {}
+        with self._lock:
+            stats = [(key, dict(item, outcomes=dict(item["outcomes"]))) for key, item in self._stats.items()]
+        for (stage, detail), stat in stats:
+            key = (stage, detail) if by_detail else (stage, None)
+            item = summary.setdefault(key, {"stage": key[0], "detail": key[1], "count": 0, "total": 0.0, "max": 0.0, "outcomes": {}})
+            item["count"] += stat["count"]
+            item["total"] += stat["total"]
+            item["max"] = max(item["max"], stat["max"])
+            for outcome, count in stat["outcomes"].items():
+                item["outcomes"][outcome] = item["outcomes"].get(outcome, 0) + count
+        return sorted(summary.values(), key=lambda item: item["total"], reverse=True)
+
+    def write_report(self, file_path):
+        with self._lock:
+            events = list(self._events)
+        if file_path.endswith('.csv'):
+            with open(file_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=["stage", "detail", "duration", "outcome"])
+                writer.writeheader()
+                writer.writerows(events)
+            return
+        report = {
+            "started_at": self.started_at.isoformat(timespec='seconds'),
+            "total_seconds": round(time.perf_counter() - self._started_monotonic, 3),
+            "stages": self.aggregate(),
+            "specs": [item for item in self.aggregate(by_detail=True) if item["stage"] == "spec_lookup"],
+            "gauges": self.gauges(),
+            "events": events,
+        }
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _prometheus_label(value):
+        """Etiket değerini Prometheus metin formatına göre kaçışlar (ters eğik çizgi, çift tırnak, satır sonu)."""
+        return str(value or "").replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def write_prometheus(self, file_path):
+        label = self._prometheus_label
+        lines = ["# TYPE gsmarena_stage_duration_seconds summary", "# TYPE gsmarena_stage_outcomes_total counter"]
+        for item in self.aggregate(by_detail=True):
+            labels = f'stage="{label(item["stage"])}",detail="{label(item["detail"])}"'
+            lines.append(f"gsmarena_stage_duration_seconds_sum{{{labels}}} {item['total']:.4f}")
+            lines.append(f"gsmarena_stage_duration_seconds_count{{{labels}}} {item['count']}")
+            for outcome, count in item["outcomes"].items():
+                lines.append(f'gsmarena_stage_outcomes_total{{{labels},outcome="{label(outcome)}"}} {count}')
+        for name, gauge in self.gauges().items():
+            lines.append(f'gsmarena_gauge_max{{name="{label(name)}"}} {gauge["max"]:.2f}')
+            lines.append(f'gsmarena_gauge_mean{{name="{label(name)}"}} {gauge["mean"]:.2f}')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def print_summary(self, top=10):
+        stages = self.aggregate()
+        if not stages:
+            return
+        print(f"\n--- Çalıştırma Profili (toplam {time.perf_counter() - self._started_monotonic:.1f} sn) ---")
+        print(f"{'Aşama':<24}{'Adet':>6}{'Toplam sn':>11}{'Ort. sn':>9}{'Max sn':>9}  Sonuçlar")
+        for item in stages:
+            print(f"{item['stage']:<24}{item['count']:>6}{item['total']:>11.2f}{item['total'] / item['count']:>9.2f}{item['max']:>9.2f}  {item['outcomes']}")
+        slow_specs = [item for item in self.aggregate(by_detail=True) if item["stage"] == "spec_lookup"][:top]
+        if slow_specs:
+            print("En yavaş spec'ler (Selenium):")
+            for item in slow_specs:
+                print(f"  {item['detail']:<45}{item['total']:>8.2f} sn  zaman aşımı: {item['outcomes'].get('timeout', 0)}")
+        for name, gauge in self.gauges().items():
+            print(f"{name}: ort. {gauge['mean']:.1f}, en yüksek {gauge['max']:.1f} ({gauge['count']} ölçüm)")
+
+    def write_outputs(self):
+        """Yapılandırılmış profil dosyalarını günceller; daemon/tarama modlarında periyodik olarak da çağrılır."""
+        try:
+            if PROFILE_FILE: self.write_report(PROFILE_FILE)
+            if PROMETHEUS_FILE: self.write_prometheus(PROMETHEUS_FILE)
+        except IOError as e:
+            print(f"Uyarı: Profil dosyası yazılamadı. {e}")
+
+    def finish(self):
+        """Profil dosyalarını yazar ve özeti basar (atexit ile çağrılır)."""
+        self.print_summary()
+        self.write_outputs()
+
+PROFILER = RunProfiler()
+
+class _StageResult:
+    def __init__(self):
+        self.outcome = "ok"
+
+@contextmanager
+def profile_stage(stage, detail=None):
+    """`with profile_stage("php_post") as stage: ...` — süreyi kaydeder; sonucu `stage.outcome` ile değiştirilebilir."""
+    result = _StageResult()
+    started = time.perf_counter()
+    try:
+        yield result
+    except BaseException:
+        result.outcome = "error"
+        raise
+    finally:
+        PROFILER.record(stage, time.perf_counter() - started, result.outcome, detail)
+
+# === Oturum Havuzu ===
+# gsmarena.com istekleri tek bir kimlik yerine bir oturum havuzuna dağıtılır. Her oturumun kendi User-Agent'ı, çerez
+# kavanozu ve (varsa) proxy'si vardır; aynı oturum Chrome profiline de uygulanır. Oturum başına başarı, kısıtlanma ve
+# gecikme izlenir (profilde "http_session" aşaması). 429 ya da Cloudflare challenge alan oturum üstel artan bir süre
+# soğumaya alınır ve iş diğer oturumlara yönlendirilir.
+class ScrapeSession:
+    def __init__(self, session_id, user_agent, proxy=None):
+        self.session_id = session_id
+        self.user_agent = user_agent
+        self.proxy = proxy
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        if proxy: self.http.proxies = {"http": proxy, "https": proxy}
+        self.successes = self.throttled = self.errors = 0
+        self.consecutive_throttles = 0
+        self.latency_ewma = None
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+        self.last_used = 0.0
+
+    @property
+    def label(self):
+        return f"s{self.session_id}" + (f"@{urlparse(self.proxy).hostname}:{urlparse(self.proxy).port}" if self.proxy else "")
+
+    def browser_arguments(self):
+        """Chrome için UA ve proxy argümanları. Chrome proxy URL'sindeki kullanıcı/şifreyi desteklemez; kimlik
+        doğrulamalı proxy'ler IP izin listesiyle kullanılmalıdır."""
+        arguments = [f"user-agent={self.user_agent}"]
+        if self.proxy:
+            parsed_proxy = urlparse(self.proxy)
+            arguments.append(f"--proxy-server={parsed_proxy.scheme}://{parsed_proxy.hostname}:{parsed_proxy.port}")
+        return arguments
+
+    def absorb_browser_cookies(self, cookies):
+        """Tarayıcının aldığı çerezleri (ör. challenge sonrası cf_clearance) HTTP oturumuna aktarır."""
+        for cookie in cookies:
+            self.http.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+class SessionPool:
+    def __init__(self, size=SESSION_POOL_SIZE, user_agents=SESSION_USER_AGENTS, proxies=SESSION_PROXIES, hosts=SESSION_HOSTS,
+                 cooldown_base=SESSION_COOLDOWN_BASE, cooldown_max=SESSION_COOLDOWN_MAX):
+        proxies = [None if proxy == "direct" else proxy for proxy in proxies] or [None]
+        size = max(1, size, len(proxies))
+        self.sessions = [ScrapeSession(index, user_agents[index % len(user_agents)], proxies[index % len(proxies)]) for index in range(size)]
+        self.hosts = set(hosts)
+        self.cooldown_base = cooldown_base
+        self.cooldown_max = cooldown_max
+        self._browser_turn = 0
+        self._lock = threading.Lock()
+
+    def handles(self, host):
+        return host in self.hosts
+
+    def shares_ip(self):
+        """Hiçbir oturum proxy kullanmıyorsa kısıtlama IP'ye yöneliktir; oturum değiştirmek işe yaramaz."""
+        return all(session.proxy is None for session in self.sessions)
+
+    def available_now(self):
+        now = time.monotonic()
+        return any(session.cooldown_until <= now for session in self.sessions)
+
+    def acquire(self):
+        """Soğumada olmayan oturumlardan en az meşgul ve en hızlısını verir; hepsi soğumadaysa ilk açılanı bekler."""
+        with self._lock:
+            now = time.monotonic()
+            available = [session for session in self.sessions if session.cooldown_until <= now]
+            if available:
+                session = min(available, key=lambda item: (item.in_flight, item.latency_ewma or 0.0, item.last_used))
+            else:
+                session = min(self.sessions, key=lambda item: item.cooldown_until)
+            wait_seconds = max(0.0, session.cooldown_until - now)
+            session.in_flight += 1
+            session.last_used = now + wait_seconds
+        if wait_seconds > 0:
+            print(f"Uyarı (Oturum): Tüm oturumlar soğumada, {session.label} için {wait_seconds:.0f} sn bekleniyor.")
+            time.sleep(wait_seconds)
+        return session
+
+    def next_browser_session(self):
+        """Yeni açılan Chrome için sıradaki (soğumada olmayan) oturum."""
+        with self._lock:
+            now = time.monotonic()
+            for offset in range(len(self.sessions)):
+                session = self.sessions[(self._browser_turn + offset) % len(self.sessions)]
+                if session.cooldown_until <= now: break
+            self._browser_turn = (session.session_id + 1) % len(self.sessions)
+            return session
+
+    @staticmethod
+    def is_throttled(response):
+        if response.status_code == 429:
+            return True
+        if response.status_code in (403, 503): # Cloudflare challenge sayfası
+            return response.headers.get('cf-mitigated') == 'challenge' or 'cloudflare' in response.headers.get('Server', '').lower()
+        return False
+
+    def release(self, session, outcome, latency, retry_after=None):
+        """`outcome`: "ok", "throttled" ya da "error" (bağlantı/proxy hatası)."""
+        with self._lock:
+            session.in_flight -= 1
+            if outcome == "ok":
+                session.successes += 1
+                session.consecutive_throttles = 0
+                session.latency_ewma = latency if session.latency_ewma is None else 0.8 * session.latency_ewma + 0.2 * latency
+            elif outcome == "throttled":
+                session.throttled += 1
+                session.consecutive_throttles += 1
+                if not self.shares_ip(): # Tek IP'de bekleme HttpClient geri çekilmesine/ortak sınırlayıcıya bırakılır
+                    cooldown = min(self.cooldown_max, max(retry_after or 0, self.cooldown_base * (2 ** (session.consecutive_throttles - 1))))
+                    session.cooldown_until = time.monotonic() + cooldown
+                    print(f"Uyarı (Oturum): {session.label} kısıtlandı, {cooldown:.0f} sn soğumaya alındı.")
+            else:
+                session.errors += 1
+                if session.proxy: session.cooldown_until = time.monotonic() + self.cooldown_base / 4 # Proxy geçici olarak erişilemez olabilir
+        PROFILER.record("http_session", latency, outcome, session.label)
+
+SESSION_POOL = SessionPool()
+
+class HttpClient:
+    """Tüm HTTP çağrılarının geçtiği ortak istemci.
+
+    Tek bir `requests.Session` üzerinden host başına keep-alive bağlantı havuzu kullanır,
+    host bazlı timeout ve eşzamanlılık limiti uygular, geçici hataları jitter'lı üstel bekleme ile tekrar dener.
+    POST gibi idempotent olmayan istekler sadece sunucuya hiç ulaşmadıklarında (bağlantı kurulamadı) ya da 429'da
+    tekrar denenir; okuma timeout'u ve 5xx sonrası gövde işlenmiş olabileceğinden çift kayıt riski alınmaz.
+    Yan etkisi olmayan POST'lar (ör. Gemini generateContent) `idempotent=True` ile GET gibi tekrar denenir.
+    """
+
+    def __init__(self, host_settings=None, max_retries=HTTP_MAX_RETRIES, backoff_base=HTTP_BACKOFF_BASE, session_pool=SESSION_POOL):
+        self.host_settings = dict(host_settings if host_settings is not None else HTTP_HOST_SETTINGS)
+        self.session_pool = session_pool
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._host_slots = {}
+        self._next_request_at = {}
+        self._lock = threading.Lock()
+
+    def _settings_for(self, host):
+        return {**HTTP_DEFAULT_HOST_SETTINGS, **self.host_settings.get(host, {})}
+
+    def set_host_settings(self, host, **overrides):
+        """Bir host'un ayarlarını çalışma anında değiştirir (örn. tarama modunda nezaket aralığı)."""
+        with self._lock:
+            self.host_settings[host] = {**self.host_settings.get(host, {}), **overrides}
+            self._host_slots.pop(host, None)
+
+    def _wait_for_turn(self, host):
+        """Host için `min_interval` tanımlıysa istekleri (tüm iş parçacıkları genelinde) aralıklandırır.
+        `shared_limiter` ayarlıysa sıra paylaşılan kuyruktan alınır; aralık tüm süreç ve makineler için geçerli olur."""
+        settings = self._settings_for(host)
+        min_interval = settings["min_interval"]
+        if min_interval <= 0:
+            return
+        shared_limiter = settings.get("shared_limiter")
+        if shared_limiter is not None:
+            delay = shared_limiter.reserve_request_slot(host, min_interval)
+            if delay > 0: time.sleep(delay)
+            return
+        with self._lock:
+            now = time.monotonic()
+            scheduled_at = max(now, self._next_request_at.get(host, 0))
+            self._next_request_at[host] = scheduled_at + min_interval
+        if scheduled_at > now:
+            time.sleep(scheduled_at - now)
+
+    def wait_for_turn(self, url):
+        """HttpClient dışından (tarayıcıyla) yapılacak bir sayfa yüklemesi için nezaket sırasını bekler."""
+        self._wait_for_turn(urlparse(url).netloc)
+
+    def _host_slot(self, host):
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self._settings_for(host)["concurrency"])
+            return self._host_slots[host]
+
+    @staticmethod
+    def _retry_after(response):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        return float(retry_after) if retry_after and retry_after.isdigit() else None
+
+    def _backoff_delay(self, attempt, response=None):
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, HTTP_BACKOFF_MAX)
+        return random.uniform(0, min(HTTP_BACKOFF_MAX, self.backoff_base * (2 ** attempt))) # "full jitter"
+
+    @staticmethod
+    def _request_not_sent(error):
+        """Bağlantı kurulamadıysa (connect timeout, refused, DNS) istek sunucuya hiç ulaşmamıştır."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectionError) and isinstance(reason, NewConnectionError)
+
+    def request(self, method, url, max_retries=None, idempotent=None, **kwargs):
+        max_retries = self.max_retries if max_retries is None else max_retries
+        if idempotent is None: idempotent = method.upper() in HTTP_IDEMPOTENT_METHODS
+        host = urlparse(url).netloc
+        kwargs.setdefault('timeout', self._settings_for(host)["timeout"])
+        session_pool = self.session_pool if self.session_pool is not None and self.session_pool.handles(host) else None
+        for attempt in range(max_retries + 1):
+            self._wait_for_turn(host)
+            session = session_pool.acquire() if session_pool else None
+            request_kwargs = kwargs
+            if session: request_kwargs = {**kwargs, "headers": {**(kwargs.get("headers") or {}), "User-Agent": session.user_agent}}
+            started = time.perf_counter()
+            try:
+                with self._host_slot(host):
+                    response = (session.http if session else self._session).request(method, url, **request_kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if session: session_pool.release(session, "error", time.perf_counter() - started)
+                if attempt >= max_retries or not (idempotent or self._request_not_sent(e)): raise
+                delay = self._backoff_delay(attempt)
+                print(f"Uyarı (HTTP): {host} isteği başarısız ({e.__class__.__name__}), {delay:.1f} sn sonra tekrar denenecek ({attempt + 1}/{max_retries}).")
+                time.sleep(delay)
+                continue
+            except BaseException: # TooManyRedirects, ChunkedEncodingError vb.: oturum meşgul kalmasın
+                if session: session_pool.release(session, "error", time.perf_counter() - started)
+                raise
+            throttled = session_pool is not None and session_pool.is_throttled(response)
+            if session: session_pool.release(session, "throttled" if throttled else "ok", time.perf_counter() - started, self._retry_after(response))
+            retryable = response.status_code in (HTTP_RETRY_STATUSES if idempotent else HTTP_UNPROCESSED_STATUSES)
+            if (retryable or throttled) and attempt < max_retries:
+                delay = self._backoff_delay(attempt, response)
+                rotated = throttled and not session_pool.shares_ip() and session_pool.available_now()
+                if rotated:
+                    delay = 0.0 # Kısıtlanan oturum soğumada; başka IP'deki oturumla hemen tekrar denenir
+                shared_limiter = self._settings_for(host).get("shared_limiter")
+                if shared_limiter is not None and response.status_code == 429 and not rotated: # Diğer işçiler de yavaşlasın
+                    shared_limiter.defer_requests(host, delay)
+                print(f"Uyarı (HTTP): {host} {response.status_code} döndü, {delay:.1f} sn sonra tekrar denenecek ({attempt + 1}/{max_retries}).")
+                response.close()
+                time.sleep(delay)
+                continue
+            return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+HTTP_CLIENT = HttpClient()
+
 # === GSMArena Kontrol Fonksiyonları (Önceki script'ten) ===
 def get_website_content_requests(url):
     try:
-        response = requests.get(url, headers=REQUESTS_HEADERS, timeout=30)
+        response = HTTP_CLIENT.get(url, headers=REQUESTS_HEADERS)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException as e:
         print(f"Hata (Requests): Sayfa içeriği çekilemedi. {e}")
         return None
 
-def parse_latest_phones_from_main_page(html_content, limit=3):
-    if not html_content: return []
+# === Ana Sayfa Ayrıştırma ===
+# Ayrıştırıcı arka ucu değiştirilebilir: selectolax (C, en hızlı) > lxml > bs4 (eski davranış). Hızlı arka uçlar
+# tüm sayfayı ağaca çevirmez; HTML içinde "module-latest" geçen div'den başlayıp modül kapanınca durur.
+# Modül bulunamazsa eski yedek davranış korunur: sayfadaki tüm module-phones-link'ler taranır.
+PHONE_NAME_SKIP_KEYWORDS = ["Opinions", "Review", "Prices", "Compare", "Pictures"]
+
+def _latest_module_starts(html_content):
+    """HTML'de module-latest geçen her yer için onu açan <div'in konumu (belge sırasıyla, tekrarsız)."""
+    position, last_start = 0, -1
+    while True:
+        position = html_content.find('module-latest', position)
+        if position < 0: return
+        start = html_content.rfind('<div', 0, position)
+        if start > last_start:
+            last_start = start
+            yield start
+        position += len('module-latest')
+
+_DIV_TAG_PATTERN = re.compile(r'<(/?)div\b', re.IGNORECASE)
+
+def _div_end(html_content, start):
+    """`start`taki <div'in kapanış etiketinin bittiği konum (iç içe div'ler sayılır); kapanmıyorsa belge sonu."""
+    depth = 0
+    for match in _DIV_TAG_PATTERN.finditer(html_content, start):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            end = html_content.find('>', match.end())
+            return len(html_content) if end < 0 else end + 1
+    return len(html_content)
+
+def _is_latest_heading_text(text):
+    return 'Latest devices' in text or 'Latest additions' in text
+
+def _homepage_links_bs4(html_content):
+    """(modül_bulundu_mu, [(isim, href), ...]) döner; eski BeautifulSoup yolu."""
+    from bs4 import BeautifulSoup # Sadece bu arka uç seçilince gerekir
     soup = BeautifulSoup(html_content, 'html.parser')
-    phones = []
-    
     latest_devices_module = None
-    # GSMArena'nın ana sayfasındaki "Latest devices" bölümünün yapısı değişebilir.
-    # Daha sağlam bir selektör bulmak gerekebilir.
-    # Örnek: <div class="module module-latest"> <h4 class="section-heading">Latest devices</h4> ...
-    
-    # Öncelikle doğru başlığı içeren modülü bulmaya çalışalım
     possible_modules = soup.find_all('div', class_='module-latest')
     if not possible_modules:
         possible_modules = soup.find_all('div', class_=lambda x: x and 'module' in x and 'latest' in x) # Daha genel
-
     for module in possible_modules:
         heading = module.find(['h3', 'h4'], class_='section-heading')
-        if heading and ('Latest devices' in heading.get_text() or 'Latest additions' in heading.get_text()):
+        if heading and _is_latest_heading_text(heading.get_text()):
             latest_devices_module = module
             break
-            
-    if not latest_devices_module:
-        print("Hata: Ana sayfada 'Latest devices' modülü bulunamadı. HTML yapısı değişmiş olabilir.")
-        # Yedek olarak tüm module-phones-link'leri deneyebiliriz
-        all_links_on_page = soup.find_all('a', class_='module-phones-link')
-        if not all_links_on_page:
-            print("Kritik Hata: Hiçbir telefon linki bulunamadı.")
-            return []
-        phone_links = all_links_on_page
-        print("Uyarı: 'Latest devices' modülü bulunamadı, sayfadaki tüm telefon linkleri taranıyor (limitli).")
-    else:
-        phone_links = latest_devices_module.find_all('a', class_='module-phones-link')
-
-    if not phone_links:
-        print("Hata: 'Latest devices' modülünde telefon linkleri bulunamadı.")
-        return []
 
-    # print(f"Bulunan toplam link sayısı: {len(phone_links)}")
-    parsed_count = 0
+    phone_links = (latest_devices_module if latest_devices_module is not None else soup).find_all('a', class_='module-phones-link')
+    links = []
     for link_tag in phone_links:
-        if parsed_count >= limit: break
-        
-        phone_name_tag = link_tag.find('span') # Genellikle <span> içinde oluyor
         phone_name = None
-
+        phone_name_tag = link_tag.find('span') # Genellikle <span> içinde oluyor
         if phone_name_tag:
             phone_name = phone_name_tag.get_text(strip=True)
         else: # Eğer span yoksa, <br> sonrası metni deneyelim (eski yapı)
@@ -101,23 +622,153 @@ def parse_latest_phones_from_main_page(html_content, limit=3):
             if br_tag and br_tag.next_sibling and isinstance(br_tag.next_sibling, str):
                 phone_name = br_tag.next_sibling.strip()
             elif link_tag.get_text(strip=True): # En son çare linkin kendi metni
-                 phone_name = link_tag.get_text(strip=True)
+                phone_name = link_tag.get_text(strip=True)
+        links.append((phone_name, link_tag.get('href')))
+    return latest_devices_module is not None, links
 
+def _lxml_joined_text(element):
+    return "".join(text.strip() for text in element.itertext()) # bs4 get_text(strip=True) ile aynı
 
-        href = link_tag.get('href')
-        # print(f"DEBUG: Link Tag: {link_tag}, Name: {phone_name}, Href: {href}")
+def _lxml_phone_link(link_element):
+    phone_name = None
+    span = next(link_element.iter('span'), None)
+    if span is not None:
+        phone_name = _lxml_joined_text(span)
+    else:
+        br = next(link_element.iter('br'), None)
+        if br is not None and br.tail:
+            phone_name = br.tail.strip()
+        elif _lxml_joined_text(link_element):
+            phone_name = _lxml_joined_text(link_element)
+    return phone_name, link_element.get('href')
 
-        if phone_name and href:
-            # İsim "Opinions", "Review", "Prices" gibi şeylerse atla
-            if any(keyword in phone_name for keyword in ["Opinions", "Review", "Prices", "Compare", "Pictures"]):
-                continue
+def _lxml_is_latest_module(module):
+    heading = next((h for h in module.iter('h3', 'h4') if _has_class(h, 'section-heading')), None)
+    return heading is not None and _is_latest_heading_text("".join(heading.itertext()))
+
+def _lxml_module_from(html_content, start, chunk_size=8192):
+    """`start`taki div'i parça parça parse eder ve div kapanır kapanmaz durur (sayfanın kalanı okunmaz)."""
+    parser = lxml_etree.HTMLPullParser(events=('start', 'end'))
+    module = None
+    for offset in range(start, len(html_content), chunk_size):
+        parser.feed(html_content[offset:offset + chunk_size])
+        for event, element in parser.read_events():
+            if module is None and event == 'start' and element.tag == 'div':
+                module = element
+            elif event == 'end' and element is module:
+                return module
+    parser.close()
+    return module
+
+def _homepage_links_lxml(html_content):
+    module_candidates = 0
+    for start in _latest_module_starts(html_content):
+        module = _lxml_module_from(html_content, start)
+        if module is None or not _has_class(module, 'module-latest'): continue
+        module_candidates += 1
+        if _lxml_is_latest_module(module):
+            return True, [_lxml_phone_link(link) for link in module.iter('a') if _has_class(link, 'module-phones-link')]
+
+    tree = lxml_html.fromstring(html_content) # Yedek yol: tüm sayfa
+    if not module_candidates:
+        for module in tree.iter('div'):
+            class_value = module.get('class') or ''
+            if 'module' in class_value and 'latest' in class_value and _lxml_is_latest_module(module):
+                return True, [_lxml_phone_link(link) for link in module.iter('a') if _has_class(link, 'module-phones-link')]
+    return False, [_lxml_phone_link(link) for link in tree.iter('a') if _has_class(link, 'module-phones-link')]
+
+def _selectolax_phone_link(link_node):
+    phone_name = None
+    span = link_node.css_first('span')
+    if span is not None:
+        phone_name = span.text(deep=True, separator='', strip=True)
+    else:
+        br = link_node.css_first('br')
+        sibling = br.next if br is not None else None
+        if sibling is not None and sibling.tag == '-text' and sibling.text(deep=False):
+            phone_name = sibling.text(deep=False).strip()
+        elif link_node.text(deep=True, separator='', strip=True):
+            phone_name = link_node.text(deep=True, separator='', strip=True)
+    return phone_name, link_node.attributes.get('href')
+
+def _selectolax_is_latest_module(module):
+    heading = module.css_first('h3.section-heading, h4.section-heading')
+    return heading is not None and _is_latest_heading_text(heading.text(deep=True))
+
+def _homepage_links_selectolax(html_content):
+    from selectolax.parser import HTMLParser
+    module_candidates = 0
+    for start in _latest_module_starts(html_content):
+        # Kesit modülle başlayıp modül kapanınca bittiğinden ilk div modülün kendisidir; sayfanın kalanı parse edilmez
+        module = HTMLParser(html_content[start:_div_end(html_content, start)]).css_first('div')
+        if module is None or 'module-latest' not in (module.attributes.get('class') or '').split(): continue
+        module_candidates += 1
+        if _selectolax_is_latest_module(module):
+            return True, [_selectolax_phone_link(link) for link in module.css('a.module-phones-link')]
+
+    tree = HTMLParser(html_content)
+    if not module_candidates:
+        for module in tree.css('div'):
+            class_value = module.attributes.get('class') or ''
+            if 'module' in class_value and 'latest' in class_value and _selectolax_is_latest_module(module):
+                return True, [_selectolax_phone_link(link) for link in module.css('a.module-phones-link')]
+    return False, [_selectolax_phone_link(link) for link in tree.css('a.module-phones-link')]
+
+HOMEPAGE_PARSER_BACKENDS = {
+    "selectolax": _homepage_links_selectolax,
+    "lxml": _homepage_links_lxml,
+    "bs4": _homepage_links_bs4,
+}
+
+def homepage_parser_available(name):
+    if name == "lxml":
+        return lxml_etree is not None
+    module_name = "selectolax.parser" if name == "selectolax" else name
+    try:
+        __import__(module_name)
+        return True
+    except ImportError:
+        return False
+
+_HOMEPAGE_PARSER_CHOICE = {}
+
+def resolve_homepage_parser(name=None):
+    """Ayarlanan arka ucu döner; "auto" ise kurulu olan en hızlısı. Seçim çalıştırma boyunca bir kez yapılır."""
+    name = name or HOMEPAGE_PARSER
+    if name not in _HOMEPAGE_PARSER_CHOICE:
+        candidates = list(HOMEPAGE_PARSER_BACKENDS) if name == "auto" else [name, "bs4"]
+        chosen = next((candidate for candidate in candidates if candidate in HOMEPAGE_PARSER_BACKENDS and homepage_parser_available(candidate)), "bs4")
+        if name not in ("auto", chosen):
+            print(f"Uyarı: '{name}' ana sayfa ayrıştırıcısı kullanılamıyor, '{chosen}' kullanılacak.")
+        _HOMEPAGE_PARSER_CHOICE[name] = chosen
+    return _HOMEPAGE_PARSER_CHOICE[name]
+
+def parse_latest_phones_from_main_page(html_content, limit=3, parser_backend=None):
+    if not html_content: return []
+    module_found, phone_links = HOMEPAGE_PARSER_BACKENDS[resolve_homepage_parser(parser_backend)](html_content)
+
+    if not module_found:
+        print("Hata: Ana sayfada 'Latest devices' modülü bulunamadı. HTML yapısı değişmiş olabilir.")
+        if not phone_links:
+            print("Kritik Hata: Hiçbir telefon linki bulunamadı.")
+            return []
+        print("Uyarı: 'Latest devices' modülü bulunamadı, sayfadaki tüm telefon linkleri taranıyor (limitli).")
+    elif not phone_links:
+        print("Hata: 'Latest devices' modülünde telefon linkleri bulunamadı.")
+        return []
+
+    phones = []
+    seen_links = set() # Dublikasyon önleme (sadece link bazlı, çünkü isimler bazen farklı formatta gelebiliyor)
+    for phone_name, href in phone_links:
+        if len(phones) >= limit: break
+        if not (phone_name and href): continue
+        # İsim "Opinions", "Review", "Prices" gibi şeylerse atla
+        if any(keyword in phone_name for keyword in PHONE_NAME_SKIP_KEYWORDS): continue
+        full_link = 'https://www.gsmarena.com/' + href.lstrip('/') if not href.startswith('http') else href
+        if full_link not in seen_links:
+            seen_links.add(full_link)
+            phones.append({'name': phone_name, 'link': full_link})
 
-            full_link = 'https://www.gsmarena.com/' + href.lstrip('/') if not href.startswith('http') else href
-            # Dublikasyon önleme (sadece link bazlı, çünkü isimler bazen farklı formatta gelebiliyor)
-            if not any(p['link'] == full_link for p in phones):
-                 phones.append({'name': phone_name, 'link': full_link})
-                 parsed_count += 1
-    
     if not phones:
         print("Uyarı: Hiçbir telefon ayrıştırılamadı. Selektörleri kontrol edin.")
     return phones
@@ -141,29 +792,223 @@ def save_data_to_file(file_path, data_list):
     except IOError as e:
         print(f"Hata: {file_path} dosyasına yazılamadı. {e}")
 
-def send_email_notification(subject, body):
+# === E-posta Bildirimleri ===
+# SMTP oturumu süreç boyunca açık tutulur: bağlantı, STARTTLS ve login bir kez yapılır. Sunucu bağlantıyı kapatmışsa
+# bir kez yeniden bağlanılır. Olaylar (yeni telefon, hata, spec değişikliği...) NotificationDigest'te biriktirilir ve
+# zaman/adet penceresi dolunca tek bir HTML + düz metin özet e-postası olarak gönderilir.
+class SmtpSession:
+    def __init__(self, server, port, username, password, idle_check_after=60):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.idle_check_after = idle_check_after # sn; bu kadar boşta kalan bağlantı NOOP ile yoklanır
+        self._smtp = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        import smtplib
+        smtp = smtplib.SMTP(self.server, self.port, timeout=30)
+        if self.port == 587:
+            smtp.starttls()
+        smtp.login(self.username, self.password)
+        return smtp
+
+    def _discard(self):
+        try: self._smtp.quit()
+        except Exception: pass
+        self._smtp = None
+
+    def _is_alive(self):
+        try:
+            return self._smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    def send(self, sender, receiver, message):
+        import smtplib
+        with self._lock:
+            if self._smtp is not None and time.monotonic() - self._last_used > self.idle_check_after and not self._is_alive():
+                self._discard()
+            for attempt in range(2):
+                if self._smtp is None:
+                    self._smtp = self._connect()
+                try:
+                    self._smtp.sendmail(sender, receiver, message)
+                    self._last_used = time.monotonic()
+                    return
+                except smtplib.SMTPServerDisconnected:
+                    self._smtp = None
+                    if attempt: raise
+
+    def close(self):
+        with self._lock:
+            if self._smtp is not None:
+                self._discard()
+
+_smtp_session = None
+_smtp_session_lock = threading.Lock()
+
+def get_smtp_session():
+    global _smtp_session
+    with _smtp_session_lock:
+        if _smtp_session is None:
+            _smtp_session = SmtpSession(SMTP_SERVER, int(SMTP_PORT_STR), SMTP_USERNAME, SMTP_PASSWORD)
+            atexit.register(_smtp_session.close)
+        return _smtp_session
+
+def send_email_notification(subject, body, html_body=None):
+    """Düz metin (ve verilirse HTML alternatifli) e-postayı ortak SMTP oturumuyla gönderir."""
     if not all([SMTP_SERVER, SMTP_USERNAME, SMTP_PASSWORD, SENDER_EMAIL, RECEIVER_EMAIL]):
         print("E-posta ayarları eksik, bildirim gönderilemedi. Lütfen GitHub Secrets'ı kontrol edin: SMTP_SERVER_ENV, SMTP_PORT_ENV, SMTP_USERNAME_ENV, SMTP_PASSWORD_ENV, SENDER_EMAIL_ENV, RECEIVER_EMAIL_ENV")
         return False
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
     try:
-        smtp_port = int(SMTP_PORT_STR)
-        msg = MIMEText(body, 'plain', 'utf-8')
+        if html_body:
+            msg = MIMEMultipart('alternative')
+            msg.attach(MIMEText(body, 'plain', 'utf-8'))
+            msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+        else:
+            msg = MIMEText(body, 'plain', 'utf-8')
         msg['Subject'] = subject
         msg['From'] = SENDER_EMAIL
         msg['To'] = RECEIVER_EMAIL
 
-        with smtplib.SMTP(SMTP_SERVER, smtp_port) as server:
-            if smtp_port == 587:
-                 server.starttls()
-            server.login(SMTP_USERNAME, SMTP_PASSWORD)
-            server.sendmail(SENDER_EMAIL, RECEIVER_EMAIL, msg.as_string())
+        with profile_stage("smtp"):
+            get_smtp_session().send(SENDER_EMAIL, RECEIVER_EMAIL, msg.as_string())
         print(f"Bildirim e-postası {RECEIVER_EMAIL} adresine gönderildi.")
         return True
     except Exception as e:
         print(f"Hata: E-posta gönderilemedi. {e}")
         return False
 
+# Özet e-postasındaki bölümler, gösterim sırasıyla. "list_update" bölümünde sadece en son liste gösterilir.
+DIGEST_SECTIONS = (
+    ("new_phone", "Yeni Eklenen Telefon(lar)"),
+    ("spec_change", "Spec Değişiklikleri"),
+    ("retry", "Yeniden Denenen Telefonlar"),
+    ("failure", "Hatalar"),
+    ("upload", "Önceki Çalıştırmalardan Kalan Gönderimler"),
+    ("info", "Notlar"),
+    ("list_update", "Sitedeki Mevcut İlk Telefonlar"),
+)
+
+class NotificationDigest:
+    """Bildirim olaylarını biriktirip toplu özet e-postası gönderir.
+
+    `flush()` pencere dolduysa (en az `max_events` olay ya da ilk olaydan beri `window_seconds`) gönderir;
+    `force=True` ile bekleyen olaylar hemen gönderilir. Gönderilemeyen olaylar kaybolmaz; bir pencere sonra yeniden denenir.
+    """
+
+    def __init__(self, window_seconds=DIGEST_WINDOW_SECONDS, max_events=DIGEST_MAX_EVENTS):
+        self.window_seconds = window_seconds
+        self.max_events = max_events
+        self._events = []
+        self._first_event_at = None
+        self._retry_at = None # Başarısız gönderimden sonra bir sonraki deneme zamanı
+        self._lock = threading.Lock()
+
+    def add(self, kind, title, url=None, details=(), ok=True):
+        with self._lock:
+            self._events.append({"kind": kind, "title": title, "url": url, "details": list(details), "ok": ok, "at": datetime.now()})
+            if self._first_event_at is None:
+                self._first_event_at = time.monotonic()
+
+    def pending(self):
+        with self._lock:
+            return len(self._events)
+
+    def due(self):
+        with self._lock:
+            if not self._events or (self._retry_at is not None and time.monotonic() < self._retry_at):
+                return False
+            return len(self._events) >= self.max_events or time.monotonic() - self._first_event_at >= self.window_seconds
+
+    def seconds_until_due(self):
+        """Pencerenin dolmasına (ya da yeniden denemeye) kalan süre; bekleyen olay yoksa None."""
+        with self._lock:
+            if not self._events:
+                return None
+            if self._retry_at is not None:
+                return max(0.0, self._retry_at - time.monotonic())
+            return max(0.0, self.window_seconds - (time.monotonic() - self._first_event_at))
+
+    def flush(self, force=False):
+        if not (force or self.due()):
+            return False
+        with self._lock:
+            if not self._events:
+                return False
+            events, first_event_at, self._events, self._first_event_at = self._events, self._first_event_at, [], None
+        text_body, html_body = self.render(events)
+        try:
+            sent = send_email_notification(self.subject(events), text_body, html_body)
+        except Exception as e:
+            print(f"Hata: Özet e-postası gönderilemedi. {e}")
+            sent = False
+        if not sent: # Olaylar (hata olayları dahil) geri konur, bir pencere sonra tekrar denenir
+            with self._lock:
+                self._events[:0] = events
+                self._first_event_at = first_event_at
+                self._retry_at = time.monotonic() + max(self.window_seconds, DIGEST_RETRY_MIN_SECONDS)
+            return False
+        with self._lock:
+            self._retry_at = None
+        return True
+
+    @staticmethod
+    def subject(events):
+        counts = {}
+        for event in events:
+            counts[event["kind"]] = counts.get(event["kind"], 0) + 1
+        if counts.get("new_phone"):
+            return EMAIL_SUBJECT_PREFIX + f"{counts['new_phone']} Yeni Telefon Tespit Edildi!"
+        if counts.get("spec_change"):
+            return EMAIL_SUBJECT_PREFIX + f"{counts['spec_change']} Telefonda Spec Değişikliği"
+        if counts.get("failure"):
+            return EMAIL_SUBJECT_PREFIX + f"{counts['failure']} Hata"
+        return EMAIL_SUBJECT_PREFIX + "Telefon Listesi Güncellendi"
+
+    @staticmethod
+    def _sections(events):
+        for kind, heading in DIGEST_SECTIONS:
+            section_events = [event for event in events if event["kind"] == kind]
+            if kind == "list_update": section_events = section_events[-1:]
+            if section_events:
+                yield heading, section_events
+
+    @classmethod
+    def render(cls, events):
+        """(düz metin, HTML) gövdeleri döner."""
+        started = min(event["at"] for event in events).strftime('%Y-%m-%d %H:%M:%S')
+        intro = f"GSMArena'da değişiklikler tespit edildi ({started}):"
+        text_parts = [intro]
+        html_parts = [f"<p>{html_escape(intro)}</p>"]
+        for heading, section_events in cls._sections(events):
+            text_parts.append(f"\n{heading}:")
+            html_parts.append(f"<h3>{html_escape(heading)}</h3><ul>")
+            if section_events[0]["kind"] == "list_update": # Liste olayının başlığı yok, satırları doğrudan gösterilir
+                text_parts.extend(section_events[0]["details"])
+                html_parts.append("".join(f"<li>{html_escape(str(line))}</li>" for line in section_events[0]["details"]) + "</ul>")
+                continue
+            for event in section_events:
+                marker = "" if event["ok"] else "[HATA] "
+                text_parts.append(f"- {marker}{event['title']}" + (f" ({event['url']})" if event["url"] else ""))
+                text_parts.extend(f"  {detail}" for detail in event["details"])
+                title_html = html_escape(event["title"])
+                if event["url"]: title_html = f'<a href="{html_escape(event["url"])}">{title_html}</a>'
+                if not event["ok"]: title_html = f'<span style="color:#b00020">[HATA]</span> {title_html}'
+                details_html = "".join(f"<br>{html_escape(str(detail))}" for detail in event["details"])
+                html_parts.append(f"<li>{title_html}{details_html}</li>")
+            html_parts.append("</ul>")
+        return "\n".join(text_parts) + "\n", "<html><body>" + "".join(html_parts) + "</body></html>"
+
 def commit_and_push_data_file(file_path, commit_message):
+    """`file_path` tek bir yol ya da yol listesi olabilir; sadece var olan dosyalar eklenir."""
+    file_paths = [file_path] if isinstance(file_path, str) else list(file_path)
+    file_path = " ".join(path for path in file_paths if os.path.exists(path))
     try:
         os.system(f'git config --global user.name "GitHub Action Bot"')
         os.system(f'git config --global user.email "actions@github.com"')
@@ -176,7 +1021,10 @@ def commit_and_push_data_file(file_path, commit_message):
         # Push işlemi için workflow dosyasında `actions/checkout@v3` veya v4'ün `persist-credentials: true`
         # ve `GITHUB_TOKEN` için doğru izinlerin (contents: write) ayarlandığından emin olun.
         # Ya da Personal Access Token (PAT) kullanılıyorsa, checkout adımında ayarlanmalı.
-        if os.system('git push') != 0:
+        with profile_stage("git_push") as stage:
+            push_failed = os.system('git push') != 0
+            if push_failed: stage.outcome = "error"
+        if push_failed:
             print(f"Hata: '{file_path}' dosyası GitHub'a push edilemedi. Lütfen workflow izinlerini kontrol edin.")
             return False
         print(f"'{file_path}' dosyası başarıyla GitHub'a push edildi.")
@@ -186,7 +1034,29 @@ def commit_and_push_data_file(file_path, commit_message):
         return False
 
 # === Selenium Fonksiyonları (Önceki script'ten uyarlanmış) ===
-def setup_driver_options_selenium():
+def _load_selenium():
+    """Selenium ve webdriver_manager'ı ilk ihtiyaçta yükler; modül düzeyindeki isimleri doldurur."""
+    global webdriver, Service, By, WebDriverWait, EC, Options, ChromeDriverManager
+    global TimeoutException, NoSuchElementException, ElementClickInterceptedException
+    if webdriver is not None:
+        return
+    with profile_stage("selenium_import"):
+        from selenium import webdriver as selenium_webdriver
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from selenium.webdriver.common.by import By as SeleniumBy
+        from selenium.webdriver.support.ui import WebDriverWait as SeleniumWait
+        from selenium.webdriver.support import expected_conditions
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from webdriver_manager.chrome import ChromeDriverManager as DriverManager
+        from selenium.common import exceptions as selenium_exceptions
+    Service, By, WebDriverWait, EC, Options, ChromeDriverManager = ChromeService, SeleniumBy, SeleniumWait, expected_conditions, ChromeOptions, DriverManager
+    TimeoutException = selenium_exceptions.TimeoutException
+    NoSuchElementException = selenium_exceptions.NoSuchElementException
+    ElementClickInterceptedException = selenium_exceptions.ElementClickInterceptedException
+    webdriver = selenium_webdriver # En son atanır: diğer thread'ler yarım yüklenmiş isimleri görmesin
+
+def setup_driver_options_selenium(session=None):
+    _load_selenium()
     options = Options()
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -196,13 +1066,221 @@ def setup_driver_options_selenium():
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
-    options.add_argument('user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    for argument in (session or SESSION_POOL.sessions[0]).browser_arguments(): options.add_argument(argument) # UA (+ proxy) HTTP oturumuyla aynı
     options.add_argument("accept-language=tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7")
     options.page_load_strategy = 'eager'
     prefs = {"credentials_enable_service": False, "profile.password_manager_enabled": False}
+    if BROWSER_BLOCK_RESOURCES: # Hafif profil: okumadığımız her şey kapalı
+        for argument in LIGHTWEIGHT_BROWSER_ARGUMENTS: options.add_argument(argument)
+        prefs["profile.managed_default_content_settings.images"] = 2
+        prefs["profile.default_content_setting_values.notifications"] = 2
     options.add_experimental_option("prefs", prefs)
     return options
 
+# === Tarayıcı Kaynak Politikası ===
+# Spec ve review sayfalarında sadece HTML/JS metni okunur. Görseller, medya, fontlar ve reklam/analitik hostları
+# CDP Network.setBlockedURLs ile istek daha gönderilmeden engellenir (Fetch ile tek tek yakalamaya göre tarayıcıya
+# geri dönüş yok). <img src> gibi öznitelikler DOM'da kaldığından "Resim URL" çıkarımı etkilenmez.
+LIGHTWEIGHT_BROWSER_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--mute-audio",
+    "--no-first-run",
+]
+BLOCKED_RESOURCE_EXTENSIONS = ["jpg", "jpeg", "png", "gif", "webp", "avif", "svg", "ico", "bmp",
+                               "woff", "woff2", "ttf", "otf", "eot", "mp4", "webm", "mp3", "m4a", "ogg"]
+
+def blocked_url_patterns(hosts=None):
+    hosts = BROWSER_BLOCKED_HOSTS if hosts is None else hosts
+    patterns = []
+    for extension in BLOCKED_RESOURCE_EXTENSIONS: # Sorgu dizesi olan URL'ler de yakalanır
+        patterns += [f"*.{extension}", f"*.{extension}?*"]
+    for host in hosts:
+        patterns += [f"*://{host}/*", f"*://*.{host}/*"]
+    return patterns
+
+def apply_browser_resource_policy(driver):
+    """Yeni açılan tarayıcıda engelleme listesini etkinleştirir; CDP yoksa sadece tercihler (görsel kapalı) kalır."""
+    if not BROWSER_BLOCK_RESOURCES:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns()})
+        return True
+    except Exception as e:
+        print(f"Uyarı (Selenium): Kaynak engelleme etkinleştirilemedi. {e}")
+        return False
+
+def chrome_rss_mb(driver):
+    """chromedriver'ın altındaki tüm Chrome süreçlerinin toplam RSS'i (MB). /proc olmayan sistemlerde None."""
+    try:
+        root_pid = driver.service.process.pid
+        children = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit(): continue
+            try:
+                with open(f'/proc/{entry}/stat', 'rb') as f:
+                    parent_pid = int(f.read().rsplit(b')', 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(parent_pid, []).append(int(entry))
+        total_kb, pending = 0, list(children.get(root_pid, []))
+        while pending:
+            pid = pending.pop()
+            pending.extend(children.get(pid, []))
+            try:
+                with open(f'/proc/{pid}/status', 'r', encoding='utf-8') as f:
+                    total_kb += next((int(line.split()[1]) for line in f if line.startswith('VmRSS:')), 0)
+            except OSError:
+                continue
+        return total_kb / 1024
+    except Exception:
+        return None
+
+def get_chromedriver_path(force_install=False):
+    """Diskte saklanan chromedriver yolunu döner; yoksa ChromeDriverManager ile indirip kaydeder."""
+    if not force_install and os.path.exists(CHROMEDRIVER_PATH_CACHE_FILE):
+        try:
+            with open(CHROMEDRIVER_PATH_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached_path = f.read().strip()
+            if cached_path and os.path.isfile(cached_path) and os.access(cached_path, os.X_OK):
+                return cached_path
+        except IOError as e:
+            print(f"Uyarı: {CHROMEDRIVER_PATH_CACHE_FILE} okunamadı. {e}")
+    _load_selenium()
+    print("ChromeDriverManager.install() çağrılıyor...")
+    driver_path = ChromeDriverManager().install()
+    try:
+        with open(CHROMEDRIVER_PATH_CACHE_FILE, 'w', encoding='utf-8') as f:
+            f.write(driver_path)
+    except IOError as e:
+        print(f"Uyarı: chromedriver yolu {CHROMEDRIVER_PATH_CACHE_FILE} dosyasına yazılamadı. {e}")
+    return driver_path
+
+def start_chrome_driver_selenium(session=None):
+    _load_selenium()
+    try:
+        driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=setup_driver_options_selenium(session))
+    except Exception as e: # Saklanan driver Chrome sürümüyle uyumsuz olabilir, bir kez taze kurulumla dene
+        print(f"Uyarı (Selenium): Saklanan chromedriver ile başlatılamadı, yeniden kuruluyor. {e}")
+        driver = webdriver.Chrome(service=Service(get_chromedriver_path(force_install=True)), options=setup_driver_options_selenium(session))
+    apply_browser_resource_policy(driver)
+    driver.gsm_session = session
+    return driver
+
+def note_driver_page(driver, count=1):
+    """Havuzun tarayıcıyı ne zaman yenileyeceğini bilmesi için yüklenen sayfaları sayar."""
+    driver.gsm_pages_loaded = getattr(driver, 'gsm_pages_loaded', 0) + count
+
+def _driver_is_alive(driver):
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+class WebDriverPool:
+    """Bir çalıştırma boyunca açık tutulan Chrome havuzu.
+
+    Tarayıcılar ilk ihtiyaçta başlatılır (en fazla `size` adet) ve `acquire`/`release` ile
+    telefonlara kiralanır. Çökmüş ya da `max_pages` sayfayı aşmış tarayıcı iade edilirken kapatılır,
+    yerine bir sonraki kiralamada yenisi açılır.
+    """
+
+    def __init__(self, size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self._idle_drivers = [] # LIFO: en son iade edilen (ısınmış) tarayıcı önce verilir
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock) # Boşta tarayıcı ya da boş yer açılınca bekleyenler uyandırılır
+        self._started_count = 0
+        self._closed = False
+        self._release_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def acquire(self):
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WebDriverPool kapatılmış.")
+                if self._idle_drivers:
+                    return self._idle_drivers.pop()
+                if self._started_count < self.size:
+                    self._started_count += 1
+                    break
+                self._available.wait() # Tarayıcı iadesi, yenileme ya da başarısız başlatma bekleniyor
+        try:
+            print("webdriver.Chrome çağrılıyor...")
+            with profile_stage("driver_start"):
+                driver = start_chrome_driver_selenium(SESSION_POOL.next_browser_session())
+            print("WebDriver başarıyla başlatıldı.")
+            return driver
+        except Exception:
+            self._slot_freed()
+            raise
+
+    def _slot_freed(self):
+        with self._available:
+            self._started_count -= 1
+            self._available.notify()
+
+    def _should_sample_rss(self):
+        """chrome_rss_mb tüm /proc'u dolaştığından her iadede değil, profil yazılıyorsa N iadede bir ölçülür."""
+        if CHROME_RSS_SAMPLE_EVERY <= 0 or not (PROFILE_FILE or PROMETHEUS_FILE):
+            return False
+        with self._lock:
+            self._release_count += 1
+            return (self._release_count - 1) % CHROME_RSS_SAMPLE_EVERY == 0 # İlk iade hep ölçülür
+
+    def release(self, driver, broken=False):
+        if self._should_sample_rss():
+            rss = chrome_rss_mb(driver)
+            if rss is not None: PROFILER.observe("chrome_rss_mb", rss)
+        session = getattr(driver, 'gsm_session', None)
+        if session is not None and not broken:
+            try: session.absorb_browser_cookies(driver.get_cookies())
+            except Exception: pass
+        recycle = broken or self._closed or not _driver_is_alive(driver) or getattr(driver, 'gsm_pages_loaded', 0) >= self.max_pages
+        if not recycle:
+            with self._available:
+                self._idle_drivers.append(driver)
+                self._available.notify()
+            return
+        print("WebDriver yenileniyor (çökme veya sayfa limiti).")
+        try: driver.quit()
+        except Exception: pass
+        self._slot_freed()
+
+    def close(self):
+        with self._available:
+            self._closed = True
+            idle_drivers, self._idle_drivers = self._idle_drivers, []
+            self._started_count -= len(idle_drivers)
+            self._available.notify_all()
+        for driver in idle_drivers:
+            try: driver.quit()
+            except Exception: pass
+
+def _flatten_html_lines(content_html):
+    """innerHTML'i <br> satırlarına böler, etiketleri temizler ve satırları birleştirir."""
+    content_html = (content_html or '').strip()
+    content_text_lines = [re.sub(r'<[^>]+>', '', line).strip() for line in content_html.split('<br>') if re.sub(r'<[^>]+>', '', line).strip()]
+    clean_text = "\n".join(content_text_lines)
+    clean_text = re.sub(r'\s*\n\s*', '\n', clean_text).strip()
+    clean_text = re.sub(r' +', ' ', clean_text).strip()
+    return clean_text
+
 def get_element_text_by_strategy_selenium(driver, wait, spec_info, default_value="Bilgi Yok"):
     label = spec_info["label"]
     selector_value = spec_info["value"]
@@ -210,40 +1288,43 @@ def get_element_text_by_strategy_selenium(driver, wait, spec_info, default_value
     process_as_html = spec_info.get("process_as_html", False)
     target_attribute = spec_info.get("attribute")
     element = None
-    try:
-        if selector_type == "data-spec":
-            base_selector = spec_info.get("base_selector", "#specs-list td.nfo")
-            if spec_info.get("child_a"):
-                selector_css_for_parent = f"{base_selector}[data-spec='{selector_value}']"
-                parent_element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector_css_for_parent)))
-                element = parent_element.find_element(By.TAG_NAME, "a")
-            else:
-                selector_css = f"{base_selector}[data-spec='{selector_value}']"
-                element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector_css)))
-        elif selector_type == "xpath":
-            element = wait.until(EC.visibility_of_element_located((By.XPATH, selector_value)))
-        elif selector_type == "css":
-            element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector_value)))
-
-        if element:
-            if target_attribute:
-                attr_content = element.get_attribute(target_attribute)
-                return attr_content.strip() if attr_content and attr_content.strip() else default_value
-            elif process_as_html:
-                content_html = element.get_attribute('innerHTML').strip()
-                content_text_lines = [re.sub(r'<[^>]+>', '', line).strip() for line in content_html.split('<br>') if re.sub(r'<[^>]+>', '', line).strip()]
-                clean_text = "\n".join(content_text_lines)
-                clean_text = re.sub(r'\s*\n\s*', '\n', clean_text).strip()
-                clean_text = re.sub(r' +', ' ', clean_text).strip()
-                return clean_text if clean_text else default_value
-            else:
-                content = driver.execute_script("return arguments[0].innerText || arguments[0].textContent;", element).strip()
-                return content if content else default_value
-        return default_value
-    except (TimeoutException, NoSuchElementException):
-        return default_value
-    except Exception:
-        return default_value
+    # Hangi selektörün 10 sn'lik beklemeleri yaktığını görmek için her arama ayrı kaydedilir
+    with profile_stage("spec_lookup", selector_value if selector_type == "data-spec" else label) as stage:
+        try:
+            if selector_type == "data-spec":
+                base_selector = spec_info.get("base_selector", "#specs-list td.nfo")
+                if spec_info.get("child_a"):
+                    selector_css_for_parent = f"{base_selector}[data-spec='{selector_value}']"
+                    parent_element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector_css_for_parent)))
+                    element = parent_element.find_element(By.TAG_NAME, "a")
+                else:
+                    selector_css = f"{base_selector}[data-spec='{selector_value}']"
+                    element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector_css)))
+            elif selector_type == "xpath":
+                element = wait.until(EC.visibility_of_element_located((By.XPATH, selector_value)))
+            elif selector_type == "css":
+                element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector_value)))
+
+            if element:
+                if target_attribute:
+                    attr_content = element.get_attribute(target_attribute)
+                    return attr_content.strip() if attr_content and attr_content.strip() else default_value
+                elif process_as_html:
+                    clean_text = _flatten_html_lines(element.get_attribute('innerHTML'))
+                    return clean_text if clean_text else default_value
+                else:
+                    content = driver.execute_script("return arguments[0].innerText || arguments[0].textContent;", element).strip()
+                    return content if content else default_value
+            return default_value
+        except TimeoutException:
+            stage.outcome = "timeout" # general_wait_time kadar beklendi
+            return default_value
+        except NoSuchElementException:
+            stage.outcome = "missing"
+            return default_value
+        except Exception:
+            stage.outcome = "error"
+            return default_value
 
 def _handle_popups_selenium(driver, wait_time=3): # GitHub Actions'da popup'lar daha az sorun olmalı, yine de dursun.
     popup_selectors = [
@@ -259,72 +1340,321 @@ def _handle_popups_selenium(driver, wait_time=3): # GitHub Actions'da popup'lar
         except: pass
     return False
 
+REVIEW_LINK_XPATH = "//ul[contains(@class, 'article-info-meta')]//li[contains(@class, 'article-info-meta-link-review')]//a[normalize-space()='Review' or normalize-space()='İnceleme']"
+
 def check_review_link_element_selenium(driver, wait):
     _handle_popups_selenium(driver)
     try:
-        return wait.until(EC.element_to_be_clickable((
-            By.XPATH,
-            "//ul[contains(@class, 'article-info-meta')]//li[contains(@class, 'article-info-meta-link-review')]//a[normalize-space()='Review' or normalize-space()='İnceleme']"
-        )))
+        return wait.until(EC.element_to_be_clickable((By.XPATH, REVIEW_LINK_XPATH)))
     except: return None
 
+MAX_REVIEW_PAGES = 10 # Actions'da çok uzun sürmemesi için limit düşürülebilir
+REVIEW_NEXT_PAGE_XPATH = "//a[contains(@class, 'pages-next') and not(contains(@class, 'disabled')) and @href and string-length(normalize-space(@href)) > 1]"
+
 def fetch_review_text_from_pages_selenium(driver, wait_critical, wait_general):
-    all_review_texts = []
-    page_count = 1
-    MAX_REVIEW_PAGES = 10 # Actions'da çok uzun sürmemesi için limit düşürülebilir
+    """Review sayfalarını gezer; her sayfanın paragrafları geldikçe spool dosyasına yazılır.
+    ReviewSpool ya da (metin yoksa/yüklenemediyse) açıklama metni döner."""
     try:
         wait_critical.until(EC.visibility_of_element_located((By.ID, "review-body")))
     except TimeoutException:
         return "İnceleme İçeriği Yüklenemedi (review-body ilk yüklemede zaman aşımı)"
 
+    review_spool = ReviewSpool(driver.current_url)
+    try:
+        _collect_review_pages_selenium(driver, wait_critical, wait_general, review_spool)
+    except BaseException:
+        review_spool.discard()
+        raise
+    if review_spool.is_empty():
+        review_spool.discard()
+        return REVIEW_NOT_FOUND_TEXT
+    return review_spool.close()
+
+def _collect_review_pages_selenium(driver, wait_critical, wait_general, review_spool):
+    page_count = 1
+
     while page_count <= MAX_REVIEW_PAGES:
         _handle_popups_selenium(driver)
         try:
             review_body = wait_general.until(EC.visibility_of_element_located((By.ID, "review-body")))
-            paragraphs = review_body.find_elements(By.XPATH, ".//p[string-length(normalize-space(self::*)) > 0]")
-            current_page_text = [driver.execute_script("return arguments[0].innerText;", p).strip() for p in paragraphs if driver.execute_script("return arguments[0].innerText;", p).strip()]
-            all_review_texts.extend(current_page_text)
+            # Tüm paragraflar tek execute_script çağrısıyla alınır
+            current_page_text = driver.execute_script(
+                "return Array.from(arguments[0].querySelectorAll('p')).map(p => (p.innerText || '').trim()).filter(t => t.length > 0);",
+                review_body
+            )
+            review_spool.write_page(current_page_text)
         except: pass # Hata olursa atla, sonraki sayfaya geçmeyi dene
 
         try:
-            next_page_link_xpath = "//a[contains(@class, 'pages-next') and not(contains(@class, 'disabled')) and @href and string-length(normalize-space(@href)) > 1]"
-            next_page_link = wait_general.until(EC.element_to_be_clickable((By.XPATH, next_page_link_xpath)))
+            next_page_link = wait_general.until(EC.element_to_be_clickable((By.XPATH, REVIEW_NEXT_PAGE_XPATH)))
+            HTTP_CLIENT.wait_for_turn(driver.current_url)
             driver.execute_script("arguments[0].click();", next_page_link)
+            note_driver_page(driver)
             page_count += 1
             wait_critical.until(EC.visibility_of_element_located((By.ID, "review-body"))) # Yeni sayfanın yüklenmesini bekle
             time.sleep(0.5) 
         except: break # Sonraki sayfa yoksa veya tıklanamazsa döngüyü bitir
-    return "\n\n".join(all_review_texts) if all_review_texts else "İnceleme Metni Bulunamadı"
 
-def summarize_with_gemini_selenium(text_to_summarize, api_key, model_name="gemini-1.5-flash-latest"): # Daha hızlı model
-    if not api_key: return f"Gemini API Anahtarı Eksik ({text_to_summarize[:50 if text_to_summarize else 0]}...)"
-    if not text_to_summarize or text_to_summarize.startswith("İnceleme Metni Bulunamadı") or text_to_summarize.startswith("İnceleme İçeriği Yüklenemedi"):
-        return text_to_summarize
-    
-    api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={api_key}"
-    prompt = (
-        "Aşağıdaki İngilizce telefon inceleme metnini, bir editörün yazdığı gibi akıcı ve bilgilendirici bir şekilde TÜRKÇE'ye çevir ve özetle. "
-        "Anahtar özelliklere (kamera, performans, batarya) odaklan. "
-        "Sadece çevrilmiş ve özetlenmiş TÜRKÇE metni ver, başka bir açıklama ekleme.\n\n"
-        f"KAYNAK METİN:\n{text_to_summarize}"
-    ) # Prompt basitleştirildi.
+# === Review Biriktirme (Spool) ===
+# Review sayfaları geldikçe gzip'li bir dosyaya yazılır; tam metin hiçbir zaman tek string olarak bellekte tutulmaz.
+# Gemini parçaları dosyadan okunarak üretilir, PHP yükü JSON olarak parça parça akıtılır (chunked gövde) ve kuyruktaki
+# kayıtlar metnin kendisi yerine {"$review_file": yol} referansı taşır. Dosya, gönderim onaylanınca silinir.
+REVIEW_PARAGRAPH_SEPARATOR = "\n\n"
+REVIEW_NOT_FOUND_TEXT = "İnceleme Metni Bulunamadı"
+
+class ReviewSpool:
+    def __init__(self, source_url, spool_dir=REVIEW_SPOOL_DIR):
+        os.makedirs(spool_dir, exist_ok=True)
+        prefix = hashlib.sha256(source_url.encode('utf-8')).hexdigest()[:16] + "-"
+        file_descriptor, self.path = tempfile.mkstemp(prefix=prefix, suffix=".txt.gz", dir=spool_dir)
+        os.close(file_descriptor) # gzip'e verilen dosya nesnesi GzipFile.close() ile kapanmaz; yol üzerinden açılır
+        self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        self._sha256 = hashlib.sha256()
+        self.paragraph_count = 0
+        self.char_count = 0
+        self.page_count = 0
+
+    def write_page(self, paragraphs):
+        """Bir sayfanın paragraflarını dosyaya ekler."""
+        for paragraph in paragraphs:
+            if not paragraph: continue
+            piece = (REVIEW_PARAGRAPH_SEPARATOR if self.paragraph_count else "") + paragraph
+            self._file.write(piece)
+            self._sha256.update(piece.encode('utf-8'))
+            self.paragraph_count += 1
+            self.char_count += len(piece)
+        self.page_count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return self
+
+    def discard(self):
+        self.close()
+        try: os.remove(self.path)
+        except OSError: pass
+
+    @property
+    def sha256(self):
+        return self._sha256.hexdigest()
+
+    def is_empty(self):
+        return self.paragraph_count == 0
+
+    def iter_paragraphs(self):
+        """Paragrafları dosyadan tek tek okur (satır satır; boş satır paragraf sınırıdır)."""
+        self.close()
+        current = []
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if line:
+                    current.append(line)
+                elif current:
+                    yield "\n".join(current)
+                    current = []
+        if current:
+            yield "\n".join(current)
+
+    def to_ref(self):
+        self.close() # Referans yazılmadan önce dosya diske tamamen yazılmış olmalı
+        return {"$review_file": self.path, "sha256": self.sha256, "chars": self.char_count}
+
+def _review_digest(review):
+    """Review içeriğinin sha256'sı (spool ya da düz metin)."""
+    if isinstance(review, ReviewSpool):
+        return review.sha256
+    if isinstance(review, dict) and "$review_file" in review:
+        return review["sha256"]
+    return hashlib.sha256(review.encode('utf-8')).hexdigest() if review else None
+
+def _review_ref_default(value):
+    """Kuyruğa yazarken: spool yerine dosya referansı."""
+    if isinstance(value, ReviewSpool):
+        return value.to_ref()
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+def _review_hash_default(value):
+    """Hash için: dosya yolu değil içerik hash'i (aynı metin farklı çalıştırmada aynı hash'i verir)."""
+    if isinstance(value, ReviewSpool):
+        return {"$review_sha256": value.sha256}
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+def _review_file_paths(value):
+    """Bir yükteki (iç içe) review dosyası referanslarının yolları."""
+    if isinstance(value, ReviewSpool):
+        yield value.path
+    elif isinstance(value, dict):
+        if "$review_file" in value:
+            yield value["$review_file"]
+        else:
+            for item in value.values(): yield from _review_file_paths(item)
+    elif isinstance(value, list):
+        for item in value: yield from _review_file_paths(item)
+
+def discard_review_files(value):
+    for path in set(_review_file_paths(value)):
+        try: os.remove(path)
+        except OSError: pass
+
+def _iter_review_file_json(path, block_size=64 * 1024):
+    """gzip'li review dosyasını JSON string'i olarak parça parça üretir."""
+    if not os.path.exists(path): # Dosya silinmişse kayıt yine de gönderilebilsin
+        yield json.dumps("İnceleme Metni Yok (yerel review dosyası bulunamadı)", ensure_ascii=False).encode('utf-8')
+        return
+    yield b'"'
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        while True:
+            block = f.read(block_size)
+            if not block: break
+            yield json.dumps(block, ensure_ascii=False)[1:-1].encode('utf-8')
+    yield b'"'
+
+def iter_payload_json(value):
+    """Değeri JSON (UTF-8 bytes) olarak parça parça üretir; review dosyaları okunarak akıtılır."""
+    if isinstance(value, ReviewSpool):
+        yield from _iter_review_file_json(value.close().path)
+    elif isinstance(value, dict) and "$review_file" in value:
+        yield from _iter_review_file_json(value["$review_file"])
+    elif isinstance(value, dict):
+        yield b"{"
+        for index, (key, item) in enumerate(value.items()):
+            yield (b"," if index else b"") + json.dumps(key, ensure_ascii=False).encode('utf-8') + b":"
+            yield from iter_payload_json(item)
+        yield b"}"
+    elif isinstance(value, (list, tuple)):
+        yield b"["
+        for index, item in enumerate(value):
+            if index: yield b","
+            yield from iter_payload_json(item)
+        yield b"]"
+    else:
+        yield json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+class StreamingJsonBody:
+    """requests'e verilen gövde. Her gönderim denemesinde JSON baştan üretilir; uzunluğu bilinmediği için
+    istek 'Transfer-Encoding: chunked' ile gider."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __iter__(self):
+        return iter_payload_json(self.value)
+
+def php_request_body(value):
+    return StreamingJsonBody(value) if PHP_STREAM_UPLOADS else b"".join(iter_payload_json(value))
+
+GEMINI_SUMMARY_PROMPT = (
+    "Aşağıdaki İngilizce telefon inceleme metnini, bir editörün yazdığı gibi akıcı ve bilgilendirici bir şekilde TÜRKÇE'ye çevir ve özetle. "
+    "Anahtar özelliklere (kamera, performans, batarya) odaklan. "
+    "Sadece çevrilmiş ve özetlenmiş TÜRKÇE metni ver, başka bir açıklama ekleme.\n\n"
+    "KAYNAK METİN:\n"
+) # Prompt basitleştirildi.
+GEMINI_CHUNK_PROMPT = (
+    "Aşağıdaki metin İngilizce bir telefon incelemesinin {part}/{total}. bölümüdür. "
+    "Bu bölümdeki önemli bilgileri (kamera, performans, batarya, ekran, fiyat) kaybetmeden TÜRKÇE'ye çevir ve kısaca özetle. "
+    "Sadece TÜRKÇE özeti ver, başka bir açıklama ekleme.\n\n"
+    "KAYNAK METİN:\n"
+)
+GEMINI_MERGE_PROMPT = (
+    "Aşağıda bir telefon incelemesinin bölüm bölüm çıkarılmış TÜRKÇE özetleri var. "
+    "Bunları bir editörün yazdığı gibi akıcı ve bilgilendirici tek bir TÜRKÇE özet halinde birleştir; tekrarları çıkar. "
+    "Anahtar özelliklere (kamera, performans, batarya) odaklan. "
+    "Sadece birleştirilmiş TÜRKÇE metni ver, başka bir açıklama ekleme.\n\n"
+    "BÖLÜM ÖZETLERİ:\n"
+)
+
+def _iter_review_chunks(paragraphs, max_tokens=GEMINI_CHUNK_TOKENS):
+    """Paragrafları, her biri yaklaşık `max_tokens` token olan parçalar halinde üretir."""
+    max_chars = max(1, max_tokens * GEMINI_CHARS_PER_TOKEN)
+    current = ""
+    for paragraph in paragraphs:
+        while len(paragraph) > max_chars: # Tek paragraf bile sığmıyorsa sert böl
+            if current: yield current; current = ""
+            yield paragraph[:max_chars]
+            paragraph = paragraph[max_chars:]
+        if current and len(current) + 2 + len(paragraph) > max_chars:
+            yield current
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current: yield current
+
+def _bounded_ordered_map(function, items, max_workers):
+    """executor.map gibi sırayı korur ama girdiyi önceden tüketmez: aynı anda en fazla `max_workers` iş bellekte."""
+    pending = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= max_workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+def _gemini_generate(prompt, api_key, model_name):
+    """Tek bir generateContent çağrısı. (başarılı_mı, metin_veya_hata) döner; başarılı sonuçlar önbelleğe yazılır."""
+    cache = get_page_cache()
+    cache_key = _hash_json({"model": model_name, "prompt": prompt})
+    cached_summary = cache.get_summary(cache_key) if cache else None
+    if cached_summary is not None:
+        PROFILER.record("gemini", 0.0, "cached")
+        return True, cached_summary
+
+    api_url = f"{GEMINI_API_BASE_URL}/models/{model_name}:generateContent?key={api_key}"
     payload = {"contents": [{"parts": [{"text": prompt}]}], "generationConfig": {"temperature": 0.5, "maxOutputTokens": 4096}}
     headers = {'Content-Type': 'application/json'}
     try:
-        response = requests.post(api_url, headers=headers, data=json.dumps(payload), timeout=180) # Timeout düşürüldü
+        with GEMINI_SLOTS, profile_stage("gemini") as stage: # Tarayıcı/PHP işlerinden bağımsız Gemini limiti
+            response = HTTP_CLIENT.post(api_url, headers=headers, data=json.dumps(payload), idempotent=True) # Timeout: HTTP_HOST_SETTINGS; yan etkisiz, 503 "overloaded" tekrar denenir
+            if not response.ok: stage.outcome = f"http_{response.status_code}"
         response.raise_for_status()
         response_json = response.json()
         if 'candidates' in response_json and response_json['candidates'] and \
            'content' in response_json['candidates'][0] and 'parts' in response_json['candidates'][0]['content']:
-            return response_json['candidates'][0]['content']['parts'][0]['text'].strip()
-        return f"Gemini API Yanıt Formatı Hatalı ({model_name})"
+            summary = response_json['candidates'][0]['content']['parts'][0]['text'].strip()
+            if cache: cache.save_summary(cache_key, model_name, summary)
+            return True, summary
+        return False, f"Gemini API Yanıt Formatı Hatalı ({model_name})"
     except Exception as e:
-        return f"Gemini API Hatası ({model_name}): {str(e)[:100]}"
+        return False, f"Gemini API Hatası ({model_name}): {str(e)[:100]}"
+
+def summarize_with_gemini_selenium(text_to_summarize, api_key, model_name=GEMINI_MODEL_NAME):
+    """Uzun incelemeleri parçalara bölüp paralel özetler, sonra tek bir birleştirme çağrısı yapar.
+
+    `text_to_summarize` düz metin ya da ReviewSpool olabilir; spool parçaları dosyadan okunarak üretilir ve aynı
+    anda en fazla GEMINI_CONCURRENCY parça bellekte bulunur. Her çağrının sonucu (model + prompt hash'i ile)
+    önbelleğe yazıldığından tekrar çalıştırmalar ve PHP yeniden denemeleri aynı metin için Gemini'ye tekrar gitmez.
+    """
+    if isinstance(text_to_summarize, ReviewSpool):
+        paragraph_source = text_to_summarize.iter_paragraphs
+        if text_to_summarize.is_empty(): return REVIEW_NOT_FOUND_TEXT
+    else:
+        if not api_key: return f"Gemini API Anahtarı Eksik ({text_to_summarize[:50 if text_to_summarize else 0]}...)"
+        if not text_to_summarize or text_to_summarize.startswith(REVIEW_NOT_FOUND_TEXT) or text_to_summarize.startswith("İnceleme İçeriği Yüklenemedi"):
+            return text_to_summarize
+        paragraph_source = lambda: iter(text_to_summarize.split("\n\n"))
+    if not api_key: return "Gemini API Anahtarı Eksik"
+
+    chunk_count = sum(1 for _ in _iter_review_chunks(paragraph_source())) # Sadece sayım: metin bellekte birikmez
+    if chunk_count == 1:
+        return _gemini_generate(GEMINI_SUMMARY_PROMPT + next(_iter_review_chunks(paragraph_source())), api_key, model_name)[1]
+
+    print(f"İnceleme {chunk_count} parçaya bölünerek özetleniyor.")
+    chunk_prompts = (GEMINI_CHUNK_PROMPT.format(part=i + 1, total=chunk_count) + chunk for i, chunk in enumerate(_iter_review_chunks(paragraph_source())))
+    chunk_results = []
+    for success, result_text in _bounded_ordered_map(lambda prompt: _gemini_generate(prompt, api_key, model_name), chunk_prompts, min(GEMINI_CONCURRENCY, chunk_count)):
+        if not success: return result_text
+        chunk_results.append(result_text)
+
+    merge_input = "\n\n".join(f"[Bölüm {i + 1}]\n{result_text}" for i, result_text in enumerate(chunk_results))
+    return _gemini_generate(GEMINI_MERGE_PROMPT + merge_input, api_key, model_name)[1]
 
 phone_specs_definitions = [
     {"label": "Model Adı", "type": "data-spec", "value": "modelname", "base_selector": "h1.specs-phone-name-title", "critical": True, "default_value": "Model Adı Yok"},
-    {"label": "Resim URL", "type": "css", "value": "div.specs-photo-main > a > img", "attribute": "src", "default_value": "Resim Yok"},
-    {"label": "Network Teknolojisi", "type": "xpath", "value": "(//*[@id='specs-list']//th[contains(text(),'Network')]//following-sibling::tr[1]//td[@data-spec='nettech'])[1] | (//*[@id='specs-list']//a[@href='network-bands.php3']/../following-sibling::td[@data-spec='nettech'])[1] | //*[@data-spec='nettech'][1]", "critical": True},
+    {"label": "Resim URL", "type": "css", "value": "div.specs-photo-main > a > img", "attribute": "src", "default_value": "Resim Yok", "key": "image"},
+    {"label": "Network Teknolojisi", "type": "xpath", "value": "(//*[@id='specs-list']//th[contains(text(),'Network')]//following-sibling::tr[1]//td[@data-spec='nettech'])[1] | (//*[@id='specs-list']//a[@href='network-bands.php3']/../following-sibling::td[@data-spec='nettech'])[1] | //*[@data-spec='nettech'][1]", "index_key": "nettech", "critical": True},
     {"label": "Duyurulma Tarihi", "type": "data-spec", "value": "year"},
     {"label": "Piyasaya Çıkış Durumu", "type": "data-spec", "value": "status"},
     {"label": "Boyutlar", "type": "data-spec", "value": "dimensions"},
@@ -336,7 +1666,7 @@ phone_specs_definitions = [
     {"label": "Ekran Boyutu", "type": "data-spec", "value": "displaysize"},
     {"label": "Ekran Çözünürlüğü", "type": "data-spec", "value": "displayresolution"},
     {"label": "Ekran Koruması", "type": "data-spec", "value": "displayprotection"},
-    {"label": "Ekran Diğer Özellikler", "type": "xpath", "value": "//table[.//th[contains(text(),'Display')]]//td[@data-spec='displayother']","process_as_html":True},
+    {"label": "Ekran Diğer Özellikler", "type": "xpath", "value": "//table[.//th[contains(text(),'Display')]]//td[@data-spec='displayother']", "index_key": "displayother", "process_as_html":True},
     {"label": "İşletim Sistemi", "type": "data-spec", "value": "os"},
     {"label": "Yonga Seti", "type": "data-spec", "value": "chipset"},
     {"label": "CPU", "type": "data-spec", "value": "cpu"},
@@ -349,8 +1679,8 @@ phone_specs_definitions = [
     {"label": "Ön Kamera Modülleri", "type": "data-spec", "value": "cam2modules", "process_as_html": True},
     {"label": "Ön Kamera Özellikleri", "type": "data-spec", "value": "cam2features"},
     {"label": "Ön Kamera Video", "type": "data-spec", "value": "cam2video", "process_as_html": True},
-    {"label": "Hoparlör", "type": "xpath", "value": "//table[.//th[text()='Sound']]//td[@class='ttl']/a[normalize-space(text())='Loudspeaker']/parent::td/following-sibling::td[@class='nfo']"},
-    {"label": "3.5mm Jack", "type": "xpath", "value": "//table[.//th[text()='Sound']]//td[@class='ttl']/a[normalize-space(text())='3.5mm jack']/parent::td/following-sibling::td[@class='nfo']"},
+    {"label": "Hoparlör", "type": "xpath", "value": "//table[.//th[text()='Sound']]//td[@class='ttl']/a[normalize-space(text())='Loudspeaker']/parent::td/following-sibling::td[@class='nfo']", "section": "Sound", "row": "Loudspeaker", "key": "loudspeaker"},
+    {"label": "3.5mm Jack", "type": "xpath", "value": "//table[.//th[text()='Sound']]//td[@class='ttl']/a[normalize-space(text())='3.5mm jack']/parent::td/following-sibling::td[@class='nfo']", "section": "Sound", "row": "3.5mm jack", "key": "jack"},
     {"label": "WLAN", "type": "data-spec", "value": "wlan"},
     {"label": "Bluetooth", "type": "data-spec", "value": "bluetooth"},
     {"label": "Konumlandırma (GPS)", "type": "data-spec", "value": "gps", "process_as_html": True},
@@ -359,47 +1689,846 @@ phone_specs_definitions = [
     {"label": "USB", "type": "data-spec", "value": "usb"},
     {"label": "Sensörler", "type": "data-spec", "value": "sensors", "process_as_html": True},
     {"label": "Batarya Tipi", "type": "data-spec", "value": "batdescription1", "process_as_html": True},
-    {"label": "Şarj Özellikleri", "type": "xpath", "value": "//table[.//th[text()='Battery']]//td[@class='ttl']/a[normalize-space(text())='Charging']/parent::td/following-sibling::td[@class='nfo']", "process_as_html": True},
+    {"label": "Şarj Özellikleri", "type": "xpath", "value": "//table[.//th[text()='Battery']]//td[@class='ttl']/a[normalize-space(text())='Charging']/parent::td/following-sibling::td[@class='nfo']", "section": "Battery", "row": "Charging", "process_as_html": True, "key": "charging"},
     {"label": "Renkler", "type": "data-spec", "value": "colors"},
-    {"label": "Fiyat", "type": "xpath", "value": "(//td[@data-spec='price']/a|//td[@data-spec='price'])[1]"},
+    {"label": "Fiyat", "type": "xpath", "value": "(//td[@data-spec='price']/a|//td[@data-spec='price'])[1]", "index_key": "price"},
     {"label": "Performans Testleri (AnTuTu, GeekBench etc.)", "type": "data-spec", "value": "tbench", "process_as_html": True},
 ]
 
-def fetch_phone_data_selenium(url, specs_definitions, gemini_api_key_param):
+# === Telefon Kaydı ===
+# Spec'ler Türkçe etiketle değil, sayfadaki data-spec kimliğiyle (ör. "displaysize") tutulur; data-spec'i olmayan
+# tanımlar "key" alanıyla adlandırılır. Bulunamayan alan None'dır, sayfa hiç okunamadıysa kayıt `error` taşır.
+# Etiketler ve varsayılan metinler ("Bilgi Yok" vb.) yalnızca PHP yükü ve kullanıcıya gösterilen satırlar üretilirken eklenir.
+SPEC_EXTRACTION_FAILED_TEXT = "Veri Çekilemedi (Selenium)" # Eski kayıtlardaki hata değeri
+MODEL_NAME_SPEC_KEY = "modelname"
+IMAGE_SPEC_KEY = "image"
+ANNOUNCED_SPEC_KEY = "year"
+
+def spec_key(spec_def):
+    return spec_def.get("key") or spec_def.get("index_key") or spec_def["value"]
+
+def spec_default(spec_def):
+    return spec_def.get("default_value", "Bilgi Yok")
+
+SPEC_DEFINITIONS_BY_KEY = {spec_key(spec_def): spec_def for spec_def in phone_specs_definitions}
+SPEC_KEY_BY_LABEL = {spec_def["label"]: spec_key(spec_def) for spec_def in phone_specs_definitions}
+
+def spec_label(key):
+    spec_def = SPEC_DEFINITIONS_BY_KEY.get(key)
+    return spec_def["label"] if spec_def else key
+
+def spec_display_value(key, value):
+    """None (bulunamadı) değerini tanımın varsayılan metnine çevirir."""
+    if value is not None:
+        return value
+    spec_def = SPEC_DEFINITIONS_BY_KEY.get(key)
+    return spec_default(spec_def) if spec_def else "Bilgi Yok"
+
+@dataclass(slots=True)
+class PhoneRecord:
+    """Bir telefonun çıkarım sonucu. `specs`: spec anahtarı -> değer (None = sayfada yok). `error` doluysa
+    sayfa/tarayıcı hatası nedeniyle spec'ler okunamamıştır. `partial` kayıtlar (--recheck) sadece değişen alanları taşır.
+    Review alanları metin ya da ReviewSpool (outbox'tan okunduğunda dosya referansı) olabilir."""
+    url: str
+    name: str | None = None
+    specs: dict = field(default_factory=dict)
+    review_status: str | None = None
+    processed_review: object = None
+    raw_review: object = None
+    error: str | None = None
+    partial: bool = False
+
+    COMPACT_VERSION = 1
+
+    def to_compact(self):
+        """Depolama/outbox için konumsal liste; alan adları her kayıtta tekrarlanmaz."""
+        return [self.COMPACT_VERSION, self.url, self.name, self.specs, self.review_status,
+                self.processed_review, self.raw_review, self.error, 1 if self.partial else 0]
+
+    @classmethod
+    def from_compact(cls, data):
+        if not isinstance(data, list) or not data or data[0] != cls.COMPACT_VERSION:
+            raise ValueError(f"Desteklenmeyen telefon kaydı biçimi: {str(data)[:80]}")
+        return cls(*data[1:8], partial=bool(data[8]))
+
+def specs_from_labels(label_specs):
+    """Eski (Türkçe etiket anahtarlı, varsayılan metinli) spec sözlüğünü anahtar bazlıya çevirir."""
+    specs = {}
+    for label, value in label_specs.items():
+        key = SPEC_KEY_BY_LABEL.get(label)
+        if key is None: continue
+        placeholder = value in (None, "", SPEC_EXTRACTION_FAILED_TEXT, spec_default(SPEC_DEFINITIONS_BY_KEY[key]))
+        specs[key] = None if placeholder else value
+    return specs
+
+_msgpack_module = False
+
+def _msgpack():
+    """msgpack kuruluysa modülü, değilse None döner (ilk kullanımda yüklenir)."""
+    global _msgpack_module
+    if _msgpack_module is False:
+        try: import msgpack as _msgpack_module
+        except ImportError: _msgpack_module = None
+    return _msgpack_module
+
+def encode_specs(specs):
+    """SQLite için: msgpack (bytes) ya da sıkı JSON (str)."""
+    if RECORD_CODEC != "json" and _msgpack() is not None:
+        return _msgpack().packb(specs, use_bin_type=True)
+    if RECORD_CODEC == "msgpack":
+        print("Uyarı: RECORD_CODEC=msgpack ama msgpack kurulu değil, JSON kullanılıyor.")
+    return json.dumps(specs, ensure_ascii=False, separators=(',', ':'))
+
+def decode_specs(value):
+    """encode_specs çıktısını (ve eski etiket anahtarlı JSON'u) çözer; çözülemezse None."""
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        if _msgpack() is None:
+            print("Uyarı: Kayıt msgpack ile yazılmış ama msgpack kurulu değil, yok sayılıyor.")
+            return None
+        specs = _msgpack().unpackb(value, raw=False)
+    else:
+        specs = json.loads(value)
+    if any(label in SPEC_KEY_BY_LABEL for label in specs):
+        specs = specs_from_labels(specs)
+    return specs
+
+# === Spec Çıkarım Planı ===
+# Tanımlar başlangıçta bir kez plana derlenir. #specs-list tablosu tek geçişte dolaşılıp data-spec ve
+# (bölüm başlığı, satır adı) indeksleri kurulur; tablo içindeki tanımlar bu indekslerden cevaplanır.
+# Yalnızca tablo dışındaki (model adı, resim) tanımlar önceden derlenmiş selektörle ayrıca aranır.
+# "index_key" ve "section"/"row" alanları, XPath tanımının tablodaki karşılığını belirtir.
+DEFAULT_SPEC_BASE_SELECTOR = "#specs-list td.nfo"
+
+def compile_spec_plan(specs_definitions):
+    """Her tanım için bir adım üretir: mode 'index' / 'row' tablodan, 'css' / 'xpath' tüm sayfadan arar."""
+    plan = []
+    for spec_def in specs_definitions:
+        selector_type = spec_def["type"]
+        selector_value = spec_def["value"]
+        step = {
+            "label": spec_def["label"],
+            "field": spec_key(spec_def),
+            "critical": bool(spec_def.get("critical")),
+            "attribute": spec_def.get("attribute"),
+            "process_as_html": bool(spec_def.get("process_as_html")),
+            "child_a": bool(spec_def.get("child_a")),
+            "nfo_only": False,
+        }
+        base_selector = spec_def.get("base_selector", DEFAULT_SPEC_BASE_SELECTOR)
+        if selector_type == "data-spec" and base_selector == DEFAULT_SPEC_BASE_SELECTOR:
+            step.update(mode="index", key=selector_value, nfo_only=True)
+        elif spec_def.get("index_key"):
+            step.update(mode="index", key=spec_def["index_key"])
+        elif spec_def.get("section") and spec_def.get("row"):
+            step.update(mode="row", section=spec_def["section"], row=spec_def["row"])
+        elif selector_type == "data-spec":
+            step.update(mode="css", selector=f"{base_selector}[data-spec='{selector_value}']")
+        elif selector_type in ("css", "xpath"):
+            step.update(mode=selector_type, selector=selector_value)
+        else:
+            step.update(mode="none")
+        plan.append(step)
+    return plan
+
+_SPEC_PLAN_CACHE = {}
+_SPEC_PLAN_LOCK = threading.Lock()
+
+def get_spec_plan(specs_definitions):
+    """Aynı tanım listesi için derlenmiş planı tekrar kullanır."""
+    with _SPEC_PLAN_LOCK:
+        cached = _SPEC_PLAN_CACHE.get(id(specs_definitions))
+        if cached is None or cached[0] is not specs_definitions:
+            cached = (specs_definitions, compile_spec_plan(specs_definitions))
+            _SPEC_PLAN_CACHE[id(specs_definitions)] = cached
+        return cached[1]
+
+_STATIC_MATCHERS = threading.local() # lxml XPath nesneleri thread'ler arasında paylaşılmaz
+
+def _static_plan_matcher(step):
+    """Tablo dışı adımlar için lxml derlenmiş XPath nesnesi (thread ve adım başına bir kez)."""
+    matchers = getattr(_STATIC_MATCHERS, "by_step", None)
+    if matchers is None:
+        matchers = _STATIC_MATCHERS.by_step = {}
+    key = (step["mode"], step.get("selector"))
+    if key not in matchers:
+        matcher = None
+        if lxml_etree is not None:
+            try:
+                if step["mode"] == "css":
+                    matcher = CSSSelector(step["selector"])
+                elif step["mode"] == "xpath":
+                    matcher = lxml_etree.XPath(step["selector"])
+            except Exception as e:
+                print(f"Uyarı: '{step['label']}' selektörü derlenemedi. {e}")
+        matchers[key] = matcher
+    return matchers[key]
+
+# Selenium tarafında planın tamamı tek execute_script çağrısında çalışır (tanım başına bekleme yerine).
+# İndeks, statik taraftaki _index_specs_table_static ile aynı kurallarla kurulur.
+_SPEC_PLAN_JS = r"""
+const plan = arguments[0];
+const root = document.getElementById('specs-list');
+const bySpec = {}, byRow = {};
+const norm = s => (s || '').replace(/\s+/g, ' ').trim();
+if (root) {
+  root.querySelectorAll('[data-spec]').forEach(el => {
+    const key = el.getAttribute('data-spec');
+    (bySpec[key] = bySpec[key] || []).push(el);
+  });
+  root.querySelectorAll('table').forEach(table => {
+    let section = '';
+    table.querySelectorAll('tr').forEach(tr => {
+      const th = tr.querySelector('th');
+      if (th) section = norm(th.textContent);
+      const ttl = tr.querySelector('td.ttl'), nfo = tr.querySelector('td.nfo');
+      if (!ttl || !nfo) return;
+      const link = ttl.querySelector('a');
+      const title = norm(link ? link.textContent : ttl.textContent);
+      const key = section + '\u0000' + title;
+      if (title && !(key in byRow)) byRow[key] = nfo;
+    });
+  });
+}
+return plan.map(step => {
+  let el = null;
+  try {
+    if (step.mode === 'index') {
+      el = (bySpec[step.key] || []).find(e => !step.nfo_only || (e.tagName === 'TD' && e.classList.contains('nfo'))) || null;
+    } else if (step.mode === 'row') {
+      el = byRow[step.section + '\u0000' + step.row] || null;
+    } else if (step.mode === 'css') {
+      el = document.querySelector(step.selector);
+    } else if (step.mode === 'xpath') {
+      el = document.evaluate(step.selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    if (el && step.child_a) el = el.querySelector('a');
+  } catch (e) { return {error: String(e)}; }
+  if (!el) return null;
+  let attr = null;
+  if (step.attribute) attr = (step.attribute in el) ? el[step.attribute] : el.getAttribute(step.attribute);
+  return {text: el.innerText || el.textContent || '', html: el.innerHTML, attr: attr};
+});
+"""
+
+def run_spec_plan_selenium(driver, plan):
+    """Planı tarayıcıda tek seferde çalıştırır; {spec anahtarı: değer veya None} döner (None = bulunamadı/boş)."""
+    with profile_stage("spec_plan_selenium") as stage:
+        raw_results = driver.execute_script(_SPEC_PLAN_JS, plan) or []
+        missing = sum(1 for raw in raw_results if not raw)
+        if missing: stage.outcome = f"missing_{missing}"
+    results = {}
+    for step, raw in zip(plan, raw_results):
+        if not raw or raw.get("error"):
+            results[step["field"]] = None
+            continue
+        if step["attribute"]:
+            value = (raw.get("attr") or "").strip()
+        elif step["process_as_html"]:
+            value = _flatten_html_lines(raw.get("html"))
+        else:
+            value = (raw.get("text") or "").strip()
+        results[step["field"]] = value or None
+    return results
+
+# === Sayfa Önbelleği (SQLite) ===
+# Telefon sayfalarının ham HTML'i, ETag/Last-Modified bilgisi ve çıkarılan spec'lerin hash'i URL bazında saklanır.
+# Tekrar çalıştırmalarda koşullu GET yapılır; sayfa değişmediyse spec çıkarımı ve PHP'ye yeniden gönderim atlanır.
+# Aynı veritabanında Gemini özetleri de (model + prompt hash'i ile) tutulur.
+def _hash_json(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False, default=_review_hash_default).encode('utf-8')).hexdigest()
+
+class PageCache:
+    def __init__(self, db_path):
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS page_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                html TEXT,
+                html_hash TEXT,
+                specs_json TEXT,
+                specs_hash TEXT,
+                review_url TEXT,
+                uploaded_hash TEXT,
+                fetched_at TEXT
+            )""")
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS summary_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT,
+                summary TEXT,
+                created_at TEXT
+            )""")
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM page_cache WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def save_page(self, url, html_content, etag=None, last_modified=None):
+        """Sayfayı kaydeder; içerik değiştiyse önceki spec sonuçlarını geçersiz kılar. İçerik değişti mi döner."""
+        html_hash = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT html_hash FROM page_cache WHERE url = ?", (url,)).fetchone()
+            changed = row is None or row["html_hash"] != html_hash
+            self._conn.execute("""INSERT INTO page_cache (url, etag, last_modified, html, html_hash, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified,
+                    html = excluded.html, html_hash = excluded.html_hash, fetched_at = excluded.fetched_at""",
+                (url, etag, last_modified, html_content, html_hash, datetime.now().isoformat(timespec='seconds')))
+            if changed:
+                self._conn.execute("UPDATE page_cache SET specs_json = NULL, specs_hash = NULL, review_url = NULL WHERE url = ?", (url,))
+        return changed
+
+    def save_specs(self, url, specs, review_url):
+        """`specs_json` sütunu encode_specs çıktısını tutar (msgpack ya da JSON; ad eski şemadan kalma)."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE page_cache SET specs_json = ?, specs_hash = ?, review_url = ? WHERE url = ?",
+                (encode_specs(specs), _hash_json(specs), review_url, url))
+
+    def mark_uploaded(self, url, payload_hash):
+        with self._lock, self._conn:
+            self._conn.execute("""INSERT INTO page_cache (url, uploaded_hash) VALUES (?, ?)
+                ON CONFLICT(url) DO UPDATE SET uploaded_hash = excluded.uploaded_hash""", (url, payload_hash))
+
+    def get_summary(self, cache_key):
+        with self._lock:
+            row = self._conn.execute("SELECT summary FROM summary_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+        return row["summary"] if row else None
+
+    def save_summary(self, cache_key, model_name, summary):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO summary_cache (cache_key, model, summary, created_at) VALUES (?, ?, ?, ?)",
+                (cache_key, model_name, summary, datetime.now().isoformat(timespec='seconds')))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+def get_page_cache():
+    """Ortak önbelleği ilk kullanımda açar; PAGE_CACHE_DB boşsa veya açılamazsa None döner."""
+    global _page_cache
+    if not PAGE_CACHE_DB:
+        return None
+    with _page_cache_lock:
+        if _page_cache is None:
+            try:
+                _page_cache = PageCache(PAGE_CACHE_DB)
+            except sqlite3.Error as e:
+                print(f"Uyarı: Sayfa önbelleği açılamadı ({PAGE_CACHE_DB}). {e}")
+                return None
+        return _page_cache
+
+def fetch_page_cached(url, stale_on_error=True):
+    """Koşullu GET ile sayfayı getirir. (html, değişti_mi) döner; html None ise sayfa alınamadı. İstek başarısız
+    olursa `stale_on_error` açıkken önbellekteki kopya (değişmemiş olarak) döner; kapalıysa (None, False)."""
+    cache = get_page_cache()
+    cached = cache.get(url) if cache else None
+    headers = dict(REQUESTS_HEADERS)
+    if cached and cached["html"]:
+        if cached["etag"]: headers['If-None-Match'] = cached["etag"]
+        if cached["last_modified"]: headers['If-Modified-Since'] = cached["last_modified"]
+    try:
+        response = HTTP_CLIENT.get(url, headers=headers)
+        if response.status_code == 304 and cached and cached["html"]:
+            return cached["html"], False
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"Hata (Requests): Sayfa içeriği çekilemedi. {e}")
+        if not stale_on_error:
+            return None, False
+        if cached and cached["html"]:
+            print("Uyarı: Önbellekteki kopya kullanılıyor.")
+            return cached["html"], False
+        return None, True
+    if not cache:
+        return response.text, True
+    changed = cache.save_page(url, response.text, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    return response.text, changed
+
+# === Telefon Veritabanı (SQLite) ===
+# Görülen her telefon (URL anahtarlı) marka, duyurulma tarihi, son çıkarılan spec'ler, review hash'i ve işleme
+# durumuyla saklanır. Ana sayfadaki güncel liste homepage_rank sütunundadır; değişiklik tespiti, tekrar önleme ve
+# başarısız telefonların yeniden denenmesi liste taraması yerine indeksli sorgularla yapılır.
+# last_phones_data.json artık sadece dışa aktarımdır: veritabanı boşsa oradan ilk durum yüklenir, GIT_COMMIT_STATE
+# açıksa her değişiklikte yeniden yazılıp commit edilir (DB'si kalıcı olmayan CI ortamları için).
+_MONTHS = {month: index for index, month in enumerate(("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+
+def _announce_date_key(announce_text):
+    """'2025, May 20' / 'Exp. announcement 2025, June' -> '2025-05' (ay yoksa '2025'); sıralanabilir anahtar."""
+    match = re.search(r'(\d{4})(?:,\s*([A-Za-z]{3}))?', announce_text or '')
+    if not match:
+        return None
+    month = _MONTHS.get((match.group(2) or '').lower())
+    return f"{match.group(1)}-{month:02d}" if month else match.group(1)
+
+def _brand_from_name(phone_name):
+    return phone_name.split()[0] if phone_name and phone_name.split() else None
+
+class PhoneStore:
+    def __init__(self, db_path):
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS phones (
+                url TEXT PRIMARY KEY,
+                name TEXT,
+                brand TEXT,
+                announced TEXT,
+                homepage_rank INTEGER,
+                specs_json TEXT,
+                specs_hash TEXT,
+                review_hash TEXT,
+                status TEXT NOT NULL DEFAULT 'new',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                first_seen TEXT,
+                last_seen TEXT,
+                updated_at TEXT
+            )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_phones_brand ON phones (brand)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_phones_announced ON phones (announced)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_phones_status ON phones (status, attempts)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_phones_homepage ON phones (homepage_rank) WHERE homepage_rank IS NOT NULL")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_phones_first_seen ON phones (first_seen)")
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS spec_changes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                label TEXT NOT NULL,
+                old_value TEXT,
+                new_value TEXT,
+                detected_at TEXT NOT NULL
+            )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_spec_changes_url ON spec_changes (url, detected_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_spec_changes_detected ON spec_changes (detected_at)")
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM phones LIMIT 1").fetchone() is None
+
+    def homepage_phones(self):
+        """Son kaydedilen ana sayfa listesi, sırasıyla ({'name', 'link'} sözlükleri)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT url, name FROM phones WHERE homepage_rank IS NOT NULL ORDER BY homepage_rank").fetchall()
+        return [{"name": row["name"], "link": row["url"]} for row in rows]
+
+    def unknown_links(self, links):
+        """Daha önce hiç görülmemiş linkler (birincil anahtar üzerinden)."""
+        links = list(dict.fromkeys(links))
+        if not links:
+            return set()
+        placeholders = ",".join("?" * len(links))
+        with self._lock:
+            known = {row["url"] for row in self._conn.execute(f"SELECT url FROM phones WHERE url IN ({placeholders})", links)}
+        return set(links) - known
+
+    def record_homepage(self, phones):
+        """Ana sayfa listesini kaydeder: yeni telefonları ekler, sıralamayı günceller."""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE phones SET homepage_rank = NULL WHERE homepage_rank IS NOT NULL")
+            for rank, phone in enumerate(phones):
+                self._conn.execute("""INSERT INTO phones (url, name, brand, homepage_rank, first_seen, last_seen, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET name = excluded.name, homepage_rank = excluded.homepage_rank,
+                        last_seen = excluded.last_seen""",
+                    (phone["link"], phone["name"], _brand_from_name(phone["name"]), rank, now, now, now))
+
+    def record_result(self, url, name, specs, raw_review, success, message=None):
+        """İşleme sonucunu yazar. Başarısızlıkta deneme sayısı artar ve telefon yeniden deneme listesine girer."""
+        now = datetime.now().isoformat(timespec='seconds')
+        announced = _announce_date_key((specs or {}).get(ANNOUNCED_SPEC_KEY))
+        specs_json = encode_specs(specs) if specs else None
+        specs_hash = _hash_json(specs) if specs else None
+        review_hash = _review_digest(raw_review)
+        with self._lock, self._conn:
+            self._conn.execute("""INSERT INTO phones (url, name, brand, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO NOTHING""", (url, name, _brand_from_name(name), now, now))
+            if success:
+                self._conn.execute("""UPDATE phones SET status = 'processed', attempts = 0, last_error = NULL,
+                    announced = COALESCE(?, announced), specs_json = COALESCE(?, specs_json), specs_hash = COALESCE(?, specs_hash),
+                    review_hash = COALESCE(?, review_hash), updated_at = ? WHERE url = ?""",
+                    (announced, specs_json, specs_hash, review_hash, now, url))
+            else:
+                self._conn.execute("""UPDATE phones SET status = 'failed', attempts = attempts + 1, last_error = ?, updated_at = ?
+                    WHERE url = ?""", (str(message)[:500] if message else None, now, url))
+
+    def mark_uploaded(self, url):
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE phones SET status = 'uploaded', updated_at = ? WHERE url = ?", (datetime.now().isoformat(timespec='seconds'), url))
+
+    def failed_phones(self, max_attempts=PHONE_MAX_ATTEMPTS):
+        """Deneme hakkı bitmemiş başarısız telefonlar ({'name', 'link'})."""
+        with self._lock:
+            rows = self._conn.execute("SELECT url, name FROM phones WHERE status = 'failed' AND attempts < ? ORDER BY updated_at",
+                                      (max_attempts,)).fetchall()
+        return [{"name": row["name"] or row["url"], "link": row["url"]} for row in rows]
+
+    def phones_seen_since(self, days):
+        """Son `days` günde ilk kez görülmüş ve spec'leri kayıtlı telefonlar (yeni eklenen önce)."""
+        cutoff = datetime.fromtimestamp(time.time() - days * 86400).isoformat(timespec='seconds')
+        with self._lock:
+            rows = self._conn.execute("""SELECT url, name, specs_json FROM phones
+                WHERE first_seen >= ? AND specs_json IS NOT NULL ORDER BY first_seen DESC""", (cutoff,)).fetchall()
+        phones = [{"link": row["url"], "name": row["name"] or row["url"], "specs": decode_specs(row["specs_json"])} for row in rows]
+        return [phone for phone in phones if phone["specs"] is not None]
+
+    def record_spec_changes(self, url, changes, specs):
+        """Değişen alanları olay olarak ekler ve telefonun güncel spec'lerini günceller. Olay tablosu insanlar için
+        okunur; etiket ve varsayılan metinler orada yazılır."""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT INTO spec_changes (url, label, old_value, new_value, detected_at) VALUES (?, ?, ?, ?, ?)",
+                [(url, spec_label(key), spec_display_value(key, old_value), spec_display_value(key, new_value), now) for key, old_value, new_value in changes])
+            self._conn.execute("""UPDATE phones SET specs_json = ?, specs_hash = ?, announced = COALESCE(?, announced), updated_at = ?
+                WHERE url = ?""", (encode_specs(specs), _hash_json(specs), _announce_date_key(specs.get(ANNOUNCED_SPEC_KEY)), now, url))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_phone_store = None
+_phone_store_lock = threading.Lock()
+
+def get_phone_store():
+    """Telefon veritabanını ilk kullanımda açar; boşsa son JSON dışa aktarımından ana sayfa listesini yükler."""
+    global _phone_store
+    with _phone_store_lock:
+        if _phone_store is None:
+            try:
+                _phone_store = PhoneStore(PHONE_DB or ':memory:')
+            except sqlite3.Error as e: # Dosya açılamazsa durum bu çalıştırma için bellekte tutulur
+                print(f"Uyarı: Telefon veritabanı açılamadı ({PHONE_DB}), bellek içi veritabanı kullanılıyor. {e}")
+                _phone_store = PhoneStore(':memory:')
+            if _phone_store.is_empty():
+                snapshot = load_data_from_file(DATA_FILE_NAME)
+                if snapshot:
+                    print(f"Telefon veritabanı '{DATA_FILE_NAME}' dosyasından başlatıldı ({len(snapshot)} telefon).")
+                    _phone_store.record_homepage(snapshot)
+        return _phone_store
+
+def persist_homepage_state(latest_phones_from_site, commit_message=None):
+    """Güncel listeyi veritabanına yazar; GIT_COMMIT_STATE açıksa JSON dışa aktarımı ve kuyruğu commit eder."""
+    get_phone_store().record_homepage(latest_phones_from_site)
+    if GIT_COMMIT_STATE:
+        save_data_to_file(DATA_FILE_NAME, latest_phones_from_site)
+        commit_and_push_data_file([DATA_FILE_NAME, OUTBOX_FILE_NAME, REVIEW_SPOOL_DIR], commit_message or f"GSMArena: Telefon listesi güncellendi ({datetime.now().strftime('%Y-%m-%d')})")
+
+# === Statik Spec Çıkarımı (requests + lxml) ===
+# Telefon sayfası tek seferde indirilir ve tüm tanımlar aynı ağaç üzerinde çözülür.
+# Eksik bir spec için 10 sn'lik WebDriverWait beklemesi olmaz; Selenium sadece kritik alanlar eksikse devreye girer.
+def _static_inner_text(element):
+    """Tarayıcıdaki innerText'e yakın metin: <br> satır sonu olur, boşluklar sadeleşir."""
+    parts = []
+    def collect(node):
+        if not isinstance(node.tag, str) or node.tag in ('script', 'style'):
+            pass
+        elif node.tag == 'br':
+            parts.append('\n')
+        else:
+            if node.text: parts.append(node.text)
+            for child in node: collect(child)
+        if node is not element and node.tail: parts.append(node.tail)
+    collect(element)
+    lines = [re.sub(r'\s+', ' ', line).strip() for line in ''.join(parts).split('\n')]
+    return "\n".join(line for line in lines if line)
+
+def _static_inner_html(element):
+    return html_escape(element.text or '', quote=False) + ''.join(lxml_html.tostring(child, encoding='unicode') for child in element)
+
+def _has_class(element, class_name):
+    return class_name in (element.get('class') or '').split()
+
+def _index_specs_table_static(specs_root):
+    """#specs-list altını tek geçişte dolaşır: data-spec -> elementler, (bölüm, satır adı) -> nfo hücresi."""
+    by_spec, by_row = {}, {}
+    if specs_root is None:
+        return by_spec, by_row
+    section, row_title = '', None
+    for element in specs_root.iter():
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+        data_spec = element.get('data-spec')
+        if data_spec:
+            by_spec.setdefault(data_spec, []).append(element)
+        if tag == 'table':
+            section = ''
+        elif tag == 'tr':
+            row_title = None
+        elif tag == 'th':
+            section = re.sub(r'\s+', ' ', element.text_content()).strip()
+        elif tag == 'td' and row_title is None and _has_class(element, 'ttl'):
+            link = next(element.iterchildren('a'), None)
+            row_title = re.sub(r'\s+', ' ', (link if link is not None else element).text_content()).strip()
+        elif tag == 'td' and row_title and _has_class(element, 'nfo'):
+            by_row.setdefault((section, row_title), element)
+            row_title = None
+    return by_spec, by_row
+
+def _static_plan_element(tree, step, by_spec, by_row):
+    mode = step["mode"]
+    element = None
+    if mode == "index":
+        element = next((e for e in by_spec.get(step["key"], ())
+                        if not step["nfo_only"] or (e.tag == 'td' and _has_class(e, 'nfo'))), None)
+    elif mode == "row":
+        element = by_row.get((step["section"], step["row"]))
+    elif mode in ("css", "xpath"):
+        matcher = _static_plan_matcher(step)
+        matches = matcher(tree) if matcher is not None else []
+        element = next((m for m in matches if hasattr(m, 'tag')), None)
+    if element is not None and step["child_a"]:
+        element = next(element.iterdescendants('a'), None)
+    return element
+
+def _static_element_value(element, step, page_url):
+    """Elementin değeri; element yoksa ya da değer boşsa None."""
+    if element is None:
+        return None
+    target_attribute = step["attribute"]
+    if target_attribute:
+        attr_content = element.get(target_attribute)
+        if attr_content and attr_content.strip() and target_attribute in ('src', 'href'):
+            attr_content = urljoin(page_url, attr_content.strip()) # Selenium'daki gibi mutlak URL
+        return attr_content.strip() if attr_content and attr_content.strip() else None
+    if step["process_as_html"]:
+        return _flatten_html_lines(_static_inner_html(element)) or None
+    return _static_inner_text(element) or None
+
+def run_spec_plan_static(tree, plan, page_url):
+    specs_root = tree.get_element_by_id('specs-list', None)
+    by_spec, by_row = _index_specs_table_static(specs_root)
+    specs = {}
+    for step in plan:
+        try:
+            element = _static_plan_element(tree, step, by_spec, by_row)
+            specs[step["field"]] = _static_element_value(element, step, page_url)
+        except Exception:
+            specs[step["field"]] = None
+    return specs
+
+def extract_specs_from_html_static(html_content, specs_definitions, page_url):
+    """Sayfa HTML'ini bir kez parse eder; (spec anahtarı -> değer sözlüğü, review linki) döner. lxml yoksa (None, None)."""
+    if lxml_html is None or not html_content:
+        return None, None
+    try:
+        tree = lxml_html.fromstring(html_content)
+    except Exception as e:
+        print(f"Hata (Statik): Sayfa parse edilemedi. {e}")
+        return None, None
+
+    specs = run_spec_plan_static(tree, get_spec_plan(specs_definitions), page_url)
+
+    review_links = tree.xpath(REVIEW_LINK_XPATH)
+    review_url = urljoin(page_url, review_links[0].get('href')) if review_links and review_links[0].get('href') else None
+    return specs, review_url
+
+def static_specs_have_critical_fields(specs, specs_definitions):
+    return all(specs.get(spec_key(spec_def)) is not None for spec_def in specs_definitions if spec_def.get("critical"))
+
+def fetch_phone_data_static(url, specs_definitions):
+    """Kritik alanlar statik sayfada varsa (specs, review_url) döner; yoksa (None, None) ve Selenium'a düşülür."""
+    if lxml_html is None:
+        return None, None
+    with profile_stage("spec_page_fetch") as stage:
+        html_content, page_changed = fetch_page_cached(url)
+        if not page_changed: stage.outcome = "not_modified"
+    cache = get_page_cache()
+    cached = cache.get(url) if cache and not page_changed else None
+    cached_specs = decode_specs(cached["specs_json"]) if cached and cached["specs_json"] else None
+    if cached_specs: # Sayfa değişmemiş: önceki çıkarım sonucunu kullan
+        print("Sayfa değişmemiş, spec'ler önbellekten alındı.")
+        return cached_specs, cached["review_url"]
+    with profile_stage("spec_extract_static"):
+        specs, review_url = extract_specs_from_html_static(html_content, specs_definitions, url)
+    if specs is None:
+        return None, None
+    if not static_specs_have_critical_fields(specs, specs_definitions):
+        print("Uyarı (Statik): Kritik alanlar statik sayfada bulunamadı, Selenium'a geçiliyor.")
+        return None, None
+    if cache: cache.save_specs(url, specs, review_url)
+    return specs, review_url
+
+# === Statik Review Çekimi ===
+# İlk review sayfasının sayfalama bloğundan tüm sayfa URL'leri çıkarılır, kalan sayfalar paralel indirilir
+# ve her sayfanın #review-body paragrafları tek parse ile alınır. Başarısız olursa Selenium'a düşülür.
+def _review_paragraphs_static(tree):
+    return [text for text in (_static_inner_text(p) for p in tree.xpath("//*[@id='review-body']//p")) if text]
+
+def _review_page_urls_static(tree, first_page_url):
+    """Sayfalama linklerinden (a/option) review sayfalarının sıralı URL listesini üretir."""
+    stem_match = re.match(r'^(.*?)(?:p\d+)?\.php$', first_page_url)
+    if not stem_match:
+        return [first_page_url]
+    stem = stem_match.group(1)
+    page_pattern = re.compile(re.escape(stem) + r'(?:p(\d+))?\.php$')
+    last_page = 1
+    for href in tree.xpath("//a/@href | //option/@value"):
+        match = page_pattern.match(urljoin(first_page_url, href.strip()))
+        if match and match.group(1):
+            last_page = max(last_page, int(match.group(1)))
+    # Sayfalama bazı sayfaları atlayabilir; aradakiler isim kalıbından üretilir
+    return [first_page_url] + [f"{stem}p{page_no}.php" for page_no in range(2, min(last_page, MAX_REVIEW_PAGES) + 1)]
+
+def fetch_review_text_static(review_url, max_workers=4):
+    """Review metnini HTTP üzerinden toplar; herhangi bir sayfa alınamaz/parse edilemez veya review-body yoksa
+    None döner (eksik sayfalı review kaydedilmesin, Selenium'a düşülsün)."""
+    if lxml_html is None:
+        return None
+    first_page_html = get_website_content_requests(review_url)
+    if not first_page_html:
+        return None
+    try:
+        first_tree = lxml_html.fromstring(first_page_html)
+    except Exception as e:
+        print(f"Hata (Statik): Review sayfası parse edilemedi. {e}")
+        return None
+    if not first_tree.xpath("//*[@id='review-body']"):
+        return None
+
+    page_urls = _review_page_urls_static(first_tree, review_url)
+
+    def fetch_page_paragraphs(page_url):
+        """(paragraflar, sonraki sayfa linki) döner; sayfa alınamazsa paragraflar None olur."""
+        page_html = get_website_content_requests(page_url)
+        if not page_html:
+            return None, None
+        try:
+            page_tree = lxml_html.fromstring(page_html)
+        except Exception:
+            return None, None
+        next_links = page_tree.xpath(REVIEW_NEXT_PAGE_XPATH)
+        return _review_paragraphs_static(page_tree), urljoin(page_url, next_links[0].get('href')) if next_links else None
+
+    review_spool = ReviewSpool(review_url)
+    try:
+        review_spool.write_page(_review_paragraphs_static(first_tree))
+        first_next_links = first_tree.xpath(REVIEW_NEXT_PAGE_XPATH)
+        next_page_url = urljoin(review_url, first_next_links[0].get('href')) if first_next_links else None
+        del first_tree, first_page_html
+        if len(page_urls) > 1:
+            # Sayfalar sırayla spool'a yazılır; aynı anda en fazla `max_workers` sayfa bellekte bekler
+            for page_no, (page_paragraphs, next_page_url) in enumerate(_bounded_ordered_map(fetch_page_paragraphs, page_urls[1:], min(max_workers, len(page_urls) - 1)), start=2):
+                if page_paragraphs is None:
+                    print(f"Uyarı (Statik): Review sayfası {page_no} alınamadı, Selenium'a geçiliyor.")
+                    review_spool.discard()
+                    return None
+                review_spool.write_page(page_paragraphs)
+        # Sayfalama son sayfayı göstermediyse kalan sayfalar "sonraki" linkiyle sırayla alınır
+        while next_page_url and next_page_url not in page_urls and len(page_urls) < MAX_REVIEW_PAGES:
+            page_urls.append(next_page_url)
+            page_paragraphs, next_page_url = fetch_page_paragraphs(next_page_url)
+            if page_paragraphs is None:
+                print(f"Uyarı (Statik): Review sayfası {len(page_urls)} alınamadı, Selenium'a geçiliyor.")
+                review_spool.discard()
+                return None
+            review_spool.write_page(page_paragraphs)
+    except BaseException:
+        review_spool.discard()
+        raise
+    print(f"Review statik olarak çekildi ({len(page_urls)} sayfa, {review_spool.char_count} karakter).")
+    if review_spool.is_empty():
+        review_spool.discard()
+        return REVIEW_NOT_FOUND_TEXT
+    return review_spool.close()
+
+def _summarize_review_text(raw_review_content, gemini_api_key_param):
+    """Anahtar yoksa ham içerik (spool dahil) aynen işlenmiş içerik olarak kullanılır."""
+    if not gemini_api_key_param:
+        return raw_review_content
+    if isinstance(raw_review_content, ReviewSpool):
+        try:
+            return summarize_with_gemini_selenium(raw_review_content, gemini_api_key_param)
+        except BaseException:
+            raw_review_content.discard() # Çağıran hata metnine düşer; dosya sahipsiz kalmasın
+            raise
+    if not (raw_review_content.startswith(REVIEW_NOT_FOUND_TEXT) or raw_review_content.startswith("İnceleme İçeriği Yüklenemedi")):
+        return summarize_with_gemini_selenium(raw_review_content, gemini_api_key_param)
+    return raw_review_content
+
+def _review_contents_selenium(driver, wait_critical, wait_general, gemini_api_key_param):
+    """Açık olan review sayfasından metni toplar ve (anahtar varsa) Gemini ile özetler."""
+    _handle_popups_selenium(driver)
+    with profile_stage("review_pages", "selenium"):
+        raw_review_content = fetch_review_text_from_pages_selenium(driver, wait_critical, wait_general)
+    return _summarize_review_text(raw_review_content, gemini_api_key_param), raw_review_content
+
+def _failed_phone_record(url, phone_name, error):
+    return PhoneRecord(url, phone_name, review_status=error, processed_review="İnceleme Yok (Selenium)", raw_review="İnceleme Yok (Selenium)", error=error)
+
+def fetch_phone_data_selenium(url, specs_definitions, gemini_api_key_param, driver_pool=None, phone_name=None):
+    """Telefonun spec'lerini ve review'unu toplar; PhoneRecord döner (sayfa okunamadıysa `error` dolu)."""
     print(f"\n--- Selenium: {url} İÇİN VERİ ÇEKME BAŞLATILIYOR ---")
-    chrome_options = setup_driver_options_selenium()
-    driver = None
-    initial_specs_data = {spec_def["label"]: "Veri Çekilemedi (Selenium)" for spec_def in specs_definitions}
-    initial_review_status = "Bilinmiyor (Selenium)"
-    initial_processed_review = "İnceleme Yok (Selenium)"
-    initial_raw_review = "İnceleme Yok (Selenium)"
-
-    try:
-        print("ChromeDriverManager.install() çağrılıyor...")
-        service = Service(ChromeDriverManager().install())
-        print("webdriver.Chrome çağrılıyor...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        print("WebDriver başarıyla başlatıldı.")
+    if driver_pool is None: # Havuz verilmediyse tek kullanımlık havuz; tarayıcı sadece gerekirse açılır
+        with WebDriverPool(size=1) as temporary_pool:
+            return fetch_phone_data_selenium(url, specs_definitions, gemini_api_key_param, temporary_pool, phone_name)
+
+    # Önce statik sayfa denenir; kritik alanlar tamamsa spec'ler için tarayıcıya gerek kalmaz.
+    static_specs, static_review_url = fetch_phone_data_static(url, specs_definitions)
+    if static_specs is not None:
+        print("Spec'ler statik sayfadan çıkarıldı.")
+        if not static_review_url:
+            return PhoneRecord(url, phone_name, static_specs, "Review Yok", "İnceleme Metni Yok (Selenium)", "İnceleme Metni Yok (Selenium)")
+        with profile_stage("review_pages", "static") as stage:
+            static_review_text = fetch_review_text_static(static_review_url)
+            if static_review_text is None: stage.outcome = "fallback"
+        if static_review_text is not None: # Review de statik alındı, tarayıcıya hiç gerek yok
+            return PhoneRecord(url, phone_name, static_specs, "Review Var", _summarize_review_text(static_review_text, gemini_api_key_param), static_review_text)
+
+    try:
+        driver = driver_pool.acquire()
     except Exception as e:
         print(f"Hata (Selenium): WebDriverManager veya Chrome başlatma hatası. {e}")
-        if driver: driver.quit()
-        initial_review_status = "WebDriver Başlatma Hatası (Selenium)"
-        return initial_specs_data, initial_review_status, initial_processed_review, initial_raw_review
+        if static_specs is not None:
+            return PhoneRecord(url, phone_name, static_specs, "Review Var (Ama işlenemedi)", "İnceleme Metni Yok (WebDriver başlatılamadı)", "İnceleme Metni Yok (WebDriver başlatılamadı)")
+        return _failed_phone_record(url, phone_name, "WebDriver Başlatma Hatası (Selenium)")
 
     try:
-        driver.get(url)
-        _handle_popups_selenium(driver) # Sayfa yüklendikten sonra pop-up'ları handle et
-    except Exception as e:
-        print(f"Hata (Selenium): URL yüklenirken hata. {e}")
-        if driver: driver.quit()
-        initial_review_status = "URL Yükleme Hatası (Selenium)"
-        return initial_specs_data, initial_review_status, initial_processed_review, initial_raw_review
+        return _fetch_phone_data_with_driver(driver, url, specs_definitions, gemini_api_key_param, static_specs, static_review_url, phone_name)
+    finally:
+        driver_pool.release(driver)
+
+def _fetch_phone_data_with_driver(driver, url, specs_definitions, gemini_api_key_param, static_specs=None, static_review_url=None, phone_name=None):
 
     general_wait_time = 10 # Actions'da network yavaş olabilir
     critical_wait_time = 20
     wait_critical = WebDriverWait(driver, critical_wait_time)
     wait_general = WebDriverWait(driver, general_wait_time)
 
+    if static_specs is not None: # Sadece review için tarayıcı: doğrudan review sayfasına git
+        try:
+            HTTP_CLIENT.wait_for_turn(static_review_url)
+            with profile_stage("page_load", "review"):
+                driver.get(static_review_url)
+            note_driver_page(driver)
+            processed_review_content, raw_review_content = _review_contents_selenium(driver, wait_critical, wait_general, gemini_api_key_param)
+            review_status_text = "Review Var"
+        except Exception as e:
+            print(f"Hata (Selenium): Review işlenirken hata. {e}")
+            raw_review_content = f"İnceleme Metni Yok (Review işleme hatası: {str(e)[:50]})"
+            processed_review_content = raw_review_content
+            review_status_text = "Review Var (Ama işlenemedi)"
+        return PhoneRecord(url, phone_name, static_specs, review_status_text, processed_review_content, raw_review_content)
+
+    try:
+        HTTP_CLIENT.wait_for_turn(url)
+        with profile_stage("page_load", "specs"):
+            driver.get(url)
+        note_driver_page(driver)
+        _handle_popups_selenium(driver) # Sayfa yüklendikten sonra pop-up'ları handle et
+    except Exception as e:
+        print(f"Hata (Selenium): URL yüklenirken hata. {e}")
+        return _failed_phone_record(url, phone_name, "URL Yükleme Hatası (Selenium)")
+
     try:
         WebDriverWait(driver, critical_wait_time).until(
             EC.any_of(
@@ -409,15 +2538,21 @@ def fetch_phone_data_selenium(url, specs_definitions, gemini_api_key_param):
         )
     except TimeoutException:
         print(f"Hata (Selenium): Ana sayfa elementleri zamanında yüklenemedi.")
-        if driver: driver.quit()
-        initial_review_status = "Ana Elementler Yüklenemedi (Selenium)"
-        return initial_specs_data, initial_review_status, initial_processed_review, initial_raw_review
+        return _failed_phone_record(url, phone_name, "Ana Elementler Yüklenemedi (Selenium)")
     
-    specs_data_dict = {}
+    # Tüm plan tek script ile okunur; yalnızca bulunamayan kritik alanlar için eski bekleyen aramaya düşülür
+    try:
+        plan_results = run_spec_plan_selenium(driver, get_spec_plan(specs_definitions))
+    except Exception as e:
+        print(f"Uyarı (Selenium): Spec planı çalıştırılamadı, tek tek aranacak. {e}")
+        plan_results = {}
+    specs = {}
     for spec_def in specs_definitions:
-        default_val = spec_def.get("default_value", "Bilgi Yok")
-        text_content = get_element_text_by_strategy_selenium(driver, wait_general, spec_def, default_value=default_val)
-        specs_data_dict[spec_def["label"]] = text_content
+        key = spec_key(spec_def)
+        value = plan_results.get(key)
+        if value is None and (spec_def.get("critical") or not plan_results):
+            value = get_element_text_by_strategy_selenium(driver, wait_general, spec_def, default_value=None)
+        specs[key] = value
 
     review_status_text = "Review Yok"
     raw_review_content = "İnceleme Metni Yok (Selenium)"
@@ -427,28 +2562,29 @@ def fetch_phone_data_selenium(url, specs_definitions, gemini_api_key_param):
     if review_link_element:
         review_status_text = "Review Var"
         try:
+            HTTP_CLIENT.wait_for_turn(url)
             driver.execute_script("arguments[0].click();", review_link_element) # Direkt tıklama
+            note_driver_page(driver)
             time.sleep(2) # Sayfa geçişi için bekleme
-            _handle_popups_selenium(driver)
-            raw_review_content = fetch_review_text_from_pages_selenium(driver, wait_critical, wait_general)
-            if gemini_api_key_param and not (raw_review_content.startswith("İnceleme Metni Bulunamadı") or raw_review_content.startswith("İnceleme İçeriği Yüklenemedi")):
-                processed_review_content = summarize_with_gemini_selenium(raw_review_content, gemini_api_key_param)
-            else:
-                processed_review_content = raw_review_content
+            processed_review_content, raw_review_content = _review_contents_selenium(driver, wait_critical, wait_general, gemini_api_key_param)
         except Exception as e:
             print(f"Hata (Selenium): Review işlenirken hata. {e}")
             raw_review_content = f"İnceleme Metni Yok (Review işleme hatası: {str(e)[:50]})"
             processed_review_content = raw_review_content
             review_status_text = "Review Var (Ama işlenemedi)"
     
-    if driver: driver.quit()
-    return specs_data_dict, review_status_text, processed_review_content, raw_review_content
+    return PhoneRecord(url, phone_name, specs, review_status_text, processed_review_content, raw_review_content)
+
+def _php_idempotency_key(phone_url):
+    return hashlib.sha256(phone_url.encode('utf-8')).hexdigest()[:32]
 
-def save_data_to_php_selenium(phone_data_dict, php_url_param):
+def save_data_to_php_selenium(phone_data_dict, php_url_param, idempotency_key=None):
     try:
         headers = {'Content-Type': 'application/json; charset=utf-8'}
-        json_payload_utf8 = json.dumps(phone_data_dict, ensure_ascii=False).encode('utf-8')
-        response = requests.post(php_url_param, data=json_payload_utf8, headers=headers, timeout=120) # Timeout artırıldı
+        if idempotency_key: headers['Idempotency-Key'] = idempotency_key # Tekrar denemelerde aynı telefonun çift kaydını önler
+        with PHP_SLOTS, profile_stage("php_post") as stage:
+            response = HTTP_CLIENT.post(php_url_param, data=php_request_body(phone_data_dict), headers=headers) # Varsayılan (10, 120) timeout
+            if not response.ok: stage.outcome = f"http_{response.status_code}"
         response.raise_for_status()
         try: response_json = response.json()
         except json.JSONDecodeError: return False, f"PHP yanıtı JSON formatında değil: {response.text[:200]}"
@@ -462,69 +2598,1088 @@ def save_data_to_php_selenium(phone_data_dict, php_url_param):
     except requests.exceptions.RequestException as e:
         return False, f"PHP istek hatası: {e}"
 
-def process_single_phone_with_selenium(phone_url, phone_name_from_main_page, specs_defs, gemini_key, php_url_param):
-    """Tek bir telefonu Selenium ile işler ve PHP'ye gönderir."""
-    print(f"\nSelenium ile işleniyor: {phone_name_from_main_page} ({phone_url})")
-    
-    specs_dict, review_status, gemini_review, raw_review = fetch_phone_data_selenium(phone_url, specs_defs, gemini_key)
+# === PHP Gönderim Kuyruğu (Outbox) ===
+# Telefon verileri önce yerel, append-only bir JSONL dosyasına yazılır; gönderim ayrı bir adımda toplu yapılır.
+# Satır türleri: {"op": "put", ...kayıt} ve {"op": "ack", "key", "payload_hash"}. Gönderilemeyen kayıtlar dosyada
+# kalır ve bir sonraki çalıştırmada tekrar denenir (dosya veri dosyasıyla birlikte commit edilir). Kayıt etiketsiz,
+# konumsal biçimde ("record": PhoneRecord.to_compact()) yazılır; kaydet.php yükü gönderim anında üretilir. Eski
+# sürümlerin yazdığı hazır yüklü ("payload") satırlar aynen gönderilir.
+def _fsync_directory(file_path):
+    """os.replace sonrası yeni dizin girdisinin diske yazılması için dizini fsync'ler (desteklenmeyen sistemlerde atlanır)."""
+    try:
+        directory_fd = os.open(os.path.dirname(os.path.abspath(file_path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(directory_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(directory_fd)
 
-    model_adi_value = specs_dict.get("Model Adı", phone_name_from_main_page) # Ana sayfadaki ismi yedek olarak kullan
-    if model_adi_value == "Veri Çekilemedi (Selenium)" or model_adi_value == "Model Adı Yok" or not model_adi_value:
-        model_adi_value = phone_name_from_main_page # Eğer Selenium çekemezse ana sayfadaki ismi kullan
+class PhpOutbox:
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._lock = threading.Lock()
 
-    marka_value = "Marka Yok"
-    if model_adi_value and model_adi_value not in ["Bilinmeyen Model", "Marka Yok", "Model Adı Yok"] and not model_adi_value.startswith("Bilinmeyen Model ("):
-        parts = model_adi_value.split(' ')
-        if parts: marka_value = parts[0]
-    
-    resim_url_value = specs_dict.get("Resim URL", "Resim Yok")
-
-    data_for_php = {
-        "url": phone_url,
-        "model_adi": model_adi_value,
-        "marka": marka_value,
-        "resim_url": resim_url_value,
-        "review_status": review_status,
-        "processed_review_content": gemini_review,
-        "raw_review_content": raw_review,
-        "specs": []
-    }
+    def _append(self, entry):
+        with self._lock:
+            with open(self.file_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=_review_ref_default) + "\n") # Review metni değil dosya referansı yazılır
+                f.flush()
+                os.fsync(f.fileno())
+
+    def put(self, phone_record, key=None):
+        compact_record = phone_record.to_compact()
+        record = {
+            "op": "put",
+            "key": key or _php_idempotency_key(phone_record.url),
+            "url": phone_record.url,
+            "payload_hash": _hash_json(compact_record),
+            "queued_at": datetime.now().isoformat(timespec='seconds'),
+            "record": compact_record,
+        }
+        self._append(record)
+        return record["key"]
+
+    def ack(self, record):
+        self._append({"op": "ack", "key": record["key"], "payload_hash": record["payload_hash"]})
+
+    def pending(self):
+        """Henüz onaylanmamış kayıtlar (anahtar başına en son sürüm), kuyruğa giriş sırasıyla."""
+        records = {}
+        if not os.path.exists(self.file_path):
+            return []
+        with self._lock:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip(): continue
+                    try: entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        print(f"Uyarı: {self.file_path} satır {line_no} bozuk, atlanıyor.")
+                        continue
+                    if entry.get("op") == "put":
+                        records.pop(entry["key"], None) # Yeni sürüm sıranın sonuna geçer
+                        records[entry["key"]] = entry
+                    elif entry.get("op") == "ack" and records.get(entry["key"], {}).get("payload_hash") == entry.get("payload_hash"):
+                        del records[entry["key"]]
+        return list(records.values())
+
+    def _referenced_review_files(self):
+        """Dosyadaki tüm put kayıtlarının (onaylı/eskimiş dahil) referans verdiği review dosyaları."""
+        paths = set()
+        if not os.path.exists(self.file_path):
+            return paths
+        with self._lock:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if '"$review_file"' not in line: continue
+                    try: paths.update(_review_file_paths(_outbox_entry_content(json.loads(line))))
+                    except json.JSONDecodeError: continue
+        return paths
+
+    def compact(self):
+        """Onaylanmış kayıtları dosyadan atar (geçici dosya + os.replace ile); artık hiçbir bekleyen kaydın
+        kullanmadığı review dosyaları silinir."""
+        referenced_files = self._referenced_review_files()
+        remaining = self.pending()
+        temp_path = self.file_path + ".tmp"
+        with self._lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in remaining:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno()) # Çökmede yarım/boş dosya eski kuyruğun yerine geçmesin
+            os.replace(temp_path, self.file_path)
+            _fsync_directory(self.file_path)
+        still_needed = {path for record in remaining for path in _review_file_paths(_outbox_entry_content(record))}
+        discard_review_files([{"$review_file": path} for path in referenced_files - still_needed])
+        return len(remaining)
+
+# Tarama işçileri kendi kuyruk dosyalarına (php_outbox.<worker_id>.jsonl) yazar. Aynı makinede ölmüş bir işçinin
+# (varsayılan host-pid adlı) dosyası bir sonraki tarama ya da gönderim turunda sahiplenilip bekleyen kayıtları taşınır;
+# --worker-id ile adlandırılmış işçinin dosyasını aynı kimlikle yeniden başlayan işçi kendisi gönderir.
+def worker_outbox_path(worker_id):
+    return f"{os.path.splitext(OUTBOX_FILE_NAME)[0]}.{worker_id}.jsonl"
+
+def _worker_outbox_is_orphaned(worker_id):
+    host, _, pid = worker_id.rpartition('-')
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError: # Süreç yaşıyor (başka kullanıcıya ait)
+        return False
+    return False
+
+def adopt_orphaned_outboxes(outbox):
+    """Ölmüş işçilerin kuyruklarındaki bekleyen kayıtları `outbox`'a taşır; taşınan kayıt sayısını döner."""
+    directory = os.path.dirname(OUTBOX_FILE_NAME) or "."
+    name_prefix = os.path.basename(os.path.splitext(OUTBOX_FILE_NAME)[0]) + "."
+    adopted = 0
+    for file_name in sorted(os.listdir(directory)):
+        if not (file_name.startswith(name_prefix) and file_name.endswith(".jsonl")): continue
+        path = os.path.join(directory, file_name)
+        if os.path.abspath(path) == os.path.abspath(outbox.file_path) or not _worker_outbox_is_orphaned(file_name[len(name_prefix):-len(".jsonl")]):
+            continue
+        claimed_path = f"{path}.adopting-{os.getpid()}"
+        try: os.rename(path, claimed_path) # Aynı dosyayı iki süreç birden sahiplenmesin
+        except OSError: continue
+        orphan_outbox = PhpOutbox(claimed_path)
+        orphan_outbox.compact() # Onaylanmış kayıtların review dosyaları temizlenir
+        for record in orphan_outbox.pending():
+            outbox._append(record)
+            adopted += 1
+        os.remove(claimed_path)
+    if adopted: print(f"Ölmüş tarama işçilerinden {adopted} bekleyen PHP kaydı devralındı.")
+    return adopted
+
+def _outbox_entry_content(entry):
+    return entry.get("record") if "record" in entry else entry.get("payload")
+
+def outbox_entry_payload(entry):
+    """Kuyruk kaydını kaydet.php yüküne çevirir."""
+    if "record" in entry:
+        return build_php_payload(PhoneRecord.from_compact(entry["record"]), phone_specs_definitions)
+    return entry["payload"]
+
+def _outbox_entry_is_partial(entry):
+    return PhoneRecord.from_compact(entry["record"]).partial if "record" in entry else bool(entry["payload"].get("partial"))
+
+def save_batch_to_php(records, batch_url):
+    """Kayıtları tek istekte gönderir. Beklenen yanıt: {"status": "success", "results": [{"idempotency_key", "status", "id", "message"}]}.
+    Anahtar -> (başarılı_mı, mesaj) sözlüğü döner."""
+    body = {"items": [{"idempotency_key": record["key"], "data": outbox_entry_payload(record)} for record in records]}
+    try:
+        with PHP_SLOTS, profile_stage("php_post", "batch"):
+            response = HTTP_CLIENT.post(batch_url, data=php_request_body(body), headers={'Content-Type': 'application/json; charset=utf-8'})
+        response.raise_for_status()
+        response_json = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        return {record["key"]: (False, f"PHP toplu gönderim hatası: {str(e)[:200]}") for record in records}
+
+    item_results = {item.get("idempotency_key"): item for item in response_json.get("results", []) if isinstance(item, dict)}
+    outcome = {}
+    for record in records:
+        item = item_results.get(record["key"])
+        if item and item.get("status") == "success":
+            outcome[record["key"]] = (True, f"Veritabanı işlemi başarılı (ID: {item.get('id')})")
+        else:
+            outcome[record["key"]] = (False, f"Veritabanı sunucu mesajı: {(item or {}).get('message', response_json.get('message', 'Toplu yanıtta kayıt yok'))}")
+    return outcome
+
+def flush_php_outbox(outbox, php_url_param, batch_url=PHP_BATCH_SAVE_URL, batch_size=PHP_BATCH_SIZE, partial_url=PHP_PARTIAL_SAVE_URL):
+    """Kuyruktaki kayıtları PHP'ye gönderir; URL -> (başarılı_mı, mesaj) döner. Başarısızlar kuyrukta kalır.
+    Kısmi güncellemeler kaydet.php'ye değil yalnızca `partial_url`'e, tek tek gönderilir; o yoksa kuyrukta bekletilir."""
+    records = outbox.pending()
+    results = {}
+    if not records:
+        return results
+    partial_records = [record for record in records if _outbox_entry_is_partial(record)]
+    records = [record for record in records if not _outbox_entry_is_partial(record)]
+    if partial_records and not partial_url:
+        # Kayıt URL tanımlıyken kuyruğa girmiş olabilir (ör. CI ile yerel çalıştırma aynı kuyruğu paylaşır); silinmez
+        print(f"Uyarı: PHP_PARTIAL_SAVE_URL tanımlı değil; {len(partial_records)} kısmi güncelleme kuyrukta bekletiliyor.")
+        partial_records = []
+        if not records:
+            return results
+    print(f"\nPHP kuyruğunda {len(records) + len(partial_records)} kayıt gönderiliyor...")
+    cache = get_page_cache()
+    phone_store = get_phone_store()
+    step = max(1, batch_size) if batch_url else 1
+    batches = [records[start:start + step] for start in range(0, len(records), step)] + [[record] for record in partial_records]
+    for batch in batches:
+        if _outbox_entry_is_partial(batch[0]):
+            outcome = {batch[0]["key"]: save_data_to_php_selenium(outbox_entry_payload(batch[0]), partial_url, idempotency_key=batch[0]["key"])}
+        elif batch_url:
+            outcome = save_batch_to_php(batch, batch_url)
+        else:
+            outcome = {batch[0]["key"]: save_data_to_php_selenium(outbox_entry_payload(batch[0]), php_url_param, idempotency_key=batch[0]["key"])}
+        for record in batch:
+            php_success, php_message = outcome[record["key"]]
+            if php_success:
+                outbox.ack(record)
+                if not _outbox_entry_is_partial(record): # Kısmi güncelleme tam kaydın hash'ini temsil etmez
+                    if cache: cache.mark_uploaded(record["url"], record["payload_hash"])
+                    phone_store.mark_uploaded(record["url"])
+                print(f"Veriler başarıyla veritabanına aktarıldı ({record['url']}). Mesaj: {php_message}")
+            else:
+                print(f"VERİLER VERİTABANINA KAYDEDİLEMEDİ ({record['url']}), kuyrukta kalacak. Mesaj: {php_message}")
+            results[record["url"]] = (php_success, php_message)
+    remaining = outbox.compact()
+    if remaining: print(f"Uyarı: {remaining} kayıt PHP kuyruğunda bekliyor, sonraki çalıştırmada tekrar denenecek.")
+    return results
+
+def build_php_payload(phone_record, specs_defs):
+    """kaydet.php'nin beklediği sözlüğü oluşturur. Türkçe etiketler ve varsayılan metinler ("Bilgi Yok" vb.) yalnızca
+    burada eklenir; kısmi kayıtlarda sadece kayıttaki alanlar gönderilir."""
+    specs = phone_record.specs
+    def php_value(key, default_value):
+        value = specs.get(key)
+        if value is not None: return value
+        return SPEC_EXTRACTION_FAILED_TEXT if phone_record.error else default_value
+
+    if phone_record.partial:
+        data_for_php = {"url": phone_record.url, "partial": True, "specs": []}
+        if MODEL_NAME_SPEC_KEY in specs: data_for_php["model_adi"] = spec_display_value(MODEL_NAME_SPEC_KEY, specs[MODEL_NAME_SPEC_KEY])
+        if IMAGE_SPEC_KEY in specs: data_for_php["resim_url"] = spec_display_value(IMAGE_SPEC_KEY, specs[IMAGE_SPEC_KEY])
+    else:
+        model_adi_value = specs.get(MODEL_NAME_SPEC_KEY) or phone_record.name # Selenium çekemezse ana sayfadaki isim kullanılır
+
+        marka_value = "Marka Yok"
+        if model_adi_value and model_adi_value not in ["Bilinmeyen Model", "Marka Yok", "Model Adı Yok"] and not model_adi_value.startswith("Bilinmeyen Model ("):
+            parts = model_adi_value.split(' ')
+            if parts: marka_value = parts[0]
+
+        data_for_php = {
+            "url": phone_record.url,
+            "model_adi": model_adi_value,
+            "marka": marka_value,
+            "resim_url": php_value(IMAGE_SPEC_KEY, "Resim Yok"),
+            "review_status": phone_record.review_status,
+            "processed_review_content": phone_record.processed_review,
+            "raw_review_content": phone_record.raw_review,
+            "specs": []
+        }
 
     for spec_def in specs_defs:
-        label = spec_def["label"]
-        if label in ["Model Adı", "Resim URL"]: continue
-        value = specs_dict.get(label, spec_def.get("default_value", "Bilgi Yok"))
-        data_for_php["specs"].append({"label": label, "value": value})
+        key = spec_key(spec_def)
+        if key in (MODEL_NAME_SPEC_KEY, IMAGE_SPEC_KEY) or (phone_record.partial and key not in specs): continue
+        data_for_php["specs"].append({"label": spec_def["label"], "value": php_value(key, spec_default(spec_def))})
+    return data_for_php
+
+def process_single_phone_with_selenium(phone_url, phone_name_from_main_page, specs_defs, gemini_key, php_url_param, driver_pool=None, outbox=None):
+    """Tek bir telefonu Selenium ile işler ve PHP'ye gönderir. `driver_pool` verilirse tarayıcı havuzdan kiralanır;
+    `outbox` verilirse veri doğrudan gönderilmez, kuyruğa yazılır (gönderim `flush_php_outbox` ile yapılır)."""
+    print(f"\nSelenium ile işleniyor: {phone_name_from_main_page} ({phone_url})")
+    
+    phone_record = fetch_phone_data_selenium(phone_url, specs_defs, gemini_key, driver_pool, phone_name_from_main_page)
     
-    if review_status in ["WebDriver Başlatma Hatası (Selenium)", "URL Yükleme Hatası (Selenium)", "Ana Elementler Yüklenemedi (Selenium)"]:
+    phone_store = get_phone_store()
+    if phone_record.error:
         print(f"Kritik Selenium hatası ({phone_url}). PHP'ye gönderilmeyecek.")
-        return False, f"Selenium kritik hata: {review_status}"
+        phone_store.record_result(phone_url, phone_name_from_main_page, None, None, False, phone_record.error)
+        discard_review_files(phone_record.to_compact())
+        return False, f"Selenium kritik hata: {phone_record.error}"
+    phone_store.record_result(phone_url, phone_name_from_main_page, phone_record.specs, phone_record.raw_review, True)
 
-    php_success, php_message = save_data_to_php_selenium(data_for_php, php_url_param)
+    cache = get_page_cache()
+    payload_hash = _hash_json(phone_record.to_compact())
+    cached = cache.get(phone_url) if cache else None
+    if cached and cached["uploaded_hash"] == payload_hash:
+        print(f"Veriler son gönderimden beri değişmedi ({phone_url}). PHP'ye tekrar gönderilmeyecek.")
+        phone_store.mark_uploaded(phone_url)
+        discard_review_files(phone_record.to_compact())
+        return True, "Değişiklik yok, siteye tekrar gönderilmedi."
+
+    if outbox is not None:
+        outbox.put(phone_record)
+        print(f"Veriler PHP gönderim kuyruğuna eklendi ({phone_url}).")
+        return True, "Gönderim kuyruğuna eklendi."
+
+    try:
+        php_success, php_message = save_data_to_php_selenium(build_php_payload(phone_record, specs_defs), php_url_param, idempotency_key=_php_idempotency_key(phone_url))
+    finally:
+        discard_review_files(phone_record.to_compact()) # Kuyruk yoksa başarısız gönderim zaten tekrar denenmez
     if php_success:
+        if cache: cache.mark_uploaded(phone_url, payload_hash)
+        phone_store.mark_uploaded(phone_url)
         print(f"Veriler başarıyla veritabanına aktarıldı ({phone_url}). Mesaj: {php_message}")
         return True, f"Siteye eklendi. {php_message}"
     else:
         print(f"VERİLER VERİTABANINA KAYDEDİLEMEDİ ({phone_url}). Mesaj: {php_message}")
         return False, f"Siteye eklenemedi. {php_message}"
 
+def process_new_phones(new_phones, workers=1, driver_pool=None, outbox=None):
+    """Telefonları sırayla ya da `workers` iş parçacığıyla işler; sonuçlar giriş sırasıyla döner.
+
+    Tarayıcı, Gemini ve PHP aşamaları kendi limitleriyle (havuz boyutu, GEMINI_SLOTS, PHP_SLOTS) sınırlanır.
+    """
+    def process(phone):
+        try:
+            return process_single_phone_with_selenium(
+                phone['link'],
+                phone['name'],
+                phone_specs_definitions,
+                GEMINI_API_KEY,
+                PHP_SAVE_URL,
+                driver_pool,
+                outbox
+            )
+        except Exception as e:
+            print(f"Hata: {phone['link']} işlenirken beklenmeyen hata. {e}")
+            get_phone_store().record_result(phone['link'], phone['name'], None, None, False, e)
+            return False, f"Beklenmeyen hata: {str(e)[:100]}"
+
+    if workers <= 1 or len(new_phones) <= 1:
+        return [process(phone) for phone in new_phones]
+    with ThreadPoolExecutor(max_workers=min(workers, len(new_phones))) as executor:
+        return list(executor.map(process, new_phones))
+
+# === Katalog Tarama Modu ===
+# makers.php3 -> marka listeleri (sayfalı) -> telefon spec sayfaları. İş kuyruğu (frontier) paylaşılır: bir üretici
+# liste sayfalarından telefon URL'lerini keşfeder, işçiler (ayrı süreç ya da ayrı makine) telefonları kiralayarak
+# (lease) işler. Kiralanan iş heartbeat ile yenilenir; işçi ölürse lease süresi dolar ve iş başka işçiye verilir
+# (deneme sayısı artar, CRAWL_MAX_ATTEMPTS'ta 'failed' olur). gsmarena.com nezaket aralığı da kuyruk üzerinden
+# tutulduğundan tüm işçiler için ortaktır. Yerel çalıştırmada kuyruk SQLite (WAL + BEGIN IMMEDIATE), çok makinede Redis.
+CRAWL_KIND_PRIORITY = {"makers": 0, "brand": 1, "phone": 2}
+CRAWL_LEASE_EXPIRED_MESSAGE = "Lease süresi doldu (işçi yanıt vermiyor)"
+
+class CrawlFrontier:
+    def __init__(self, db_path, max_attempts=CRAWL_MAX_ATTEMPTS):
+        self.max_attempts = max_attempts
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL") # Okuyucular yazanı beklemez; işçiler aynı dosyayı paylaşır
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS crawl_frontier (
+                url TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                name TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                discovered_at TEXT,
+                finished_at TEXT,
+                lease_owner TEXT,
+                lease_expires REAL
+            )""")
+            existing_columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(crawl_frontier)")}
+            for column, column_type in (("lease_owner", "TEXT"), ("lease_expires", "REAL")): # Eski durum dosyaları
+                if column not in existing_columns:
+                    self._conn.execute(f"ALTER TABLE crawl_frontier ADD COLUMN {column} {column_type}")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_crawl_frontier_status ON crawl_frontier (status, priority)")
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS crawl_politeness (
+                host TEXT PRIMARY KEY,
+                next_request_at REAL NOT NULL
+            )""")
+
+    @contextmanager
+    def _write_transaction(self):
+        """Yazma kilidini baştan alır; böylece iki süreç aynı işi kiralayamaz."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+
+    def add(self, url, kind, name=None):
+        with self._write_transaction():
+            cursor = self._conn.execute("INSERT OR IGNORE INTO crawl_frontier (url, kind, priority, name, discovered_at) VALUES (?, ?, ?, ?, ?)",
+                (url, kind, CRAWL_KIND_PRIORITY[kind], name, datetime.now().isoformat(timespec='seconds')))
+        return cursor.rowcount > 0
+
+    def lease(self, kinds, worker_id, limit=1, lease_seconds=CRAWL_LEASE_SECONDS):
+        """Süresi dolan lease'leri kuyruğa geri koyar, sonra en öncelikli `limit` işi `worker_id`'ye kiralar."""
+        now = time.time()
+        placeholders = ",".join("?" for _ in kinds)
+        with self._write_transaction():
+            self._conn.execute("""UPDATE crawl_frontier SET attempts = attempts + 1, last_error = ?, lease_owner = NULL, lease_expires = NULL,
+                status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END
+                WHERE status = 'in_progress' AND (lease_expires IS NULL OR lease_expires < ?)""", (CRAWL_LEASE_EXPIRED_MESSAGE, self.max_attempts, now))
+            rows = self._conn.execute(f"SELECT url, kind, name FROM crawl_frontier WHERE status = 'pending' AND kind IN ({placeholders}) ORDER BY priority, rowid LIMIT ?",
+                (*kinds, limit)).fetchall()
+            self._conn.executemany("UPDATE crawl_frontier SET status = 'in_progress', lease_owner = ?, lease_expires = ? WHERE url = ?",
+                [(worker_id, now + lease_seconds, row["url"]) for row in rows])
+        return [dict(row) for row in rows]
+
+    def heartbeat(self, worker_id, urls, lease_seconds=CRAWL_LEASE_SECONDS):
+        """Hâlâ bu işçide olan lease'leri uzatır; uzatılabilen iş sayısını döner."""
+        with self._write_transaction():
+            cursor = self._conn.executemany("UPDATE crawl_frontier SET lease_expires = ? WHERE url = ? AND lease_owner = ? AND status = 'in_progress'",
+                [(time.time() + lease_seconds, url, worker_id) for url in urls])
+        return cursor.rowcount
+
+    def release(self, worker_id):
+        """İşçi düzgün kapanırken elindeki işleri beklemeden kuyruğa geri verir (deneme sayılmaz)."""
+        with self._write_transaction():
+            cursor = self._conn.execute("UPDATE crawl_frontier SET status = 'pending', lease_owner = NULL, lease_expires = NULL WHERE lease_owner = ? AND status = 'in_progress'",
+                (worker_id,))
+        return cursor.rowcount
+
+    def mark_done(self, url):
+        with self._write_transaction():
+            self._conn.execute("UPDATE crawl_frontier SET status = 'done', finished_at = ?, lease_owner = NULL, lease_expires = NULL WHERE url = ?",
+                (datetime.now().isoformat(timespec='seconds'), url))
+
+    def mark_failed(self, url, error):
+        with self._write_transaction():
+            self._conn.execute("""UPDATE crawl_frontier SET attempts = attempts + 1, last_error = ?, lease_owner = NULL, lease_expires = NULL,
+                status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END WHERE url = ?""", (str(error)[:500], self.max_attempts, url))
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, status, COUNT(*) AS total FROM crawl_frontier GROUP BY kind, status").fetchall()
+        return {(row["kind"], row["status"]): row["total"] for row in rows}
+
+    def reserve_request_slot(self, host, min_interval):
+        """Host için bir sonraki istek zamanını ayırır; beklenmesi gereken süreyi (sn) döner."""
+        now = time.time()
+        with self._write_transaction():
+            row = self._conn.execute("SELECT next_request_at FROM crawl_politeness WHERE host = ?", (host,)).fetchone()
+            scheduled_at = max(now, row["next_request_at"] if row else 0)
+            self._conn.execute("INSERT OR REPLACE INTO crawl_politeness (host, next_request_at) VALUES (?, ?)", (host, scheduled_at + min_interval))
+        return scheduled_at - now
+
+    def defer_requests(self, host, seconds):
+        """Host 429 döndüğünde tüm işçilerin sıradaki isteğini en az `seconds` sonraya iter."""
+        with self._write_transaction():
+            self._conn.execute("""INSERT INTO crawl_politeness (host, next_request_at) VALUES (?, ?)
+                ON CONFLICT(host) DO UPDATE SET next_request_at = MAX(next_request_at, excluded.next_request_at)""", (host, time.time() + seconds))
+
+class RedisCrawlQueue:
+    """CrawlFrontier ile aynı arayüz, farklı makinelerdeki işçiler için. Her işlem tek bir Lua script'i olarak atomik
+    çalışır; zaman Redis'in TIME'ından alındığından makinelerin saat farkı lease ve nezaket hesabını bozmaz.
+    Anahtarlar: <önek>:jobs (url -> iş JSON'u), <önek>:pending:<tür> (sıralı küme), <önek>:leases (url -> bitiş),
+    <önek>:owners (url -> işçi), <önek>:politeness:<host>."""
+
+    _PRELUDE = """
+        redis.replicate_commands()
+        local p = ARGV[1]
+        local t = redis.call('TIME')
+        local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+        local function load(url) return cjson.decode(redis.call('HGET', p .. ':jobs', url)) end
+        local function save(url, job) redis.call('HSET', p .. ':jobs', url, cjson.encode(job)) end
+        local function requeue(url, job, error_message, max_attempts)
+            redis.call('ZREM', p .. ':leases', url)
+            redis.call('HDEL', p .. ':owners', url)
+            if error_message then
+                job.attempts = job.attempts + 1
+                job.last_error = error_message
+            end
+            if error_message and job.attempts >= max_attempts then
+                job.status = 'failed'
+            else
+                job.status = 'pending'
+                redis.call('ZADD', p .. ':pending:' .. job.kind, job.seq, url)
+            end
+            save(url, job)
+        end
+    """
+    _ADD = _PRELUDE + """
+        local url, kind, name = ARGV[2], ARGV[3], ARGV[4]
+        if redis.call('HEXISTS', p .. ':jobs', url) == 1 then return 0 end
+        local job = {kind = kind, status = 'pending', attempts = 0, seq = redis.call('INCR', p .. ':seq')}
+        if name ~= '' then job.name = name end
+        save(url, job)
+        redis.call('ZADD', p .. ':pending:' .. kind, job.seq, url)
+        return 1
+    """
+    _LEASE = _PRELUDE + """
+        local worker, limit, lease_seconds, max_attempts = ARGV[2], tonumber(ARGV[3]), tonumber(ARGV[4]), tonumber(ARGV[5])
+        for _, url in ipairs(redis.call('ZRANGEBYSCORE', p .. ':leases', '-inf', now)) do
+            requeue(url, load(url), ARGV[6], max_attempts)
+        end
+        local leased = {}
+        for i = 7, #ARGV do
+            if #leased >= limit then break end
+            for _, url in ipairs(redis.call('ZRANGE', p .. ':pending:' .. ARGV[i], 0, limit - #leased - 1)) do
+                redis.call('ZREM', p .. ':pending:' .. ARGV[i], url)
+                redis.call('ZADD', p .. ':leases', now + lease_seconds, url)
+                redis.call('HSET', p .. ':owners', url, worker)
+                local job = load(url)
+                job.status = 'in_progress'
+                save(url, job)
+                table.insert(leased, cjson.encode({url = url, kind = job.kind, name = job.name}))
+            end
+        end
+        return leased
+    """
+    _HEARTBEAT = _PRELUDE + """
+        local renewed = 0
+        for i = 4, #ARGV do
+            if redis.call('HGET', p .. ':owners', ARGV[i]) == ARGV[2] then
+                redis.call('ZADD', p .. ':leases', 'XX', now + tonumber(ARGV[3]), ARGV[i])
+                renewed = renewed + 1
+            end
+        end
+        return renewed
+    """
+    _RELEASE = _PRELUDE + """
+        local released = 0
+        local owners = redis.call('HGETALL', p .. ':owners')
+        for i = 1, #owners, 2 do
+            if owners[i + 1] == ARGV[2] then
+                requeue(owners[i], load(owners[i]), nil, 0)
+                released = released + 1
+            end
+        end
+        return released
+    """
+    _FINISH = _PRELUDE + """
+        local url, outcome = ARGV[2], ARGV[3]
+        local job = load(url)
+        if outcome == 'done' then
+            redis.call('ZREM', p .. ':leases', url)
+            redis.call('HDEL', p .. ':owners', url)
+            job.status = 'done'
+            job.finished_at = now
+            save(url, job)
+        else
+            requeue(url, job, ARGV[4], tonumber(ARGV[5]))
+        end
+        return 1
+    """
+    _RESERVE = _PRELUDE + """
+        local key = p .. ':politeness:' .. ARGV[2]
+        local scheduled_at = math.max(now, tonumber(redis.call('GET', key) or '0'))
+        if ARGV[4] == 'defer' then
+            redis.call('SET', key, string.format('%.6f', math.max(scheduled_at, now + tonumber(ARGV[3]))), 'EX', 86400)
+            return '0'
+        end
+        redis.call('SET', key, string.format('%.6f', scheduled_at + tonumber(ARGV[3])), 'EX', 86400)
+        return string.format('%.6f', scheduled_at - now)
+    """
+
+    def __init__(self, queue_url, prefix=CRAWL_QUEUE_PREFIX, max_attempts=CRAWL_MAX_ATTEMPTS):
+        import redis # Sadece Redis kuyruğu seçilince gerekir
+        self.max_attempts = max_attempts
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(queue_url, decode_responses=True)
+        self._scripts = {name: self._redis.register_script(getattr(self, f"_{name.upper()}"))
+                         for name in ("add", "lease", "heartbeat", "release", "finish", "reserve")}
+
+    def _run(self, name, *args):
+        return self._scripts[name](args=[self.prefix, *args])
+
+    def add(self, url, kind, name=None):
+        return self._run("add", url, kind, name or '') == 1
+
+    def lease(self, kinds, worker_id, limit=1, lease_seconds=CRAWL_LEASE_SECONDS):
+        kinds = sorted(kinds, key=CRAWL_KIND_PRIORITY.get)
+        leased = [json.loads(item) for item in self._run("lease", worker_id, limit, lease_seconds, self.max_attempts, CRAWL_LEASE_EXPIRED_MESSAGE, *kinds)]
+        return [{"url": item["url"], "kind": item["kind"], "name": item.get("name")} for item in leased] # cjson boş adı hiç yazmaz
+
+    def heartbeat(self, worker_id, urls, lease_seconds=CRAWL_LEASE_SECONDS):
+        return self._run("heartbeat", worker_id, lease_seconds, *urls) if urls else 0
+
+    def release(self, worker_id):
+        return self._run("release", worker_id)
+
+    def mark_done(self, url):
+        self._run("finish", url, "done")
+
+    def mark_failed(self, url, error):
+        self._run("finish", url, "failed", str(error)[:500], self.max_attempts)
+
+    def counts(self):
+        totals = {}
+        for _, job_json in self._redis.hscan_iter(f"{self.prefix}:jobs"):
+            job = json.loads(job_json)
+            totals[(job["kind"], job["status"])] = totals.get((job["kind"], job["status"]), 0) + 1
+        return totals
+
+    def reserve_request_slot(self, host, min_interval):
+        return float(self._run("reserve", host, min_interval, "reserve"))
+
+    def defer_requests(self, host, seconds):
+        self._run("reserve", host, seconds, "defer")
+
+def open_crawl_queue(queue_url=CRAWL_QUEUE_URL):
+    if queue_url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCrawlQueue(queue_url)
+    return CrawlFrontier(CRAWL_DB)
+
+class LeaseHeartbeat:
+    """Arka planda, işçinin elindeki işlerin lease'ini lease süresinin üçte birinde bir uzatır."""
+
+    def __init__(self, work_queue, worker_id, lease_seconds=CRAWL_LEASE_SECONDS):
+        self.work_queue = work_queue
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self._urls = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-heartbeat", daemon=True)
+        self._thread.start()
+
+    def track(self, urls):
+        with self._lock: self._urls.update(urls)
+
+    def untrack(self, url):
+        with self._lock: self._urls.discard(url)
+
+    def _run(self):
+        while not self._stop.wait(self.lease_seconds / 3):
+            with self._lock: urls = list(self._urls)
+            if not urls: continue
+            try:
+                renewed = self.work_queue.heartbeat(self.worker_id, urls, self.lease_seconds)
+                if renewed < len(urls):
+                    print(f"Uyarı (Tarama): {len(urls) - renewed} işin lease'i kaybedildi; başka bir işçi de işleyebilir.")
+            except Exception as e:
+                print(f"Uyarı (Tarama): Heartbeat gönderilemedi. {e}")
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+def parse_makers_page(html_content, page_url):
+    """makers.php3'ten (marka listesi URL'si, marka adı) çiftlerini döner."""
+    tree = lxml_html.fromstring(html_content)
+    brands = []
+    for link in tree.xpath("//a[@href]"):
+        href = urljoin(page_url, link.get('href'))
+        if re.search(r'-phones-\d+\.php$', href):
+            brand_name = (link.text or '').strip() or _static_inner_text(link).split('\n')[0]
+            brands.append((href, brand_name))
+    return brands
+
+def parse_brand_listing_page(html_content, page_url, brand_name=None):
+    """Marka listesi sayfasından ([(telefon URL'si, ad)], [diğer liste sayfaları]) döner."""
+    tree = lxml_html.fromstring(html_content)
+    phones = []
+    for link in tree.xpath("//div[contains(@class, 'makers')]//li/a[@href]"):
+        phone_name = _static_inner_text(link).replace('\n', ' ').strip()
+        if brand_name and phone_name and not phone_name.lower().startswith(brand_name.lower()):
+            phone_name = f"{brand_name} {phone_name}" # Liste sayfalarında marka adı yazmıyor
+        phones.append((urljoin(page_url, link.get('href')), phone_name))
+    listing_pages = [urljoin(page_url, href) for href in tree.xpath("//div[contains(@class, 'nav-pages')]//a/@href")
+                     if re.search(r'-phones-[\w-]+\.php$', href)]
+    return phones, listing_pages
+
+def _print_crawl_report(frontier, stats, started_at):
+    elapsed_minutes = max((time.monotonic() - started_at) / 60, 1e-9)
+    counts = frontier.counts()
+    pending_phones = counts.get(("phone", "pending"), 0)
+    done_phones = counts.get(("phone", "done"), 0)
+    print(f"[Tarama] {elapsed_minutes:.1f} dk | liste sayfası: {stats['listing_pages']} ({stats['listing_pages'] / elapsed_minutes:.1f}/dk) | "
+          f"telefon: {stats['phones_ok']} başarılı, {stats['phones_failed']} hatalı ({(stats['phones_ok'] + stats['phones_failed']) / elapsed_minutes:.2f}/dk) | "
+          f"toplam tamamlanan: {done_phones}, kuyrukta: {pending_phones}, işlenen: {counts.get(('phone', 'in_progress'), 0)}")
+
+def _crawl_work_remaining(counts, kinds):
+    """Verilen türlerde bekleyen ya da başka bir işçide süren iş var mı?"""
+    return any(counts.get((kind, status), 0) for kind in kinds for status in ("pending", "in_progress"))
+
+def _crawl_seeded(counts):
+    """Üretici kuyruğa başlangıç (makers) sayfasını ekleyip işledi mi? Eklenmeden önce boş kuyruk 'bitti' demek değildir."""
+    return any(counts.get(("makers", status), 0) for status in ("done", "failed"))
+
+def _process_listing_entry(frontier, entry):
+    listing_html = get_website_content_requests(entry["url"])
+    if not listing_html:
+        frontier.mark_failed(entry["url"], "Sayfa çekilemedi")
+        return False
+    try:
+        if entry["kind"] == "makers":
+            for brand_url, brand_name in parse_makers_page(listing_html, entry["url"]):
+                frontier.add(brand_url, "brand", brand_name)
+        else:
+            phones, listing_pages = parse_brand_listing_page(listing_html, entry["url"], entry["name"])
+            for phone_url, phone_name in phones: frontier.add(phone_url, "phone", phone_name)
+            for listing_url in listing_pages: frontier.add(listing_url, "brand", entry["name"])
+    except Exception as e:
+        frontier.mark_failed(entry["url"], e)
+        return False
+    frontier.mark_done(entry["url"])
+    return True
+
+def run_catalogue_crawl(max_phones=None, workers=1, role="all", worker_id=None):
+    """Tüm GSMArena kataloğunu tarar. Telefonlar `process_single_phone_with_selenium` ile işlenip PHP kuyruğuna yazılır.
+
+    `role`: "producer" sadece liste sayfalarını işleyip telefon URL'lerini kuyruğa ekler, "worker" sadece telefonları
+    işler, "all" (tek makine) ikisini birden yapar. Aynı kuyruğu paylaşan istenen sayıda süreç çalıştırılabilir.
+    """
+    if lxml_html is None:
+        print("Hata: Tarama modu için lxml ve cssselect gerekli.")
+        return False
+    frontier = open_crawl_queue()
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    listing_kinds = ("makers", "brand") if role in ("all", "producer") else ()
+    phone_kinds = ("phone",) if role in ("all", "worker") else ()
+    if listing_kinds: frontier.add(CRAWL_START_URL, "makers")
+    HTTP_CLIENT.set_host_settings(urlparse(TARGET_URL).netloc, min_interval=CRAWL_DELAY, shared_limiter=frontier)
+    # Aynı makinedeki işçiler aynı kuyruk dosyasını sıkıştırmasın diye her işçinin kendi PHP kuyruğu var
+    outbox = PhpOutbox(OUTBOX_FILE_NAME if role == "all" else worker_outbox_path(worker_id))
+    adopt_orphaned_outboxes(outbox)
+    flush_php_outbox(outbox, PHP_SAVE_URL) # Önceki çalıştırmadan (aynı --worker-id) ya da ölmüş işçilerden kalanlar
+    heartbeat = LeaseHeartbeat(frontier, worker_id)
+    stats = {"listing_pages": 0, "phones_ok": 0, "phones_failed": 0}
+    started_at = last_report_at = time.monotonic()
+    phones_since_flush = 0
+    waiting_for_producer = False
+    print(f"Tarama işçisi: {worker_id} (rol: {role}, kuyruk: {type(frontier).__name__})")
+
+    try:
+        with WebDriverPool(min(max(1, workers), DRIVER_POOL_SIZE)) as driver_pool:
+            while True:
+                processed_phones = stats["phones_ok"] + stats["phones_failed"]
+                if max_phones and processed_phones >= max_phones:
+                    print(f"Tarama limiti ({max_phones} telefon) doldu, durduruluyor.")
+                    break
+
+                listing_batch = frontier.lease(listing_kinds, worker_id) if listing_kinds else []
+                if listing_batch:
+                    entry = listing_batch[0]
+                    heartbeat.track([entry["url"]])
+                    if _process_listing_entry(frontier, entry): stats["listing_pages"] += 1
+                    heartbeat.untrack(entry["url"])
+                else:
+                    batch_size = max(1, workers)
+                    if max_phones: batch_size = min(batch_size, max_phones - processed_phones)
+                    phone_batch = frontier.lease(phone_kinds, worker_id, batch_size) if phone_kinds else []
+                    if not phone_batch:
+                        # Başka işçilerde süren iş (ya da yeni telefon keşfedebilecek liste sayfası) varsa beklenir;
+                        # o işçi ölürse lease'i dolan iş buraya gelir.
+                        # Sadece işçi rolündeki süreç, üretici başlangıç sayfasını işleyene kadar boş kuyrukta bekler.
+                        waited_kinds = ("makers", "brand", "phone") if phone_kinds else listing_kinds
+                        counts = frontier.counts()
+                        if (listing_kinds or _crawl_seeded(counts)) and not _crawl_work_remaining(counts, waited_kinds):
+                            print("Frontier boş, tarama tamamlandı." if phone_kinds else "Tüm liste sayfaları işlendi, üretici tamamlandı.")
+                            break
+                        if not listing_kinds and not _crawl_seeded(counts) and not waiting_for_producer:
+                            print("Üretici bekleniyor (kuyruk henüz doldurulmadı)...")
+                            waiting_for_producer = True
+                        time.sleep(CRAWL_POLL_INTERVAL)
+                        continue
+                    heartbeat.track(entry["url"] for entry in phone_batch)
+                    phones = [{"link": entry["url"], "name": entry["name"] or entry["url"]} for entry in phone_batch]
+                    for phone, (phone_success, phone_message) in zip(phones, process_new_phones(phones, workers, driver_pool, outbox)):
+                        if phone_success:
+                            frontier.mark_done(phone["link"])
+                            stats["phones_ok"] += 1
+                        else:
+                            frontier.mark_failed(phone["link"], phone_message)
+                            stats["phones_failed"] += 1
+                        heartbeat.untrack(phone["link"])
+                    phones_since_flush += len(phones)
+                    if phones_since_flush >= CRAWL_FLUSH_EVERY:
+                        flush_php_outbox(outbox, PHP_SAVE_URL)
+                        phones_since_flush = 0
+
+                if time.monotonic() - last_report_at >= CRAWL_REPORT_INTERVAL:
+                    _print_crawl_report(frontier, stats, started_at)
+                    PROFILER.write_outputs()
+                    last_report_at = time.monotonic()
+    except KeyboardInterrupt:
+        print("\nTarama kullanıcı tarafından durduruldu; sonraki çalıştırmada kaldığı yerden devam edecek.")
+    finally:
+        heartbeat.stop()
+        released = frontier.release(worker_id)
+        if released: print(f"{released} yarım kalan iş kuyruğa geri verildi.")
+        flush_php_outbox(outbox, PHP_SAVE_URL)
+        _print_crawl_report(frontier, stats, started_at)
+    return True
+
+# === Spec Yeniden Kontrol Modu (--recheck) ===
+# GSMArena fiyat, tbench ve durum gibi alanları telefon eklendikten sonra doldurur. Son RECHECK_DAYS günde görülen
+# telefonların sayfası koşullu GET ile yeniden alınır (değişmediyse 304, hiç çıkarım yapılmaz), spec'ler statik
+# olarak yeniden çıkarılır ve kayıtlı değerlerle spec anahtarı bazında karşılaştırılır. Review ve Gemini adımları tekrarlanmaz.
+# Değişiklikler veritabanına ve e-postaya kısa bir liste olarak gider. PHP_PARTIAL_SAVE_URL tanımlıysa sadece değişen
+# alanlar oraya {"partial": true} kısmi güncelleme olarak da gönderilir (kaydet.php kısmi kayıt bilmez, ona gönderilmez).
+def diff_spec_values(old_specs, new_specs, specs_definitions):
+    """Tanım sırasıyla (spec anahtarı, eski, yeni) listesi döner; None = alan sayfada yok."""
+    changes = []
+    for spec_def in specs_definitions:
+        key = spec_key(spec_def)
+        old_value, new_value = old_specs.get(key), new_specs.get(key)
+        if new_value != old_value:
+            changes.append((key, old_value, new_value))
+    return changes
+
+def _spec_change_lines(changes):
+    """Değişiklik listesini 'Etiket: eski -> yeni' satırlarına çevirir (çok satırlı değerler tek satıra indirilir)."""
+    def one_line(key, value):
+        value = spec_display_value(key, value)
+        return value.replace("\n", " / ") if isinstance(value, str) else value
+    return [f"{spec_label(key)}: {one_line(key, old_value)} -> {one_line(key, new_value)}" for key, old_value, new_value in changes]
+
+def run_spec_recheck(days=RECHECK_DAYS, workers=1):
+    """Bilinen telefonların spec'lerini yeniden kontrol eder; değişenleri kaydeder, PHP'ye ve e-postaya bildirir."""
+    if lxml_html is None:
+        print("Hata: Yeniden kontrol modu statik çıkarım kullanır; lxml ve cssselect gerekli.")
+        return False
+    phone_store = get_phone_store()
+    phones = phone_store.phones_seen_since(days)
+    print(f"Son {days} günde görülen {len(phones)} telefon yeniden kontrol ediliyor.")
+    if not phones:
+        return True
+
+    def recheck(phone):
+        try:
+            with profile_stage("recheck_phone") as stage:
+                new_specs, _ = fetch_phone_data_static(phone["link"], phone_specs_definitions)
+                if new_specs is None: stage.outcome = "unavailable"
+            return new_specs
+        except Exception as e:
+            print(f"Hata: {phone['link']} yeniden kontrol edilemedi. {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        rechecked_specs = list(executor.map(recheck, phones))
+
+    outbox = PhpOutbox(OUTBOX_FILE_NAME)
+    changed_phones, unavailable = [], 0
+    for phone, new_specs in zip(phones, rechecked_specs):
+        if new_specs is None:
+            unavailable += 1
+            continue
+        changes = diff_spec_values(phone["specs"], new_specs, phone_specs_definitions)
+        if not changes:
+            continue
+        phone_store.record_spec_changes(phone["link"], changes, new_specs)
+        if PHP_PARTIAL_SAVE_URL:
+            partial_record = PhoneRecord(phone["link"], phone["name"], {key: new_value for key, _, new_value in changes}, partial=True)
+            outbox.put(partial_record, key=_php_idempotency_key(f"{phone['link']}#partial:{_hash_json(partial_record.to_compact())}"))
+        changed_phones.append((phone, changes))
+
+    changed_fields = sum(len(changes) for _, changes in changed_phones)
+    print(f"Yeniden kontrol bitti: {len(changed_phones)} telefonda {changed_fields} alan değişti, {unavailable} telefon kontrol edilemedi.")
+    if not changed_phones:
+        return True
+
+    upload_results = flush_php_outbox(outbox, PHP_SAVE_URL) if PHP_PARTIAL_SAVE_URL else {}
+    digest = NotificationDigest()
+    for phone, changes in changed_phones:
+        change_lines = _spec_change_lines(changes)
+        print(f"- {phone['name']} ({phone['link']})\n  " + "\n  ".join(change_lines))
+        digest.add("spec_change", phone['name'], phone['link'], change_lines)
+    failed_uploads = [url for url, (php_success, _) in upload_results.items() if not php_success]
+    if failed_uploads:
+        digest.add("info", f"Siteye gönderilemeyen {len(failed_uploads)} güncelleme kuyrukta bekliyor.", ok=False)
+    digest.flush(force=True)
+    if upload_results and GIT_COMMIT_STATE:
+        commit_and_push_data_file([OUTBOX_FILE_NAME, REVIEW_SPOOL_DIR], f"GSMArena: Spec güncellemeleri gönderildi ({datetime.now().strftime('%Y-%m-%d')})")
+    return True
+
+# === Monitör Turu ===
+def handle_homepage_change(latest_phones_from_site, workers, php_outbox, digest=None):
+    """Ana sayfadaki liste değiştiğinde yeni telefonları işler, olayları özete ekler ve listeyi kaydeder.
+
+    `digest` verilmezse tek seferlik bir özet oluşturulup sonunda hemen gönderilir.
+    """
+    send_now = digest is None
+    if digest is None: digest = NotificationDigest()
+    print("\nDeğişiklik tespit edildi!")
+    
+    # Yeni = veritabanında hiç görülmemiş (listeden düşüp geri gelen telefon tekrar işlenmez)
+    unknown_links = get_phone_store().unknown_links(p['link'] for p in latest_phones_from_site)
+    newly_added_phones = [p for p in latest_phones_from_site if p['link'] in unknown_links]
+    
+    if newly_added_phones:
+        # Tarayıcılar bu çalıştırma boyunca paylaşılır; en fazla işçi sayısı kadar açılır
+        with WebDriverPool(min(max(1, workers), DRIVER_POOL_SIZE)) as driver_pool:
+            phone_results = process_new_phones(newly_added_phones, workers, driver_pool, php_outbox)
+        upload_results = flush_php_outbox(php_outbox, PHP_SAVE_URL) # Önceki çalıştırmalardan kalanlar da gönderilir
+        for new_phone, (success_selenium, message_selenium) in zip(newly_added_phones, phone_results):
+            if new_phone['link'] in upload_results:
+                success_selenium, php_message = upload_results[new_phone['link']]
+                message_selenium = f"Siteye eklendi. {php_message}" if success_selenium else f"Siteye eklenemedi, kayıt kuyrukta bekliyor. {php_message}"
+            digest.add("new_phone", new_phone['name'], new_phone['link'], [f"İşlem Durumu: {message_selenium}"], ok=success_selenium)
+    else: # Yeni eklenen yok ama liste farklı (örneğin biri çıktı, sıralama değişti)
+        digest.add("info", "Listede değişiklik var ancak yeni eklenen telefon tespit edilmedi (örn. eski bir telefon listeden çıkmış veya sıralama değişmiş olabilir).")
+        upload_results = flush_php_outbox(php_outbox, PHP_SAVE_URL)
+
+    new_links = {p['link'] for p in newly_added_phones}
+    _add_upload_events(digest, {url: result for url, result in upload_results.items() if url not in new_links})
+    digest.add("list_update", "Ana sayfa listesi", details=[f"{i+1}. {phone['name']} ({phone['link']})" for i, phone in enumerate(latest_phones_from_site)])
+
+    if send_now: digest.flush(force=True)
+    
+    persist_homepage_state(latest_phones_from_site) # Her zaman en son çekilen listeyi kaydet
+
+def _add_upload_events(digest, upload_results):
+    for url, (php_success, php_message) in upload_results.items():
+        digest.add("upload", url, details=[f"İşlem Durumu: {php_message}"], ok=php_success)
+
+def retry_failed_phones(workers, php_outbox, digest=None):
+    """Önceki çalıştırmalarda işlenemeyen telefonları (PHONE_MAX_ATTEMPTS dolmadıysa) yeniden işler."""
+    failed_phones = get_phone_store().failed_phones()
+    if not failed_phones:
+        return []
+    print(f"\n{len(failed_phones)} başarısız telefon yeniden deneniyor...")
+    with WebDriverPool(min(max(1, workers), DRIVER_POOL_SIZE)) as driver_pool:
+        phone_results = process_new_phones(failed_phones, workers, driver_pool, php_outbox)
+    if digest is not None:
+        for phone, (phone_success, phone_message) in zip(failed_phones, phone_results):
+            digest.add("retry", phone['name'], phone['link'], [f"İşlem Durumu: {phone_message}"], ok=phone_success)
+    return list(zip(failed_phones, phone_results))
+
+def retry_pending_uploads(php_outbox, digest=None):
+    """Liste değişmediğinde önceki çalıştırmalardan (ve ölmüş tarama işçilerinden) kalan PHP gönderimlerini yeniden dener."""
+    adopt_orphaned_outboxes(php_outbox)
+    upload_results = flush_php_outbox(php_outbox, PHP_SAVE_URL) # Bekleyen gönderimler varsa yeniden dene
+    if upload_results and GIT_COMMIT_STATE:
+        commit_and_push_data_file([OUTBOX_FILE_NAME, REVIEW_SPOOL_DIR], f"GSMArena: PHP gönderim kuyruğu güncellendi ({datetime.now().strftime('%Y-%m-%d')})")
+    if digest is not None:
+        _add_upload_events(digest, upload_results)
+    return upload_results
+
+# === Daemon Modu ===
+# Süreç açık kalır: son bilinen liste bellekte tutulur, ana sayfa koşullu GET ile sorgulanır (304 / aynı içerik
+# ise parse bile edilmez). Tarayıcılar yalnızca link kümesi değiştiğinde açılır ve iş bitince kapatılır.
+def _parse_hour_range(spec):
+    """'1-7' gibi bir aralığı saat kümesine çevirir; '22-5' gece yarısını aşabilir."""
+    hours = set()
+    for part in (spec or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if '-' in part:
+                start_hour, end_hour = (int(x) % 24 for x in part.split('-', 1))
+                hour = start_hour
+                while hour != end_hour:
+                    hours.add(hour)
+                    hour = (hour + 1) % 24
+            else:
+                hours.add(int(part) % 24)
+        except ValueError:
+            print(f"Uyarı: Geçersiz saat aralığı '{part}' yok sayıldı.")
+    return hours
+
+class AdaptivePollScheduler:
+    """Sorgu aralığını yeni telefon sıklığına göre ayarlar.
+
+    Değişiklik görülünce aralık en kısaya iner, görülmedikçe DAEMON_BACKOFF_FACTOR ile uzar.
+    Hangi saatlerde değişiklik görüldüğü (yavaşça unutularak) tutulur: hareketli saatlerde aralık
+    yarıya iner, sessiz saatlerde geçmişte hareket yoksa en uzun aralık kullanılır.
+    """
+
+    def __init__(self, min_interval=DAEMON_MIN_INTERVAL, max_interval=DAEMON_MAX_INTERVAL,
+                 backoff_factor=DAEMON_BACKOFF_FACTOR, quiet_hours=DAEMON_QUIET_HOURS, decay=0.95):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff_factor = backoff_factor
+        self.quiet_hours = _parse_hour_range(quiet_hours)
+        self.decay = decay
+        self.interval = min_interval
+        self.hourly_activity = [0.0] * 24
+
+    def record(self, changed, now=None):
+        if changed:
+            hour = (now or datetime.now()).hour
+            self.hourly_activity = [value * self.decay for value in self.hourly_activity]
+            self.hourly_activity[hour] += 1.0
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+
+    def next_delay(self, now=None):
+        hour = (now or datetime.now()).hour
+        delay = self.interval
+        activity = self.hourly_activity[hour]
+        mean_activity = sum(self.hourly_activity) / 24
+        if activity > mean_activity > 0: # Lansmanların yoğunlaştığı saat
+            delay = max(self.min_interval, delay / 2)
+        elif hour in self.quiet_hours and activity == 0:
+            delay = self.max_interval
+        return delay * random.uniform(0.9, 1.1) # Sabit periyotla istek atmamak için
+
+def run_daemon(workers=1, max_cycles=None):
+    """Ana sayfayı uyarlanabilir aralıklarla sorgular. SIGTERM/SIGINT ile düzgün kapanır."""
+    stop_event = threading.Event()
+    def request_stop(signum, frame):
+        print(f"\nSinyal alındı ({signum}), daemon mevcut tur bitince duracak.")
+        stop_event.set()
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    scheduler = AdaptivePollScheduler()
+    digest = NotificationDigest() # Olaylar turlar boyunca birikir, DIGEST_WINDOW_SECONDS / DIGEST_MAX_EVENTS ile gönderilir
+    php_outbox = PhpOutbox(OUTBOX_FILE_NAME)
+    last_known_links = {p['link'] for p in get_phone_store().homepage_phones()}
+    last_outbox_retry = 0.0
+    homepage_failing = False
+    cycle = 0
+    while not stop_event.is_set() and (max_cycles is None or cycle < max_cycles):
+        cycle += 1
+        changed = False
+        with profile_stage("homepage_fetch") as stage:
+            html, page_changed = fetch_page_cached(TARGET_URL, stale_on_error=False) # Kesinti "değişiklik yok" sayılmasın
+            if not html: stage.outcome = "error"
+            elif not page_changed: stage.outcome = "not_modified"
+        if not html:
+            if not homepage_failing: # Her turda değil, yalnızca hataya ilk düşüşte bildir
+                send_email_notification(EMAIL_SUBJECT_PREFIX + "Kritik Hata!", "GSMArena ana sayfa içeriği çekilemedi. Daemon sorgulamaya devam ediyor.")
+            homepage_failing = True
+        elif page_changed or cycle == 1: # İlk turda dosyadaki liste ile mutlaka karşılaştır
+            homepage_failing = False
+            with profile_stage("homepage_parse"):
+                latest_phones_from_site = parse_latest_phones_from_main_page(html, LIMIT_PHONES)
+            current_links_on_site = {p['link'] for p in latest_phones_from_site}
+            if latest_phones_from_site and current_links_on_site != last_known_links:
+                handle_homepage_change(latest_phones_from_site, workers, php_outbox, digest)
+                last_known_links = current_links_on_site
+                last_outbox_retry = time.monotonic()
+                changed = True
+        else:
+            homepage_failing = False
+        if not changed and time.monotonic() - last_outbox_retry >= DAEMON_OUTBOX_RETRY_INTERVAL:
+            retry_failed_phones(workers, php_outbox, digest)
+            retry_pending_uploads(php_outbox, digest)
+            last_outbox_retry = time.monotonic()
+        digest.flush()
+        PROFILER.write_outputs() # Profil yalnızca çıkışta değil, her turda güncel olsun
+
+        scheduler.record(changed)
+        delay = scheduler.next_delay()
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] Tur {cycle}: {'değişiklik işlendi' if changed else 'değişiklik yok' if html else 'ana sayfa alınamadı'}, sonraki kontrol {delay:.0f} sn sonra.")
+        if max_cycles is None or cycle < max_cycles:
+            # Özet, sorgu aralığı uzun olsa da DIGEST_WINDOW_SECONDS dolunca gönderilsin diye bekleme parçalanır
+            wake_at = time.monotonic() + delay
+            while not stop_event.is_set():
+                remaining = wake_at - time.monotonic()
+                if remaining <= 0: break
+                digest_due_in = digest.seconds_until_due()
+                stop_event.wait(remaining if digest_due_in is None else min(remaining, digest_due_in))
+                digest.flush()
+    digest.flush(force=True) # Kapanırken bekleyen olaylar kaybolmasın
+    print("Daemon durduruldu.")
+
 # === Ana İş Akışı ===
 if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="GSMArena yeni telefon monitörü ve scraper")
+    arg_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Aynı anda işlenecek telefon sayısı (varsayılan: WORKERS_ENV veya 1)")
+    arg_parser.add_argument('--crawl', action='store_true', help="Ana sayfa kontrolü yerine tüm kataloğu tara (kaldığı yerden devam eder)")
+    arg_parser.add_argument('--crawl-limit', type=int, default=None, help="Bu çalıştırmada taranacak en fazla telefon sayısı")
+    arg_parser.add_argument('--crawl-role', choices=["all", "producer", "worker"], default="all", help="producer: URL keşfi, worker: telefon işleme, all: ikisi (varsayılan)")
+    arg_parser.add_argument('--worker-id', default=None, help="Kuyruktaki işçi kimliği (varsayılan: makine adı-pid)")
+    arg_parser.add_argument('--recheck', action='store_true', help="Son --recheck-days günde görülen telefonların spec'lerini yeniden kontrol et, sadece değişenleri gönder")
+    arg_parser.add_argument('--recheck-days', type=int, default=RECHECK_DAYS, help="Yeniden kontrol penceresi (gün, varsayılan: RECHECK_DAYS_ENV veya 30)")
+    arg_parser.add_argument('--daemon', action='store_true', help="Sürekli çalış; ana sayfayı uyarlanabilir aralıklarla koşullu GET ile sorgula")
+    arg_parser.add_argument('--daemon-cycles', type=int, default=None, help="Daemon bu kadar turdan sonra durur (test için)")
+    cli_args = arg_parser.parse_args()
+    PROFILER.record("startup", time.perf_counter() - _IMPORT_STARTED) # import + konfigürasyon süresi
+    atexit.register(PROFILER.finish) # exit() ile erken çıkışlarda da profil yazılır
+
+    if cli_args.crawl:
+        print(f"GSMArena katalog taraması başlatıldı ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')}). Kuyruk: {CRAWL_QUEUE_URL or CRAWL_DB}")
+        exit(0 if run_catalogue_crawl(cli_args.crawl_limit, cli_args.workers, cli_args.crawl_role, cli_args.worker_id) else 1)
+
+    if cli_args.recheck:
+        print(f"GSMArena spec yeniden kontrolü başlatıldı ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')}).")
+        exit(0 if run_spec_recheck(cli_args.recheck_days, cli_args.workers) else 1)
+
+    if cli_args.daemon:
+        print(f"GSMArena monitör daemon modunda başlatıldı ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')}). Aralık: {DAEMON_MIN_INTERVAL:.0f}-{DAEMON_MAX_INTERVAL:.0f} sn")
+        run_daemon(cli_args.workers, cli_args.daemon_cycles)
+        exit(0)
+
     print(f"GSMArena monitör ve scrape script'i başlatıldı ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')}).")
     print(f"Veri kaydetme hedefi: {PHP_SAVE_URL}")
     if not GEMINI_API_KEY:
         print("UYARI: GEMINI_API_KEY_ENV secret'ı ayarlanmamış. İncelemeler ham kalacak.")
 
-    data_file_full_path = DATA_FILE_NAME
+    php_outbox = PhpOutbox(OUTBOX_FILE_NAME)
 
-    html = get_website_content_requests(TARGET_URL)
+    with profile_stage("homepage_fetch"):
+        html = get_website_content_requests(TARGET_URL)
     if not html:
         email_body_error = "GSMArena ana sayfa içeriği çekilemedi. İşlem sonlandırıldı."
         send_email_notification(EMAIL_SUBJECT_PREFIX + "Kritik Hata!", email_body_error)
         print(email_body_error)
         exit(1)
 
-    latest_phones_from_site = parse_latest_phones_from_main_page(html, LIMIT_PHONES)
+    with profile_stage("homepage_parse"):
+        latest_phones_from_site = parse_latest_phones_from_main_page(html, LIMIT_PHONES)
     if not latest_phones_from_site:
         email_body_error = "GSMArena ana sayfasından telefonlar parse edilemedi. İşlem sonlandırıldı."
         send_email_notification(EMAIL_SUBJECT_PREFIX + "Parse Hatası!", email_body_error)
@@ -534,63 +3689,20 @@ if __name__ == "__main__":
     print("\nSiteden Alınan Son Telefonlar:")
     for p in latest_phones_from_site: print(f"- {p['name']} ({p['link']})")
 
-    last_known_phones = load_data_from_file(data_file_full_path)
+    last_known_phones = get_phone_store().homepage_phones()
     
     # Karşılaştırma için sadece linkleri kullanmak daha stabil olabilir
     current_links_on_site = {p['link'] for p in latest_phones_from_site}
     last_known_links = {p['link'] for p in last_known_phones}
 
     if current_links_on_site != last_known_links:
-        print("\nDeğişiklik tespit edildi!")
-        
-        newly_added_phones = [p for p in latest_phones_from_site if p['link'] not in last_known_links]
-        
-        email_subject = ""
-        email_body = f"GSMArena'da değişiklikler tespit edildi ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')}):\n"
-        
-        if newly_added_phones:
-            email_subject = EMAIL_SUBJECT_PREFIX + f"{len(newly_added_phones)} Yeni Telefon Tespit Edildi!"
-            email_body += "\nYeni Eklenen Telefon(lar):\n"
-            
-            processed_phone_results = []
-            for new_phone in newly_added_phones:
-                phone_url_to_process = new_phone['link']
-                phone_name_to_process = new_phone['name']
-                
-                # Selenium ile bu yeni telefonu işle
-                # `phone_specs_definitions` bu scope'ta tanımlı olmalı
-                success_selenium, message_selenium = process_single_phone_with_selenium(
-                    phone_url_to_process,
-                    phone_name_to_process,
-                    phone_specs_definitions, # Yukarıda tanımlı global değişken
-                    GEMINI_API_KEY,
-                    PHP_SAVE_URL
-                )
-                status_message = f"Başarılı: {success_selenium} - Mesaj: {message_selenium}"
-                email_body += f"- {phone_name_to_process} ({phone_url_to_process})\n  İşlem Durumu: {status_message}\n"
-                processed_phone_results.append({"name": phone_name_to_process, "status": status_message})
-            
-            # Eğer sadece sıralama değiştiyse ama yeni telefon yoksa
-            if not processed_phone_results:
-                 email_body += "\nSadece sıralama değişmiş olabilir, yeni telefon tespit edilmedi.\n"
-                 email_subject = EMAIL_SUBJECT_PREFIX + "Telefon Listesi Güncellendi (Sıralama Değişikliği)"
-
-
-        else: # Yeni eklenen yok ama liste farklı (örneğin biri çıktı, sıralama değişti)
-            email_subject = EMAIL_SUBJECT_PREFIX + "Telefon Listesi Güncellendi (Yeni Yok)"
-            email_body += "\nListede değişiklik var ancak yeni eklenen telefon tespit edilmedi (örn. eski bir telefon listeden çıkmış veya sıralama değişmiş olabilir).\n"
-
-        email_body += "\nSitedeki Mevcut İlk Telefonlar:\n"
-        for i, phone in enumerate(latest_phones_from_site):
-            email_body += f"{i+1}. {phone['name']} ({phone['link']})\n"
-
-        send_email_notification(email_subject if email_subject else EMAIL_SUBJECT_PREFIX + "Telefon Listesi Güncellendi", email_body)
-        
-        save_data_to_file(data_file_full_path, latest_phones_from_site) # Her zaman en son çekilen listeyi kaydet
-        commit_message = f"GSMArena: Telefon listesi güncellendi ({datetime.now().strftime('%Y-%m-%d')})"
-        commit_and_push_data_file(data_file_full_path, commit_message)
+        handle_homepage_change(latest_phones_from_site, cli_args.workers, php_outbox)
     else:
         print("\nTelefon listesi aynı, değişiklik yok.")
+        retry_digest = NotificationDigest()
+        retry_failed_phones(cli_args.workers, php_outbox, retry_digest)
+        retry_pending_uploads(php_outbox, retry_digest)
+        retry_digest.flush(force=True) # Sadece yeniden denenen telefon varsa e-posta gider
         # Değişiklik olmadığında e-posta göndermemek için bu kısmı yorum satırı yapabilirsiniz.
         # send_email_notification(EMAIL_SUBJECT_PREFIX + "Kontrol Tamamlandı (Değişiklik Yok)", "GSMArena telefon listesi kontrol edildi, değişiklik bulunmadı.")
 